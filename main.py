@@ -1,8 +1,12 @@
 # main.py
 # Executa a interface gráfica
+# Uso: python main.py [número da distribuição]
+
+import sys
 
 from src.gui.interface_pygame import InterfacePygame
 
 if __name__ == "__main__":
-    app = InterfacePygame()
+    numero = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    app = InterfacePygame(numero)
     app.rodar()
\ No newline at end of file
@@ -0,0 +1,105 @@
+# src/game/avaliacao.py
+# Avaliação de posições e ordenação das jogadas por lances à frente
+# Usada pelo serviço de dicas da interface (numa thread) e pela política
+# "dica" do simulador (só com 1 lance, sem pygame)
+#
+# Uso:
+#   dicas = calcular_dicas(estado, tempo_limite=0.5)   # [(Movimento, nota), ...]
+#   nota = avaliar(estado)
+
+import time
+from typing import Callable, List, Optional, Tuple
+
+from src.game.estado_compacto import EstadoCompacto
+from src.game.movimento import Movimento
+
+TEMPO_LIMITE_PADRAO = 0.5       # segundos de busca por pedido
+PROFUNDIDADE_MAXIMA_PADRAO = 4  # lances olhados à frente (aprofundamento iterativo)
+
+# Pesos da avaliação de uma posição
+_PESO_FUNDACAO = 10     # cada carta na fundação
+_PESO_OCULTA = 6        # cada carta ainda virada para baixo (desconta)
+_PESO_COLUNA_VAZIA = 2  # cada coluna vazia
+NOTA_VITORIA = 10_000   # nota de uma posição vencida
+
+
+class DicasCanceladas(Exception):
+    """O pedido foi cancelado (o jogador mexeu) no meio do cálculo."""
+
+
+class _TempoEsgotado(Exception):
+    """Interrompe uma profundidade que não coube no tempo limite."""
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: avaliar
+# Nota de uma posição: mais cartas na fundação e menos cartas escondidas
+# ------------------------------------------------------------------
+def avaliar(estado: EstadoCompacto) -> int:
+    if estado.verificar_vitoria():
+        return NOTA_VITORIA
+    nota = estado.cartas_na_fundacao() * _PESO_FUNDACAO
+    for col in range(7):
+        nota -= estado.ocultas(col) * _PESO_OCULTA
+        if estado.tamanho(col) == 0:
+            nota += _PESO_COLUNA_VAZIA
+    return nota
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: calcular_dicas
+# Ordena os movimentos da posição pela melhor nota alcançável em até
+# 'profundidade' lances (o próprio movimento + respostas)
+# O aprofundamento começa em 1 lance e sobe enquanto houver tempo; vale o
+# resultado da última profundidade completa
+# cancelado: função chamada a cada nó; se retornar True, lança DicasCanceladas
+# Retorna [(Movimento, nota), ...] da melhor para a pior
+# ------------------------------------------------------------------
+def calcular_dicas(estado: EstadoCompacto, tempo_limite: float = TEMPO_LIMITE_PADRAO,
+                   profundidade_maxima: int = PROFUNDIDADE_MAXIMA_PADRAO,
+                   cancelado: Optional[Callable[[], bool]] = None) -> List[Tuple[Movimento, int]]:
+    prazo = time.perf_counter() + tempo_limite
+    movimentos = [Movimento(*mov) for mov in estado.movimentos()]
+    filhos = []
+    for mov in movimentos:
+        filho = estado.clone()
+        filho.aplicar(mov)
+        filhos.append(filho)
+
+    # 1 lance: sempre completa (só avalia os filhos)
+    notas = [avaliar(filho) for filho in filhos]
+    for profundidade in range(2, profundidade_maxima + 1):
+        try:
+            notas = [_melhor_nota(filho, profundidade - 1, prazo, cancelado, set())
+                     for filho in filhos]
+        except _TempoEsgotado:
+            break
+
+    ordem = sorted(range(len(movimentos)), key=lambda i: -notas[i])  # sort estável
+    return [(movimentos[i], notas[i]) for i in ordem]
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO PRIVADA: _melhor_nota
+# Maior nota entre a posição e tudo o que se alcança em 'lances' movimentos
+# 'vistos' evita reavaliar a mesma posição dentro do ramo
+# ------------------------------------------------------------------
+def _melhor_nota(estado: EstadoCompacto, lances: int, prazo: float,
+                 cancelado: Optional[Callable[[], bool]], vistos: set) -> int:
+    if cancelado is not None and cancelado():
+        raise DicasCanceladas()
+    if time.perf_counter() > prazo:
+        raise _TempoEsgotado()
+
+    melhor = avaliar(estado)
+    if lances == 0 or melhor == NOTA_VITORIA:
+        return melhor
+    for mov in estado.movimentos():
+        filho = estado.clone()
+        filho.aplicar(mov)
+        chave = filho.chave()
+        if chave in vistos:
+            continue
+        vistos.add(chave)
+        melhor = max(melhor, _melhor_nota(filho, lances - 1, prazo, cancelado, vistos))
+    return melhor
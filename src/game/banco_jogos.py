@@ -0,0 +1,262 @@
+# src/game/banco_jogos.py
+# Banco de distribuições pré-geradas em um arquivo binário de registros fixos
+# Serve para torneios e testes de regressão: escolher jogos pelo número sem
+# embaralhar nem resolver de novo a cada execução
+#
+# Formato do arquivo:
+#   cabeçalho (24 bytes): "YKDB", versão, tamanho do registro, primeiro número, quantidade
+#   registros (64 bytes cada), na ordem dos números:
+#     52 bytes  ordem das cartas (ids) - a mesma de ordem_do_jogo(numero)
+#     1 byte    status do solver (0 = não resolvido, 1 = VITORIA, 2 = DERROTA, 3 = DESCONHECIDO)
+#     1 byte    bloqueios: Ases que começam virados para baixo
+#     4 bytes   nós usados pelo solver
+#
+# A leitura usa mmap: acesso O(1) a qualquer número, e processos diferentes
+# que abrem o mesmo arquivo compartilham as páginas do sistema operacional
+#
+# Uso: python -m src.game.banco_jogos jogos.ykdb --jogos 1000000 --resolver
+
+import argparse
+import mmap
+import os
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, NamedTuple, Optional
+
+from src.game.estado_compacto import EstadoCompacto, TAMANHOS_INICIAIS, OCULTAS_INICIAIS
+from src.game.jogo_yukon import JogoYukon
+from src.game.solver import Solver, VITORIA, DERROTA, DESCONHECIDO
+from src.models.baralho import ordem_do_jogo
+from src.models.carta import VALOR_ID
+
+MAGICO = b"YKDB"
+VERSAO = 1
+_CABECALHO = struct.Struct("<4sHHQQ")
+_REGISTRO = struct.Struct("<52sBB2xI4x")
+TAMANHO_CABECALHO = _CABECALHO.size
+TAMANHO_REGISTRO = _REGISTRO.size
+
+# Status gravados no arquivo (NAO_RESOLVIDO = o solver não foi rodado)
+NAO_RESOLVIDO = "NAO_RESOLVIDO"
+_STATUS_PARA_BYTE = {NAO_RESOLVIDO: 0, VITORIA: 1, DERROTA: 2, DESCONHECIDO: 3}
+_BYTE_PARA_STATUS = {v: k for k, v in _STATUS_PARA_BYTE.items()}
+
+TAMANHO_LOTE_PADRAO = 1000
+
+# Posições (na ordem de distribuição) que começam viradas para baixo
+_POSICOES_OCULTAS = []
+_inicio = 0
+for _tam, _ocultas in zip(TAMANHOS_INICIAIS, OCULTAS_INICIAIS):
+    _POSICOES_OCULTAS.extend(range(_inicio, _inicio + _ocultas))
+    _inicio += _tam
+_POSICOES_OCULTAS = tuple(_POSICOES_OCULTAS)
+
+
+# ----------------------------------------------------------------------
+# CLASSE: RegistroJogo
+# Um registro do banco: a distribuição e as anotações do solver
+# ----------------------------------------------------------------------
+class RegistroJogo(NamedTuple):
+    numero: int
+    ordem: bytes
+    status: str
+    nos: int
+    bloqueios: int
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: contar_bloqueios
+# Quantos Ases estão entre as cartas que começam viradas para baixo
+# ------------------------------------------------------------------
+def contar_bloqueios(ordem) -> int:
+    return sum(VALOR_ID[ordem[pos]] == 1 for pos in _POSICOES_OCULTAS)
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO PRIVADA: _gerar_lote
+# Executada dentro de cada processo: monta os registros [inicio, fim)
+# ------------------------------------------------------------------
+def _gerar_lote(inicio: int, fim: int, resolver: bool, max_nos: int,
+                tempo_limite: float) -> bytes:
+    partes = []
+    for numero in range(inicio, fim):
+        ordem = ordem_do_jogo(numero)
+        status, nos = NAO_RESOLVIDO, 0
+        if resolver:
+            resultado = Solver(max_nos=max_nos, tempo_limite=tempo_limite).resolver(
+                EstadoCompacto.distribuir(ordem))
+            status, nos = resultado.status, resultado.nos
+        partes.append(_REGISTRO.pack(bytes(ordem), _STATUS_PARA_BYTE[status],
+                                     contar_bloqueios(ordem), nos))
+    return b"".join(partes)
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: gerar_banco
+# Grava 'quantidade' distribuições a partir de 'primeiro_jogo' no arquivo
+# Com resolver=True cada jogo é anotado pelo solver (dividido entre processos)
+# ------------------------------------------------------------------
+def gerar_banco(caminho: str, quantidade: int, primeiro_jogo: int = 0, resolver: bool = False,
+                max_nos: int = 50_000, tempo_limite: float = 5.0, processos: int = None,
+                tamanho_lote: int = TAMANHO_LOTE_PADRAO):
+    processos = processos or os.cpu_count() or 1
+    lotes = [
+        (inicio, min(inicio + tamanho_lote, primeiro_jogo + quantidade), resolver, max_nos,
+         tempo_limite)
+        for inicio in range(primeiro_jogo, primeiro_jogo + quantidade, tamanho_lote)
+    ]
+
+    with open(caminho, "wb") as arquivo:
+        arquivo.write(_CABECALHO.pack(MAGICO, VERSAO, TAMANHO_REGISTRO, primeiro_jogo, quantidade))
+        if processos == 1:
+            for lote in lotes:
+                arquivo.write(_gerar_lote(*lote))
+        else:
+            with ProcessPoolExecutor(max_workers=processos) as executor:
+                for dados in executor.map(_gerar_lote, *zip(*lotes)):
+                    arquivo.write(dados)
+
+
+# ----------------------------------------------------------------------
+# CLASSE: BancoJogos
+# Leitor do arquivo via mmap (somente leitura)
+# Uso:
+#   with BancoJogos("jogos.ykdb") as banco:
+#       jogo = banco.jogo(1234)
+# ----------------------------------------------------------------------
+class BancoJogos:
+    def __init__(self, caminho: str):
+        self._arquivo = open(caminho, "rb")
+        try:
+            self._mm = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._arquivo.close()
+            raise ValueError(f"Arquivo vazio: {caminho}")
+
+        if len(self._mm) < TAMANHO_CABECALHO:
+            self.fechar()
+            raise ValueError(f"Arquivo não é um banco de jogos: {caminho}")
+        magico, versao, tam_registro, self.primeiro_jogo, self.quantidade = \
+            _CABECALHO.unpack_from(self._mm, 0)
+        if magico != MAGICO or versao != VERSAO or tam_registro != TAMANHO_REGISTRO:
+            self.fechar()
+            raise ValueError(f"Arquivo não é um banco de jogos (versão {VERSAO}): {caminho}")
+        if len(self._mm) < TAMANHO_CABECALHO + self.quantidade * TAMANHO_REGISTRO:
+            self.fechar()
+            raise ValueError(f"Banco de jogos incompleto: {caminho}")
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _deslocamento
+    # Posição do registro de 'numero' no arquivo
+    # ------------------------------------------------------------------
+    def _deslocamento(self, numero: int) -> int:
+        if numero not in self:
+            raise IndexError(f"Jogo {numero} fora do banco "
+                             f"({self.primeiro_jogo} a {self.primeiro_jogo + self.quantidade - 1})")
+        return TAMANHO_CABECALHO + (numero - self.primeiro_jogo) * TAMANHO_REGISTRO
+
+    # ------------------------------------------------------------------
+    # MÉTODO: registro
+    # Lê o registro completo de um número
+    # ------------------------------------------------------------------
+    def registro(self, numero: int) -> RegistroJogo:
+        ordem, status, bloqueios, nos = _REGISTRO.unpack_from(self._mm, self._deslocamento(numero))
+        return RegistroJogo(numero, ordem, _BYTE_PARA_STATUS[status], nos, bloqueios)
+
+    # ------------------------------------------------------------------
+    # MÉTODO: ordem
+    # Só a ordem das cartas (sem criar o registro inteiro)
+    # ------------------------------------------------------------------
+    def ordem(self, numero: int) -> bytes:
+        inicio = self._deslocamento(numero)
+        return self._mm[inicio:inicio + 52]
+
+    # ------------------------------------------------------------------
+    # MÉTODO: jogo
+    # Distribui o jogo 'numero' num JogoYukon
+    # Passando um jogo existente, ele é reaproveitado (novo_jogo)
+    # ------------------------------------------------------------------
+    def jogo(self, numero: int, jogo: JogoYukon = None) -> JogoYukon:
+        ordem = self.ordem(numero)
+        if jogo is None:
+            return JogoYukon(numero, ordem=ordem)
+        jogo.novo_jogo(numero, ordem)
+        return jogo
+
+    # ------------------------------------------------------------------
+    # MÉTODO: estado
+    # Distribui o jogo 'numero' num EstadoCompacto (para solver e simulador)
+    # ------------------------------------------------------------------
+    def estado(self, numero: int) -> EstadoCompacto:
+        return EstadoCompacto.distribuir(self.ordem(numero))
+
+    # ------------------------------------------------------------------
+    # MÉTODO: numeros
+    # Percorre os números do banco, opcionalmente só os de um status
+    # Ex: banco.numeros(VITORIA) → jogos que o solver provou vencíveis
+    # ------------------------------------------------------------------
+    def numeros(self, status: Optional[str] = None) -> Iterator[int]:
+        if status is None:
+            yield from range(self.primeiro_jogo, self.primeiro_jogo + self.quantidade)
+            return
+        alvo = _STATUS_PARA_BYTE[status]
+        mm = self._mm
+        pos = TAMANHO_CABECALHO + 52
+        for i in range(self.quantidade):
+            if mm[pos] == alvo:
+                yield self.primeiro_jogo + i
+            pos += TAMANHO_REGISTRO
+
+    # ------------------------------------------------------------------
+    # MÉTODO: fechar
+    # ------------------------------------------------------------------
+    def fechar(self):
+        if not self._mm.closed:
+            self._mm.close()
+        self._arquivo.close()
+
+    def __len__(self):
+        return self.quantidade
+
+    def __contains__(self, numero):
+        return self.primeiro_jogo <= numero < self.primeiro_jogo + self.quantidade
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *erro):
+        self.fechar()
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: main
+# Ponto de entrada da linha de comando (python -m src.game.banco_jogos)
+# ------------------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera um banco de distribuições do Yukon")
+    parser.add_argument("arquivo", help="arquivo de saída")
+    parser.add_argument("--jogos", type=int, default=100_000, help="quantidade de distribuições")
+    parser.add_argument("--primeiro-jogo", type=int, default=0, help="número da primeira distribuição")
+    parser.add_argument("--resolver", action="store_true", help="anota cada jogo com o solver")
+    parser.add_argument("--max-nos", type=int, default=50_000, help="orçamento do solver por jogo")
+    parser.add_argument("--tempo-limite", type=float, default=5.0, help="segundos do solver por jogo")
+    parser.add_argument("--processos", type=int, default=None, help="padrão: todos os núcleos")
+    args = parser.parse_args(argv)
+
+    comeco = time.perf_counter()
+    gerar_banco(args.arquivo, args.jogos, args.primeiro_jogo, args.resolver, args.max_nos,
+                args.tempo_limite, args.processos)
+    segundos = time.perf_counter() - comeco
+
+    with BancoJogos(args.arquivo) as banco:
+        print(f"Arquivo:         {args.arquivo}")
+        print(f"Distribuições:   {len(banco)} (a partir do nº {banco.primeiro_jogo})")
+        if args.resolver:
+            for status in (VITORIA, DERROTA, DESCONHECIDO):
+                print(f"{status + ':':<17}{sum(1 for _ in banco.numeros(status))}")
+    print(f"Tempo:           {segundos:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
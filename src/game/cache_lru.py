@@ -0,0 +1,59 @@
+# src/game/cache_lru.py
+# Cache limitado que descarta o item usado há mais tempo (LRU)
+# Usado para guardar resultados derivados de uma posição (dicas, movimentos
+# legais, veredito do solver) pelo hash Zobrist da posição
+
+from collections import OrderedDict
+
+
+# ----------------------------------------------------------------------
+# CLASSE: CacheLRU
+# capacidade: máximo de itens guardados
+# acertos / falhas: contadores de consultas (úteis para medir o ganho)
+# ----------------------------------------------------------------------
+class CacheLRU:
+    def __init__(self, capacidade: int = 1024):
+        if capacidade < 1:
+            raise ValueError("Capacidade deve ser pelo menos 1")
+        self.capacidade = capacidade
+        self.acertos = 0
+        self.falhas = 0
+        self._itens = OrderedDict()
+
+    # ------------------------------------------------------------------
+    # MÉTODO: obter
+    # Retorna o valor guardado (e marca como usado agora) ou 'padrao'
+    # ------------------------------------------------------------------
+    def obter(self, chave, padrao=None):
+        itens = self._itens
+        if chave in itens:
+            itens.move_to_end(chave)
+            self.acertos += 1
+            return itens[chave]
+        self.falhas += 1
+        return padrao
+
+    # ------------------------------------------------------------------
+    # MÉTODO: guardar
+    # Guarda um valor; se passar da capacidade, descarta o mais antigo
+    # ------------------------------------------------------------------
+    def guardar(self, chave, valor):
+        itens = self._itens
+        itens[chave] = valor
+        itens.move_to_end(chave)
+        if len(itens) > self.capacidade:
+            itens.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # MÉTODO: limpar
+    # ------------------------------------------------------------------
+    def limpar(self):
+        self._itens.clear()
+        self.acertos = 0
+        self.falhas = 0
+
+    def __len__(self):
+        return len(self._itens)
+
+    def __contains__(self, chave):
+        return chave in self._itens
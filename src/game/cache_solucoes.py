@@ -0,0 +1,278 @@
+# src/game/cache_solucoes.py
+# Cache em disco (sqlite) dos vereditos do solver, para dicas instantâneas
+# Uma posição sem cartas viradas para baixo é totalmente conhecida: o
+# resultado dela nunca muda. O cache guarda, pela chave canônica (a ordem das
+# colunas e das fundações não importa), o veredito e a melhor jogada. Uma
+# vitória grava de uma vez todas as posições da linha vencedora, então as
+# dicas seguintes da mesma partida já saem do cache.
+#
+# As jogadas são gravadas pelas cartas, não pelos índices: (tipo, carta
+# movida, carta do alvo), que vale para qualquer ordem das colunas.
+# A leitura é síncrona (uma consulta pela chave primária); a escrita e a
+# limpeza dos mais antigos (limite de entradas) ficam numa thread.
+#
+# Uso:
+#   cache = CacheSolucoes()                     # arquivo na pasta de dados do usuário
+#   veredito = cache.consultar(estado)          # None ou Veredito(status, movimento)
+#   cache.guardar(estado, resultado_do_solver)  # não bloqueia
+#   cache.fechar()
+
+import os
+import queue
+import sqlite3
+import sys
+import threading
+from typing import NamedTuple, Optional
+
+from src.game.estado_compacto import EstadoCompacto
+from src.game.movimento import Movimento, MOV_TABLEAU, MOV_PARA_FUNDACAO
+from src.game.solver import ResultadoSolver, chave_canonica, chave_estavel, VITORIA, DERROTA
+from src.models.carta import VAZIA
+
+MAX_ENTRADAS_PADRAO = 1_000_000  # ~50 MB no disco
+FRACAO_DESCARTE = 0.1            # Ao passar do limite, apaga os 10% usados há mais tempo
+NOME_ARQUIVO = "solucoes.sqlite3"
+
+_STATUS_PARA_INT = {VITORIA: 1, DERROTA: 2}
+_INT_PARA_STATUS = {v: k for k, v in _STATUS_PARA_INT.items()}
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS posicoes (
+    chave  INTEGER PRIMARY KEY,   -- chave_estavel da chave canônica (com sinal, 64 bits)
+    status INTEGER NOT NULL,      -- 1 = VITORIA, 2 = DERROTA
+    tipo   INTEGER,               -- melhor jogada (NULL na derrota)
+    carta  INTEGER,
+    alvo   INTEGER,
+    uso    INTEGER NOT NULL       -- contador do último acesso (para descartar os antigos)
+)
+"""
+_INDICE_USO = "CREATE INDEX IF NOT EXISTS posicoes_uso ON posicoes (uso)"
+
+
+# ----------------------------------------------------------------------
+# CLASSE: Veredito
+# movimento: a melhor jogada na posição consultada (None se DERROTA)
+# ----------------------------------------------------------------------
+class Veredito(NamedTuple):
+    status: str
+    movimento: Optional[Movimento]
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: diretorio_dados
+# Pasta de dados do usuário para o jogo (criada se não existir)
+# Windows: %APPDATA%; outros: $XDG_DATA_HOME ou ~/.local/share
+# ------------------------------------------------------------------
+def diretorio_dados() -> str:
+    if sys.platform == "win32":
+        base = os.environ.get("APPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+    pasta = os.path.join(base, "paciencia_yukon")
+    os.makedirs(pasta, exist_ok=True)
+    return pasta
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO PRIVADA: _chave
+# Chave da posição no banco (o sqlite só guarda inteiros com sinal)
+# ------------------------------------------------------------------
+def _chave(estado: EstadoCompacto) -> int:
+    chave = chave_estavel(chave_canonica(estado))
+    return chave - (1 << 64) if chave >= 1 << 63 else chave
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO PRIVADA: _topo_coluna
+# ------------------------------------------------------------------
+def _topo_coluna(estado: EstadoCompacto, col: int) -> int:
+    tam = estado.tamanho(col)
+    return estado.carta(col, tam - 1) if tam else VAZIA
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO PRIVADA: _por_cartas
+# Jogada descrita pelas cartas: (tipo, carta movida, carta do alvo)
+# O alvo é o topo da coluna/fundação de destino (VAZIA se vazia)
+# ------------------------------------------------------------------
+def _por_cartas(estado: EstadoCompacto, mov) -> tuple:
+    tipo, origem, inicio, destino = mov
+    if tipo == MOV_TABLEAU:
+        return tipo, estado.carta(origem, inicio), _topo_coluna(estado, destino)
+    if tipo == MOV_PARA_FUNDACAO:
+        return tipo, estado.carta(origem, inicio), estado.topo_fundacao(destino)
+    return tipo, estado.topo_fundacao(origem), _topo_coluna(estado, destino)
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO PRIVADA: _da_descricao
+# Acha, entre os movimentos válidos da posição, o que tem a descrição dada
+# ------------------------------------------------------------------
+def _da_descricao(estado: EstadoCompacto, descricao: tuple) -> Optional[Movimento]:
+    for mov in estado.movimentos():
+        if _por_cartas(estado, mov) == descricao:
+            return Movimento(*mov)
+    return None
+
+
+# ----------------------------------------------------------------------
+# CLASSE: CacheSolucoes
+# caminho: arquivo sqlite (padrão: diretorio_dados()/solucoes.sqlite3;
+#          ":memory:" não serve, pois leitura e escrita usam conexões separadas)
+# max_entradas: limite de posições guardadas
+# ----------------------------------------------------------------------
+class CacheSolucoes:
+    def __init__(self, caminho: Optional[str] = None, max_entradas: int = MAX_ENTRADAS_PADRAO):
+        self.caminho = caminho or os.path.join(diretorio_dados(), NOME_ARQUIVO)
+        self.max_entradas = max_entradas
+
+        # Cada thread usa a própria conexão; o modo WAL deixa ler enquanto a
+        # thread de escrita grava
+        self._local = threading.local()
+        conexao = self._conexao()
+        conexao.execute("PRAGMA journal_mode=WAL")
+        conexao.execute(_ESQUEMA)
+        conexao.execute(_INDICE_USO)
+        conexao.commit()
+        self._uso = conexao.execute("SELECT COALESCE(MAX(uso), 0) FROM posicoes").fetchone()[0]
+        self._trava_uso = threading.Lock()
+
+        self._pedidos = queue.Queue()
+        self._thread = threading.Thread(target=self._escrever, name="cache-solucoes", daemon=True)
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _conexao
+    # Conexão sqlite desta thread (aberta na primeira vez)
+    # ------------------------------------------------------------------
+    def _conexao(self) -> sqlite3.Connection:
+        conexao = getattr(self._local, "conexao", None)
+        if conexao is None:
+            conexao = sqlite3.connect(self.caminho, timeout=5.0)
+            conexao.execute("PRAGMA synchronous=NORMAL")
+            self._local.conexao = conexao
+        return conexao
+
+    def _proximo_uso(self) -> int:
+        with self._trava_uso:
+            self._uso += 1
+            return self._uso
+
+    # ------------------------------------------------------------------
+    # MÉTODO: consultar
+    # Veredito guardado para a posição (None se ela não está no cache)
+    # O acesso renova a entrada (na thread de escrita)
+    # ------------------------------------------------------------------
+    def consultar(self, estado: EstadoCompacto) -> Optional[Veredito]:
+        chave = _chave(estado)
+        linha = self._conexao().execute(
+            "SELECT status, tipo, carta, alvo FROM posicoes WHERE chave = ?", (chave,)).fetchone()
+        if linha is None:
+            return None
+        self._pedidos.put(("usar", chave, self._proximo_uso()))
+        status, tipo, carta, alvo = linha
+        movimento = None
+        if tipo is not None:
+            movimento = _da_descricao(estado, (tipo, carta, alvo))
+            if movimento is None:
+                return None  # Colisão de hash: a jogada guardada não existe aqui
+        return Veredito(_INT_PARA_STATUS[status], movimento)
+
+    # ------------------------------------------------------------------
+    # MÉTODO: guardar
+    # Enfileira o resultado do solver para a posição (não bloqueia)
+    # VITORIA grava todas as posições da linha vencedora; DESCONHECIDO é ignorado
+    # ------------------------------------------------------------------
+    def guardar(self, estado: EstadoCompacto, resultado: ResultadoSolver):
+        if resultado.status in _STATUS_PARA_INT:
+            self._pedidos.put(("guardar", estado.clone(), resultado.status,
+                               list(resultado.movimentos)))
+
+    # ------------------------------------------------------------------
+    # MÉTODO: esperar
+    # Espera a thread gravar tudo o que foi enfileirado até agora
+    # ------------------------------------------------------------------
+    def esperar(self):
+        pronto = threading.Event()
+        self._pedidos.put(("avisar", pronto))
+        pronto.wait()
+
+    # ------------------------------------------------------------------
+    # MÉTODO: fechar
+    # Grava o que falta e encerra a thread (chamado ao fechar a janela)
+    # ------------------------------------------------------------------
+    def fechar(self):
+        self._pedidos.put(None)
+        self._thread.join()
+        conexao = getattr(self._local, "conexao", None)
+        if conexao is not None:
+            conexao.close()
+            self._local.conexao = None
+
+    def __len__(self) -> int:
+        return self._conexao().execute("SELECT COUNT(*) FROM posicoes").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *erro):
+        self.fechar()
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _linhas
+    # Linhas a gravar para um resultado: na vitória, cada posição da linha
+    # vencedora com a jogada feita nela; na derrota, só a posição
+    # ------------------------------------------------------------------
+    def _linhas(self, estado: EstadoCompacto, status: str, movimentos: list) -> list:
+        if status == DERROTA:
+            return [(_chave(estado), 2, None, None, None, self._proximo_uso())]
+        linhas = []
+        estado = estado.clone()
+        for mov in movimentos:
+            linhas.append((_chave(estado), 1) + _por_cartas(estado, mov) + (self._proximo_uso(),))
+            estado.aplicar(mov)
+        return linhas
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _escrever
+    # Laço da thread de escrita: junta os pedidos que estiverem na fila numa
+    # transação só e, se passou do limite, apaga as entradas mais antigas
+    # ------------------------------------------------------------------
+    def _escrever(self):
+        conexao = self._conexao()
+        while True:
+            pedidos = [self._pedidos.get()]
+            while not self._pedidos.empty():
+                pedidos.append(self._pedidos.get_nowait())
+            avisos = []
+            fim = False
+            with conexao:
+                for pedido in pedidos:
+                    if pedido is None:
+                        fim = True
+                    elif pedido[0] == "usar":
+                        conexao.execute("UPDATE posicoes SET uso = ? WHERE chave = ?",
+                                        (pedido[2], pedido[1]))
+                    elif pedido[0] == "guardar":
+                        conexao.executemany("INSERT OR REPLACE INTO posicoes VALUES (?, ?, ?, ?, ?, ?)",
+                                            self._linhas(*pedido[1:]))
+                    else:
+                        avisos.append(pedido[1])
+                self._descartar_antigas(conexao)
+            for pronto in avisos:
+                pronto.set()
+            if fim:
+                conexao.close()
+                return
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _descartar_antigas
+    # Acima de max_entradas, apaga a fração usada há mais tempo
+    # ------------------------------------------------------------------
+    def _descartar_antigas(self, conexao: sqlite3.Connection):
+        total = conexao.execute("SELECT COUNT(*) FROM posicoes").fetchone()[0]
+        if total <= self.max_entradas:
+            return
+        excesso = total - self.max_entradas + int(self.max_entradas * FRACAO_DESCARTE)
+        conexao.execute("DELETE FROM posicoes WHERE chave IN "
+                        "(SELECT chave FROM posicoes ORDER BY uso LIMIT ?)", (excesso,))
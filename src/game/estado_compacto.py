@@ -0,0 +1,322 @@
+# src/game/estado_compacto.py
+# Representação compacta do estado do Yukon, feita para busca e simulação
+# Todo o jogo cabe em um único bytearray de tamanho fixo, então clonar uma
+# posição é só copiar esse buffer (sem copiar listas nem objetos Carta)
+#
+# Layout do buffer (cada posição é 1 byte):
+#   [0  .. 6]    tamanho de cada coluna do tableau
+#   [7  .. 13]   quantidade de cartas viradas para baixo em cada coluna
+#   [14 .. 17]   id da carta do topo de cada fundação (VAZIA = fundação vazia)
+#   [18 .. 381]  7 colunas × 52 posições com os ids das cartas (fundo → topo)
+
+from src.game.movimento import MOV_TABLEAU, MOV_PARA_FUNDACAO, MOV_DA_FUNDACAO
+from src.game.notacao import escrever_notacao, ler_notacao
+from src.models.carta import CABEM_SOBRE, PODE_SOBRE, SEGUE_NA_FUNDACAO, VALOR_ID, VAZIA
+
+# Posições dentro do buffer
+OFF_TAMANHO = 0
+OFF_OCULTAS = 7
+OFF_FUNDACAO = 14
+OFF_COLUNAS = 18
+POSICOES_POR_COLUNA = 52
+TAMANHO_BUFFER = OFF_COLUNAS + 7 * POSICOES_POR_COLUNA
+
+# Os movimentos são tuplas (tipo, origem, inicio, destino); os tipos MOV_* vêm de
+# src/game/movimento.py e continuam importáveis daqui
+
+# Distribuição inicial: coluna 0 com 1 carta, colunas 1 a 6 com N viradas + 5 visíveis
+OCULTAS_INICIAIS = (0, 1, 2, 3, 4, 5, 6)
+TAMANHOS_INICIAIS = (1, 6, 7, 8, 9, 10, 11)
+
+
+class EstadoCompacto:
+    __slots__ = ("dados",)
+
+    # ------------------------------------------------------------------
+    # CONSTRUTOR
+    # Sem buffer → tableau vazio e fundações vazias
+    # Com buffer → usa o bytearray recebido (sem copiar)
+    # ------------------------------------------------------------------
+    def __init__(self, dados: bytearray = None):
+        if dados is None:
+            dados = bytearray(TAMANHO_BUFFER)
+            dados[OFF_FUNDACAO:OFF_COLUNAS] = bytes((VAZIA,) * 4)
+        self.dados = dados
+
+    # ------------------------------------------------------------------
+    # MÉTODO DE CLASSE: de_jogo
+    # Converte um JogoYukon (objetos Pilha/Carta) para o formato compacto
+    # As cartas viradas para baixo são as do fundo de cada coluna (pilha.ocultas)
+    # ------------------------------------------------------------------
+    @classmethod
+    def de_jogo(cls, jogo) -> "EstadoCompacto":
+        estado = cls()
+        dados = estado.dados
+        for col, pilha in enumerate(jogo.tableau):
+            cartas = pilha.cartas
+            ocultas = min(pilha.ocultas, len(cartas))
+            base = OFF_COLUNAS + col * POSICOES_POR_COLUNA
+            dados[base:base + len(cartas)] = bytes(c.id for c in cartas)
+            dados[OFF_TAMANHO + col] = len(cartas)
+            dados[OFF_OCULTAS + col] = ocultas
+        for f, fund in enumerate(jogo.fundacoes):
+            dados[OFF_FUNDACAO + f] = fund.cartas[-1].id if fund.cartas else VAZIA
+        return estado
+
+    # ------------------------------------------------------------------
+    # MÉTODO DE CLASSE: distribuir
+    # Monta a distribuição inicial a partir de uma ordem de 52 ids
+    # (as cartas são distribuídas na mesma ordem de JogoYukon.setup)
+    # ------------------------------------------------------------------
+    @classmethod
+    def distribuir(cls, ordem) -> "EstadoCompacto":
+        estado = cls()
+        dados = estado.dados
+        pos = 0
+        for col in range(7):
+            tam = TAMANHOS_INICIAIS[col]
+            base = OFF_COLUNAS + col * POSICOES_POR_COLUNA
+            dados[base:base + tam] = bytes(ordem[pos:pos + tam])
+            dados[OFF_TAMANHO + col] = tam
+            dados[OFF_OCULTAS + col] = OCULTAS_INICIAIS[col]
+            pos += tam
+        return estado
+
+    # ------------------------------------------------------------------
+    # MÉTODO DE CLASSE: de_notacao
+    # Monta o estado a partir da notação em uma linha (ver src/game/notacao.py)
+    # Caminho rápido para carregar muitas posições (sem objetos Carta)
+    # ------------------------------------------------------------------
+    @classmethod
+    def de_notacao(cls, texto: str) -> "EstadoCompacto":
+        colunas, ocultas, fundacoes = ler_notacao(texto)
+        # O buffer é montado na ordem do layout, só com concatenações
+        dados = bytearray([len(cartas) for cartas in colunas])
+        dados += bytes(ocultas)
+        dados += bytes(fundacoes)
+        for cartas in colunas:
+            dados += bytes(cartas)
+            dados += bytes(POSICOES_POR_COLUNA - len(cartas))
+        return cls(dados)
+
+    # ------------------------------------------------------------------
+    # MÉTODO: notacao
+    # A posição em uma linha de texto (inverso de de_notacao)
+    # ------------------------------------------------------------------
+    def notacao(self) -> str:
+        dados = self.dados
+        return escrever_notacao([self.coluna(col) for col in range(7)],
+                                dados[OFF_OCULTAS:OFF_FUNDACAO], dados[OFF_FUNDACAO:OFF_COLUNAS])
+
+    # ------------------------------------------------------------------
+    # MÉTODO: clone
+    # Cópia independente da posição: uma única cópia do buffer
+    # ------------------------------------------------------------------
+    def clone(self) -> "EstadoCompacto":
+        return EstadoCompacto(bytearray(self.dados))
+
+    # ------------------------------------------------------------------
+    # MÉTODO: chave
+    # Retorna os bytes do estado (imutáveis), úteis como chave de dicionário
+    # ------------------------------------------------------------------
+    def chave(self) -> bytes:
+        return bytes(self.dados)
+
+    # ------------------------------------------------------------------
+    # MÉTODO: chave_canonica
+    # Chave da posição que ignora a ordem das colunas e das fundações
+    # Cada coluna vira (tamanho, viradas para baixo, ids...) e as colunas são ordenadas
+    # ------------------------------------------------------------------
+    def chave_canonica(self) -> bytes:
+        dados = self.dados
+        colunas = []
+        for col in range(7):
+            tam = dados[OFF_TAMANHO + col]
+            base = OFF_COLUNAS + col * POSICOES_POR_COLUNA
+            colunas.append(bytes((tam, dados[OFF_OCULTAS + col])) + dados[base:base + tam])
+        colunas.sort()
+        colunas.append(bytes(sorted(dados[OFF_FUNDACAO:OFF_COLUNAS])))
+        return b"".join(colunas)
+
+    # ------------------------------------------------------------------
+    # MÉTODOS DE CONSULTA
+    # ------------------------------------------------------------------
+    def tamanho(self, col: int) -> int:
+        return self.dados[OFF_TAMANHO + col]
+
+    def ocultas(self, col: int) -> int:
+        return self.dados[OFF_OCULTAS + col]
+
+    def carta(self, col: int, indice: int) -> int:
+        return self.dados[OFF_COLUNAS + col * POSICOES_POR_COLUNA + indice]
+
+    def coluna(self, col: int) -> bytes:
+        base = OFF_COLUNAS + col * POSICOES_POR_COLUNA
+        return bytes(self.dados[base:base + self.dados[OFF_TAMANHO + col]])
+
+    def topo_fundacao(self, fund_idx: int) -> int:
+        return self.dados[OFF_FUNDACAO + fund_idx]
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _virar_topo
+    # Se todas as cartas restantes da coluna estão viradas para baixo,
+    # vira a do topo (mesma regra de Pilha.virar_topo_se_necessario)
+    # ------------------------------------------------------------------
+    def _virar_topo(self, col: int):
+        dados = self.dados
+        tam = dados[OFF_TAMANHO + col]
+        if tam and dados[OFF_OCULTAS + col] >= tam:
+            dados[OFF_OCULTAS + col] = tam - 1
+
+    # ------------------------------------------------------------------
+    # MÉTODO: mover_subpilha
+    # Mesma regra de JogoYukon.mover_subpilha; a subpilha precisa começar
+    # numa carta virada para cima
+    # ------------------------------------------------------------------
+    def mover_subpilha(self, origem_idx: int, inicio_subpilha: int, destino_idx: int) -> bool:
+        dados = self.dados
+        tam_o = dados[OFF_TAMANHO + origem_idx]
+        if (origem_idx == destino_idx or inicio_subpilha >= tam_o
+                or inicio_subpilha < dados[OFF_OCULTAS + origem_idx]):
+            return False
+
+        base_o = OFF_COLUNAS + origem_idx * POSICOES_POR_COLUNA
+        base_d = OFF_COLUNAS + destino_idx * POSICOES_POR_COLUNA
+        tam_d = dados[OFF_TAMANHO + destino_idx]
+        topo_d = dados[base_d + tam_d - 1] if tam_d else VAZIA
+        if not PODE_SOBRE[dados[base_o + inicio_subpilha] * 53 + topo_d]:
+            return False
+
+        qtd = tam_o - inicio_subpilha
+        dados[base_d + tam_d:base_d + tam_d + qtd] = dados[base_o + inicio_subpilha:base_o + tam_o]
+        dados[base_o + inicio_subpilha:base_o + tam_o] = bytes(qtd)
+        dados[OFF_TAMANHO + origem_idx] = inicio_subpilha
+        dados[OFF_TAMANHO + destino_idx] = tam_d + qtd
+        self._virar_topo(origem_idx)
+        return True
+
+    # ------------------------------------------------------------------
+    # MÉTODO: mover_para_fundacao
+    # Move a carta do topo de uma coluna para uma fundação específica
+    # ------------------------------------------------------------------
+    def mover_para_fundacao(self, coluna_idx: int, fund_idx: int) -> bool:
+        dados = self.dados
+        tam = dados[OFF_TAMANHO + coluna_idx]
+        if not tam or dados[OFF_OCULTAS + coluna_idx] >= tam:
+            return False
+
+        pos = OFF_COLUNAS + coluna_idx * POSICOES_POR_COLUNA + tam - 1
+        carta = dados[pos]
+        if not SEGUE_NA_FUNDACAO[carta * 53 + dados[OFF_FUNDACAO + fund_idx]]:
+            return False
+
+        dados[OFF_FUNDACAO + fund_idx] = carta
+        dados[pos] = 0
+        dados[OFF_TAMANHO + coluna_idx] = tam - 1
+        self._virar_topo(coluna_idx)
+        return True
+
+    # ------------------------------------------------------------------
+    # MÉTODO: mover_da_fundacao
+    # Move a carta do topo de uma fundação de volta para o tableau
+    # Como os ids de um naipe são consecutivos, o novo topo é id - 1
+    # ------------------------------------------------------------------
+    def mover_da_fundacao(self, fund_idx: int, destino_idx: int) -> bool:
+        dados = self.dados
+        carta = dados[OFF_FUNDACAO + fund_idx]
+        if carta == VAZIA:
+            return False
+
+        base_d = OFF_COLUNAS + destino_idx * POSICOES_POR_COLUNA
+        tam_d = dados[OFF_TAMANHO + destino_idx]
+        topo_d = dados[base_d + tam_d - 1] if tam_d else VAZIA
+        if not PODE_SOBRE[carta * 53 + topo_d]:
+            return False
+
+        dados[base_d + tam_d] = carta
+        dados[OFF_TAMANHO + destino_idx] = tam_d + 1
+        dados[OFF_FUNDACAO + fund_idx] = carta - 1 if VALOR_ID[carta] > 1 else VAZIA
+        return True
+
+    # ------------------------------------------------------------------
+    # MÉTODO: verificar_vitoria
+    # Vitória = as 4 fundações terminam em Rei
+    # ------------------------------------------------------------------
+    def verificar_vitoria(self) -> bool:
+        return all(
+            topo != VAZIA and VALOR_ID[topo] == 13
+            for topo in self.dados[OFF_FUNDACAO:OFF_COLUNAS]
+        )
+
+    # ------------------------------------------------------------------
+    # MÉTODO: movimentos
+    # Lista todos os movimentos válidos como tuplas (tipo, origem, inicio, destino)
+    # Ordem: tableau → tableau, tableau → fundação, fundação → tableau
+    # (a mesma ordem em que o botão DICA mostra as jogadas)
+    # Um Ás só é oferecido para a primeira fundação vazia, pois as outras
+    # dariam posições equivalentes
+    # ------------------------------------------------------------------
+    def movimentos(self) -> list:
+        dados = self.dados
+        topos = []
+        posicao = {}  # id da carta virada para cima → (coluna, índice)
+        for col in range(7):
+            tam = dados[OFF_TAMANHO + col]
+            base = OFF_COLUNAS + col * POSICOES_POR_COLUNA
+            topos.append(dados[base + tam - 1] if tam else VAZIA)
+            for i in range(dados[OFF_OCULTAS + col], tam):
+                posicao[dados[base + i]] = (col, i)
+
+        # TABLEAU → TABLEAU
+        # Em vez de testar cada carta contra cada coluna, procura só as
+        # cartas que cabem sobre o topo de cada destino
+        lista = []
+        for d in range(7):
+            for carta in CABEM_SOBRE[topos[d]]:
+                local = posicao.get(carta)
+                if local is not None and local[0] != d:
+                    lista.append((MOV_TABLEAU, local[0], local[1], d))
+        lista.sort()
+
+        # TABLEAU → FUNDAÇÃO
+        fundacoes = dados[OFF_FUNDACAO:OFF_COLUNAS]
+        for o in range(7):
+            tam = dados[OFF_TAMANHO + o]
+            if not tam or dados[OFF_OCULTAS + o] >= tam:
+                continue
+            linha = topos[o] * 53
+            for f in range(4):
+                if SEGUE_NA_FUNDACAO[linha + fundacoes[f]]:
+                    lista.append((MOV_PARA_FUNDACAO, o, tam - 1, f))
+                    break
+
+        # FUNDAÇÃO → TABLEAU
+        for f in range(4):
+            carta = fundacoes[f]
+            if carta == VAZIA:
+                continue
+            for d in range(7):
+                if PODE_SOBRE[carta * 53 + topos[d]]:
+                    lista.append((MOV_DA_FUNDACAO, f, 0, d))
+        return lista
+
+    # ------------------------------------------------------------------
+    # MÉTODO: aplicar
+    # Executa um movimento no formato (tipo, origem, inicio, destino)
+    # ------------------------------------------------------------------
+    def aplicar(self, mov) -> bool:
+        tipo, origem, inicio, destino = mov
+        if tipo == MOV_TABLEAU:
+            return self.mover_subpilha(origem, inicio, destino)
+        if tipo == MOV_PARA_FUNDACAO:
+            return self.mover_para_fundacao(origem, destino)
+        return self.mover_da_fundacao(origem, destino)
+
+    # ------------------------------------------------------------------
+    # MÉTODO: cartas_na_fundacao
+    # Quantidade total de cartas já nas fundações
+    # ------------------------------------------------------------------
+    def cartas_na_fundacao(self) -> int:
+        return sum(
+            VALOR_ID[topo] for topo in self.dados[OFF_FUNDACAO:OFF_COLUNAS] if topo != VAZIA
+        )
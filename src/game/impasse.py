@@ -0,0 +1,226 @@
+# src/game/impasse.py
+# Detector de impasse: diz quando uma partida não tem mais como progredir
+# Dois ingredientes:
+#   - Tabela de repetições: quantas vezes cada posição (pelo hash da chave
+#     canônica) já apareceu na partida; jogadas que só voltam a posições vistas
+#     são ciclos. Pela chave canônica, levar o Rei de uma coluna vazia para
+#     outra já conta como repetição
+#   - Prova de "sem progresso": progresso é virar uma carta ou passar do total
+#     de cartas que já estava nas fundações. Todo o resto (mexer no tableau,
+#     tirar carta da fundação) pode ser desfeito. Se nenhuma posição alcançável
+#     só com esses movimentos tem um movimento de progresso, o jogo está perdido
+#     (o Rei passeando entre colunas vazias, sequências indo e voltando...)
+#
+# Uso:
+#   detector = DetectorImpasse()
+#   detector.registrar(jogo)            # a cada jogada
+#   motivo = detector.verificar(jogo)   # None ou SEM_MOVIMENTOS / SO_REPETICOES / SEM_PROGRESSO
+#   Aos poucos (ex: a interface, um pedaço por frame):
+#   verificacao = detector.iniciar(jogo)
+#   if verificacao.avancar(100): motivo = verificacao.motivo
+
+from typing import Dict, Optional
+
+from src.game.estado_compacto import EstadoCompacto
+from src.game.movimento import MOV_PARA_FUNDACAO, MOV_DA_FUNDACAO
+
+# Motivos de impasse (retorno de DetectorImpasse.verificar)
+SEM_MOVIMENTOS = "SEM_MOVIMENTOS"  # Nenhum movimento válido
+SO_REPETICOES = "SO_REPETICOES"    # Todo movimento volta a uma posição já vista
+SEM_PROGRESSO = "SEM_PROGRESSO"    # Dá para mexer, mas nunca mais virar carta nem subir a fundação
+
+LIMITE_NOS_PADRAO = 1000  # Posições exploradas por prova (passou disso, não prova nada)
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO PRIVADA: _compacto
+# Aceita tanto JogoYukon quanto EstadoCompacto
+# ------------------------------------------------------------------
+def _compacto(posicao) -> EstadoCompacto:
+    return posicao if isinstance(posicao, EstadoCompacto) else EstadoCompacto.de_jogo(posicao)
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: provar_sem_progresso
+# True quando está provado que nenhuma sequência de movimentos leva a
+# progresso (então a partida está perdida); False se achou progresso, se a
+# posição já é vitória ou se o limite de posições acabou antes de decidir
+# As posições são comparadas pela chave canônica (a ordem das colunas não
+# importa), o que corta as voltas do Rei entre colunas vazias
+# ------------------------------------------------------------------
+def provar_sem_progresso(estado: EstadoCompacto, limite_nos: int = LIMITE_NOS_PADRAO) -> bool:
+    return ProvaSemProgresso(estado, limite_nos).avancar()
+
+
+# ----------------------------------------------------------------------
+# CLASSE: ProvaSemProgresso
+# A mesma prova de provar_sem_progresso, feita aos poucos
+# avancar(passos) expande até 'passos' posições e retorna None enquanto não
+# decidiu; depois, sempre o resultado (True = provado sem progresso)
+# ----------------------------------------------------------------------
+class ProvaSemProgresso:
+    def __init__(self, estado: EstadoCompacto, limite_nos: int = LIMITE_NOS_PADRAO):
+        self.limite_nos = limite_nos
+        self.resultado: Optional[bool] = None
+        if estado.verificar_vitoria():
+            self.resultado = False
+            return
+        self._base = estado.cartas_na_fundacao()
+        self._vistos = {estado.chave_canonica()}
+        self._pendentes = [(estado, self._base)]
+
+    # ------------------------------------------------------------------
+    # MÉTODO: avancar
+    # passos=None: vai até decidir
+    # ------------------------------------------------------------------
+    def avancar(self, passos: Optional[int] = None) -> Optional[bool]:
+        if self.resultado is None:
+            self.resultado = self._expandir(passos)
+        return self.resultado
+
+    def _expandir(self, passos: Optional[int]) -> Optional[bool]:
+        base = self._base
+        vistos = self._vistos
+        pendentes = self._pendentes
+        limite_nos = self.limite_nos
+        while pendentes:
+            if passos is not None:
+                if passos <= 0:
+                    return None
+                passos -= 1
+            atual, na_fundacao = pendentes.pop()
+            for mov in atual.movimentos():
+                tipo, origem, inicio, _ = mov
+                if tipo != MOV_DA_FUNDACAO and inicio > 0 and inicio == atual.ocultas(origem):
+                    return False  # Vira uma carta
+                if tipo == MOV_PARA_FUNDACAO:
+                    if na_fundacao >= base:
+                        return False  # Passa do total que já estava nas fundações
+                    passo = 1
+                else:
+                    passo = -1 if tipo == MOV_DA_FUNDACAO else 0
+                filho = atual.clone()
+                filho.aplicar(mov)
+                chave = filho.chave_canonica()
+                if chave in vistos:
+                    continue
+                if len(vistos) >= limite_nos:
+                    return False
+                vistos.add(chave)
+                pendentes.append((filho, na_fundacao + passo))
+        return True
+
+
+# ----------------------------------------------------------------------
+# CLASSE: DetectorImpasse
+# Acompanha uma partida: tabela de repetições (hash da chave canônica →
+# quantas vezes a posição apareceu) e diagnóstico de impasse
+# limite_nos: orçamento da prova de "sem progresso" (ver provar_sem_progresso)
+# As posições podem ser JogoYukon ou EstadoCompacto
+# ----------------------------------------------------------------------
+class DetectorImpasse:
+    def __init__(self, limite_nos: int = LIMITE_NOS_PADRAO):
+        self.limite_nos = limite_nos
+        self._vezes: Dict[int, int] = {}
+
+    # ------------------------------------------------------------------
+    # MÉTODO: limpar
+    # Esquece a partida (nova distribuição)
+    # ------------------------------------------------------------------
+    def limpar(self):
+        self._vezes.clear()
+
+    # ------------------------------------------------------------------
+    # MÉTODO: registrar
+    # Anota a posição na tabela
+    # Retorna quantas vezes a posição já apareceu (1 = primeira vez)
+    # ------------------------------------------------------------------
+    def registrar(self, posicao) -> int:
+        h = hash(_compacto(posicao).chave_canonica())
+        vezes = self._vezes.get(h, 0) + 1
+        self._vezes[h] = vezes
+        return vezes
+
+    # ------------------------------------------------------------------
+    # MÉTODO: registrar_nova
+    # Registra a posição só se ela ainda não apareceu na partida
+    # Retorna True se registrou (uma consulta à tabela em vez de duas)
+    # ------------------------------------------------------------------
+    def registrar_nova(self, posicao) -> bool:
+        h = hash(_compacto(posicao).chave_canonica())
+        if h in self._vezes:
+            return False
+        self._vezes[h] = 1
+        return True
+
+    # ------------------------------------------------------------------
+    # MÉTODOS: vezes / ja_vista
+    # ------------------------------------------------------------------
+    def vezes(self, posicao) -> int:
+        return self._vezes.get(hash(_compacto(posicao).chave_canonica()), 0)
+
+    def ja_vista(self, posicao) -> bool:
+        return hash(_compacto(posicao).chave_canonica()) in self._vezes
+
+    # ------------------------------------------------------------------
+    # MÉTODO: verificar
+    # Diagnóstico completo da posição (para mostrar ao jogador)
+    # Retorna SEM_MOVIMENTOS, SO_REPETICOES, SEM_PROGRESSO ou None
+    # ------------------------------------------------------------------
+    def verificar(self, posicao) -> Optional[str]:
+        verificacao = self.iniciar(posicao)
+        verificacao.avancar()
+        return verificacao.motivo
+
+    # ------------------------------------------------------------------
+    # MÉTODO: iniciar
+    # O mesmo diagnóstico, para ser feito aos poucos (VerificacaoImpasse)
+    # ------------------------------------------------------------------
+    def iniciar(self, posicao) -> "VerificacaoImpasse":
+        return VerificacaoImpasse(self, _compacto(posicao))
+
+
+# ----------------------------------------------------------------------
+# CLASSE: VerificacaoImpasse
+# Diagnóstico de DetectorImpasse.verificar dividido em pedaços: o caro é a
+# prova de "sem progresso", que avança 'passos' posições por chamada
+# pronta / motivo: quando pronta, o motivo (ou None, sem impasse)
+# ----------------------------------------------------------------------
+class VerificacaoImpasse:
+    def __init__(self, detector: DetectorImpasse, estado: EstadoCompacto):
+        self._detector = detector
+        self._estado = estado
+        self._prova = None
+        self.pronta = True
+        self.motivo: Optional[str] = None
+        if estado.verificar_vitoria():
+            return
+        self._movimentos = estado.movimentos()
+        if not self._movimentos:
+            self.motivo = SEM_MOVIMENTOS
+            return
+        self._prova = ProvaSemProgresso(estado, detector.limite_nos)
+        self.pronta = False
+
+    # ------------------------------------------------------------------
+    # MÉTODO: avancar
+    # Continua o diagnóstico; retorna True quando ele ficou pronto
+    # passos=None: vai até o fim
+    # ------------------------------------------------------------------
+    def avancar(self, passos: Optional[int] = None) -> bool:
+        if self.pronta:
+            return True
+        sem_progresso = self._prova.avancar(passos)
+        if sem_progresso is None:
+            return False
+        self.pronta = True
+        if sem_progresso:
+            self.motivo = SEM_PROGRESSO
+            return True
+        for mov in self._movimentos:
+            filho = self._estado.clone()
+            filho.aplicar(mov)
+            if not self._detector.ja_vista(filho):
+                return True
+        self.motivo = SO_REPETICOES
+        return True
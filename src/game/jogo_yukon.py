@@ -4,15 +4,51 @@
 
 from src.models.baralho import Baralho
 from src.models.pilha import Pilha
-from typing import List
+from src.models.carta import CABEM_SOBRE, NAIPE_ID, SEGUE_NA_FUNDACAO, VAZIA, e_segura
+from src.game.estado_compacto import TAMANHOS_INICIAIS, OCULTAS_INICIAIS
+from src.game.movimento import Movimento, MOV_TABLEAU, MOV_PARA_FUNDACAO, MOV_DA_FUNDACAO
+from src.game.notacao import escrever_notacao, ler_notacao
+from src.game.cache_lru import CacheLRU
+from src.game.zobrist import Z_POSICAO, Z_OCULTA, Z_FUNDACAO, POSICOES_NO_TABLEAU, hash_jogo
+from array import array
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+# ----------------------------------------------------------------------
+# DIÁRIO DE MOVIMENTOS (desfazer/refazer)
+# Cada movimento feito é guardado como um inteiro de 16 bits (2 bytes):
+#   bits 0-1:  tipo (MOV_TABLEAU, MOV_PARA_FUNDACAO, MOV_DA_FUNDACAO)
+#   bits 2-4:  origem (coluna ou fundação)
+#   bits 5-7:  destino (coluna ou fundação)
+#   bits 8-13: quantidade de cartas movidas
+#   bit 14:    a origem virou uma carta para cima depois do movimento
+#   bit 15:    faz parte do mesmo lote da entrada anterior (desfeito/refeito junto)
+# ----------------------------------------------------------------------
+LIMITE_HISTORICO_PADRAO = 10_000  # Movimentos guardados para desfazer
+_VIROU = 1 << 14
+_LOTE = 1 << 15
+
+
+def _codificar(tipo: int, origem: int, destino: int, quantidade: int, virou: bool) -> int:
+    return tipo | origem << 2 | destino << 5 | quantidade << 8 | (_VIROU if virou else 0)
+
+
+def _decodificar(entrada: int) -> Tuple[int, int, int, int, bool]:
+    return (entrada & 3, entrada >> 2 & 7, entrada >> 5 & 7, entrada >> 8 & 63,
+            bool(entrada & _VIROU))
 
 
 class JogoYukon:
     # ------------------------------------------------------------------
     # CONSTRUTOR
     # Cria o jogo: 7 colunas no tableau, 4 fundações, baralho
+    # numero_jogo: número da distribuição (o mesmo número gera sempre o mesmo jogo);
+    #              None = distribuição aleatória
+    # limite_historico: quantos movimentos podem ser desfeitos (os mais antigos são descartados)
+    # ordem: ids das 52 cartas na ordem de distribuição (ex: vinda do banco de jogos);
+    #        quando informada, é usada no lugar de embaralhar
     # ------------------------------------------------------------------
-    def __init__(self):
+    def __init__(self, numero_jogo: Optional[int] = None,
+                 limite_historico: int = LIMITE_HISTORICO_PADRAO, ordem=None):
         # 7 pilhas para as colunas do jogo (tableau)
         self.tableau: List[Pilha] = [Pilha() for _ in range(7)]
         
@@ -21,9 +57,39 @@ class JogoYukon:
         
         # O baralho com 52 cartas
         self.baralho = Baralho()
-        
+        self.numero_jogo = numero_jogo
+
+        # Índice de movimentos válidos (atualizado só nas colunas que mudam)
+        # _local:    id de cada carta virada para cima no tableau → (coluna, índice)
+        # _destinos: id da carta que "cabe" no topo de uma coluna → colunas onde cabe
+        # _topos:    id da carta do topo de cada coluna (VAZIA se vazia)
+        # _visiveis: ids das cartas viradas para cima de cada coluna
+        self._local: Dict[int, Tuple[int, int]] = {}
+        self._destinos: Dict[int, Set[int]] = {}
+        self._topos: List[int] = [VAZIA] * 7
+        self._visiveis: List[List[int]] = [[] for _ in range(7)]
+
+        # Diário de movimentos: _diario guarda o que pode ser desfeito,
+        # _refazer o que foi desfeito e pode ser refeito
+        # _refazer_em: tamanho do diário em que _refazer vale (um movimento novo
+        #              o torna velho sem apagá-lo: desfazer(mov) volta a valer)
+        # _corte: (tamanho do diário depois do corte, entradas cortadas) do último
+        #         descarte das mais antigas, devolvidas se desfazer(mov) o desmanchar
+        self.limite_historico = limite_historico
+        self._diario = array('H')
+        self._refazer = array('H')
+        self._refazer_em = 0
+        self._corte = None
+        self._refazendo = False
+        self._em_lote = False  # Entradas novas recebem a marca _LOTE
+
+        # Hash Zobrist da posição atual (atualizado a cada movimento) e
+        # cache de movimentos legais por hash (desfazer volta a posições já vistas)
+        self.hash_zobrist = 0
+        self._cache_movimentos = CacheLRU(256)
+
         # Monta o jogo com distribuição inicial
-        self.setup()
+        self.setup(ordem)
 
     # ------------------------------------------------------------------
     # MÉTODO: setup (100% CORRETO - Yukon oficial)
@@ -34,30 +100,83 @@ class JogoYukon:
     # Total face-down: 1+2+3+4+5+6 = 21
     # Total: 31 + 21 = 52
     # ------------------------------------------------------------------
-    def setup(self):
-        self.baralho.embaralhar()
+    def setup(self, ordem=None):
+        if ordem is not None:
+            self.baralho.organizar(ordem)
+        elif self.numero_jogo is None:
+            self.baralho.embaralhar()
+        else:
+            self.baralho.embaralhar_jogo(self.numero_jogo)
 
-        # === DISTRIBUIÇÃO CORRETA ===
+        # === DISTRIBUIÇÃO CORRETA (uma passada pelo baralho) ===
+        cartas = self.baralho.distribuir(52)
+        pos = 0
         for col_idx in range(7):
-            face_down_count = col_idx  # 0,1,2,3,4,5,6
-
-            # 1. Adiciona face-down
-            for _ in range(face_down_count):
-                carta = self.baralho.distribuir(1)[0]
-                self.tableau[col_idx].push(carta)
+            tamanho = TAMANHOS_INICIAIS[col_idx]  # 1, 6, 7, 8, 9, 10, 11
+            # As primeiras 'col_idx' ficam face-down, o resto face-up
+            self.tableau[col_idx].definir_cartas(cartas[pos:pos + tamanho],
+                                                 OCULTAS_INICIAIS[col_idx])
+            pos += tamanho
 
-            # 2. Adiciona face-up
-            face_up_count = 1 if col_idx == 0 else 5
-            for _ in range(face_up_count):
-                carta = self.baralho.distribuir(1)[0]
-                carta.virar()  # face-up
-                self.tableau[col_idx].push(carta)
+        for fund in self.fundacoes:
+            fund.definir_cartas([])
 
         # Verificação final
         total = sum(p.tamanho() for p in self.tableau)
         if total != 52:
             raise RuntimeError(f"ERRO CRÍTICO: {total} cartas distribuídas (esperado 52)")
 
+        self.reindexar()
+        self.limpar_historico()
+
+    # ------------------------------------------------------------------
+    # MÉTODO: novo_jogo
+    # Começa outra partida reaproveitando o baralho, as cartas e as pilhas
+    # numero: número da distribuição (None = aleatória)
+    # ordem: ordem das cartas já conhecida (dispensa embaralhar)
+    # ------------------------------------------------------------------
+    def novo_jogo(self, numero: Optional[int] = None, ordem=None):
+        self.numero_jogo = numero
+        self.setup(ordem)
+
+    # ------------------------------------------------------------------
+    # MÉTODO DE CLASSE: de_notacao
+    # Cria um jogo já na posição descrita pela notação (ver src/game/notacao.py)
+    # ------------------------------------------------------------------
+    @classmethod
+    def de_notacao(cls, texto: str, limite_historico: int = LIMITE_HISTORICO_PADRAO) -> "JogoYukon":
+        jogo = cls(limite_historico=limite_historico, ordem=range(52))
+        jogo.carregar_notacao(texto)
+        return jogo
+
+    # ------------------------------------------------------------------
+    # MÉTODO: carregar_notacao
+    # Coloca este jogo na posição descrita pela notação, reaproveitando as
+    # cartas e as pilhas; o histórico é apagado e a partida deixa de ter número
+    # Lança ValueError se o texto não for uma posição válida (o jogo não muda)
+    # ------------------------------------------------------------------
+    def carregar_notacao(self, texto: str):
+        colunas, ocultas, fundacoes = ler_notacao(texto)
+        cartas_dos_ids = self.baralho.cartas_dos_ids
+        for pilha, ids, n in zip(self.tableau, colunas, ocultas):
+            pilha.definir_cartas(cartas_dos_ids(ids), n)
+        for pilha, topo in zip(self.fundacoes, fundacoes):
+            pilha.definir_cartas(cartas_dos_ids(range(topo - topo % 13, topo + 1))
+                                 if topo != VAZIA else [])
+        self.numero_jogo = None
+        self.reindexar()
+        self.limpar_historico()
+
+    # ------------------------------------------------------------------
+    # MÉTODO: notacao
+    # A posição atual em uma linha de texto (inverso de carregar_notacao)
+    # ------------------------------------------------------------------
+    def notacao(self) -> str:
+        return escrever_notacao([[c.id for c in pilha.cartas] for pilha in self.tableau],
+                                [pilha.ocultas for pilha in self.tableau],
+                                [fund.cartas[-1].id if fund.cartas else VAZIA
+                                 for fund in self.fundacoes])
+
     # ------------------------------------------------------------------
     # MÉTODO: mover_subpilha
     # Move uma subpilha de uma coluna para outra
@@ -66,38 +185,46 @@ class JogoYukon:
         origem = self.tableau[origem_idx]
         destino = self.tableau[destino_idx]
 
-        if origem_idx == destino_idx or inicio_subpilha >= origem.tamanho():
+        if (origem_idx == destino_idx or inicio_subpilha >= origem.tamanho()
+                or not origem.visivel(inicio_subpilha)):
             return False
 
-        subpilha = origem.get_subpilha(inicio_subpilha)
-        if not destino.pode_adicionar_subpilha(subpilha):
+        # Valida pela vista (sem copiar as cartas) e move com fatias nas próprias listas
+        if not destino.pode_adicionar_subpilha(origem.vista(inicio_subpilha)):
             return False
 
-        origem.remover_subpilha(inicio_subpilha)
-        destino.adicionar_subpilha(subpilha)
-        origem.virar_topo_se_necessario()
+        quantidade = origem.tamanho() - inicio_subpilha
+        origem.mover_para(inicio_subpilha, destino)
+        virou = origem.virar_topo_se_necessario()
+        self._reindexar_colunas(origem_idx, destino_idx)
+        self._registrar(_codificar(MOV_TABLEAU, origem_idx, destino_idx, quantidade, virou))
         return True
 
     # ------------------------------------------------------------------
     # MÉTODO: mover_para_fundacao
-    # Move a carta do topo de uma coluna para uma fundação específica
+    # Move a carta do topo de uma coluna para uma fundação
+    # fund_idx=None escolhe a fundação onde a carta cabe
     # ------------------------------------------------------------------
-    def mover_para_fundacao(self, coluna_idx: int, fund_idx: int) -> bool:
+    def mover_para_fundacao(self, coluna_idx: int, fund_idx: Optional[int] = None) -> bool:
         origem = self.tableau[coluna_idx]
         carta = origem.peek()
-        if not carta or not carta.face_up:
+        if not carta or not origem.visivel(origem.tamanho() - 1):
             return False
 
+        if fund_idx is None:
+            fund_idx = self.encontrar_fundacao(carta)
+            if fund_idx is None:
+                return False
         fund = self.fundacoes[fund_idx]
-        topo = fund.peek()
 
         # Pode colocar se:
         # - Fundação vazia e carta é Ás
         # - Ou carta é 1 acima do topo e mesmo naipe
-        if (topo is None and carta.valor == 1) or \
-           (topo and topo.naipe == carta.naipe and carta.valor == topo.valor + 1):
-            fund.push(origem.pop())
-            origem.virar_topo_se_necessario()
+        if self.pode_mover_para_fundacao(carta, fund_idx):
+            fund.push(origem.pop(virar=False))
+            virou = origem.virar_topo_se_necessario()
+            self._reindexar_colunas(coluna_idx)
+            self._registrar(_codificar(MOV_PARA_FUNDACAO, coluna_idx, fund_idx, 1, virou))
             return True
         return False
 
@@ -109,13 +236,55 @@ class JogoYukon:
         """Verifica se a carta pode ser movida para a fundação específica."""
         if carta is None:
             return False
-        fund = self.fundacoes[fund_idx]
-        topo = fund.peek()
-        if topo is None:
-            return carta.valor == 1  # só Ás
-        else:
-            return (carta.naipe == topo.naipe and
-                    carta.valor == topo.valor + 1)
+        cartas_fund = self.fundacoes[fund_idx].cartas
+        # Fundação vazia → só Ás; senão mesmo naipe e 1 acima do topo
+        topo_id = cartas_fund[-1].id if cartas_fund else VAZIA
+        return SEGUE_NA_FUNDACAO[carta.id * 53 + topo_id]
+
+    # ------------------------------------------------------------------
+    # MÉTODO: encontrar_fundacao
+    # Índice da fundação que aceita a carta (None se nenhuma aceitar)
+    # ------------------------------------------------------------------
+    def encontrar_fundacao(self, carta) -> Optional[int]:
+        for fund_idx in range(4):
+            if self.pode_mover_para_fundacao(carta, fund_idx):
+                return fund_idx
+        return None
+
+    # ------------------------------------------------------------------
+    # MÉTODO: coletar_seguras
+    # Leva para as fundações, de uma vez, todas as cartas "seguras" (ver
+    # e_segura): topos visíveis que nenhuma carta do tableau pode mais usar
+    # Repete até não sobrar nenhuma, já que cada carta coletada pode liberar
+    # outra. Tudo vira um único lote no diário: um desfazer volta o lote inteiro
+    # agrupar: junta o lote à entrada anterior do diário (coleta automática
+    #          depois de uma jogada: desfazer volta a jogada e a coleta)
+    # Retorna quantas cartas foram movidas
+    # ------------------------------------------------------------------
+    def coletar_seguras(self, agrupar: bool = False) -> int:
+        alturas = [0] * 4
+        for fund in self.fundacoes:
+            if fund.cartas:
+                alturas[NAIPE_ID[fund.cartas[-1].id]] = len(fund.cartas)
+
+        movidas = 0
+        self._em_lote = agrupar and len(self._diario) > 0
+        try:
+            achou = True
+            while achou:
+                achou = False
+                for col in range(7):
+                    topo = self._topos[col]
+                    if topo == VAZIA or topo not in self._local or not e_segura(topo, alturas):
+                        continue
+                    if self.mover_para_fundacao(col):
+                        alturas[NAIPE_ID[topo]] += 1
+                        movidas += 1
+                        achou = True
+                        self._em_lote = True
+        finally:
+            self._em_lote = False
+        return movidas
 
     # ------------------------------------------------------------------
     # MÉTODO: mover_da_fundacao
@@ -126,14 +295,319 @@ class JogoYukon:
         if fund.is_vazia():
             return False
         
-        carta = fund.peek()
         destino = self.tableau[destino_idx]
-        
-        if destino.pode_adicionar_subpilha([carta]):
-            destino.adicionar_subpilha([fund.pop()])
+
+        if destino.pode_adicionar_subpilha(fund.vista(fund.tamanho() - 1)):
+            fund.mover_para(fund.tamanho() - 1, destino)
+            self._reindexar_colunas(destino_idx)
+            self._registrar(_codificar(MOV_DA_FUNDACAO, fund_idx, destino_idx, 1, False))
             return True
         return False
 
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _registrar
+    # Anota um movimento feito no diário e atualiza o hash Zobrist
+    # Um movimento novo deixa velho o que havia para refazer (menos durante o
+    # refazer); só desfazer() o apaga de vez
+    # Passando do limite, descarta de uma vez o quarto mais antigo do diário
+    # ------------------------------------------------------------------
+    def _registrar(self, entrada: int):
+        if self._em_lote:
+            entrada |= _LOTE
+        self.hash_zobrist ^= self._delta_zobrist(*_decodificar(entrada))
+        diario = self._diario
+        diario.append(entrada)
+        if self._refazendo:
+            self._refazer_em = len(diario)
+        if len(diario) > self.limite_historico:
+            corte = len(diario) - self.limite_historico + self.limite_historico // 4
+            cortadas = diario[:corte]
+            del diario[:corte]
+            self._refazer_em -= corte
+            self._corte = (len(diario), cortadas)
+
+    # ------------------------------------------------------------------
+    # MÉTODO: aplicar
+    # Executa um Movimento (ou tupla no mesmo formato) e o registra no diário
+    # Custa o mesmo que os métodos mover_*: só as cartas movidas, sem snapshot
+    # ------------------------------------------------------------------
+    def aplicar(self, mov: Movimento) -> bool:
+        tipo, origem, inicio, destino = mov
+        if tipo == MOV_TABLEAU:
+            return self.mover_subpilha(origem, inicio, destino)
+        if tipo == MOV_PARA_FUNDACAO:
+            return self.mover_para_fundacao(origem, destino)
+        return self.mover_da_fundacao(origem, destino)
+
+    # ------------------------------------------------------------------
+    # MÉTODO: desfazer
+    # Desfaz o último movimento do diário; retorna False se não houver nenhum
+    # Um lote (ex: coletar_seguras) é desfeito inteiro, menos com 'mov'
+    # Só mexe nas cartas movidas (e desvira a carta que o movimento tinha virado)
+    # mov: se informado, precisa ser o último movimento aplicado (par
+    #      aplicar/desfazer das buscas); senão dá ValueError
+    #      Desfaz só essa entrada, mesmo que seja a última de um lote
+    #      O par não deixa rastro no histórico do jogador: o movimento não vai
+    #      para o refazer, e o que havia para refazer (e o que o aplicar tinha
+    #      descartado do diário) volta como estava
+    # ------------------------------------------------------------------
+    def desfazer(self, mov: Optional[Movimento] = None) -> bool:
+        diario = self._diario
+        if not diario:
+            if mov is not None:
+                raise ValueError(f"Nada para desfazer (esperado: {Movimento(*mov)})")
+            return False
+        if mov is not None:
+            if self.ultimo_movimento() != mov:
+                raise ValueError(f"{Movimento(*mov)} não é o último movimento "
+                                 f"({self.ultimo_movimento()})")
+            corte = self._corte
+            self._desfazer_entrada(diario.pop())
+            if corte is not None and corte[0] == len(diario) + 1:
+                self._corte = None
+                diario[:0] = corte[1]
+                self._refazer_em += len(corte[1])
+            if len(diario) < self._refazer_em:
+                del self._refazer[:]  # Voltou antes do refazer: ele não vale mais
+            return True
+
+        refazer = self._refazer
+        if len(diario) != self._refazer_em:
+            del refazer[:]  # Velho: houve movimento novo depois dele
+        self._corte = None
+        while True:
+            entrada = diario.pop()
+            self._desfazer_entrada(entrada)
+            refazer.append(entrada)
+            if not (entrada & _LOTE and diario):
+                break
+        self._refazer_em = len(diario)
+        return True
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _desfazer_entrada
+    # Volta as cartas de uma entrada do diário (já retirada dele)
+    # ------------------------------------------------------------------
+    def _desfazer_entrada(self, entrada: int):
+        tipo, origem, destino, quantidade, virou = _decodificar(entrada)
+        self.hash_zobrist ^= self._delta_zobrist(tipo, origem, destino, quantidade, virou)
+
+        if tipo == MOV_TABLEAU:
+            pilha_destino = self.tableau[destino]
+            if virou:
+                self.tableau[origem].esconder_topo()
+            pilha_destino.mover_para(pilha_destino.tamanho() - quantidade, self.tableau[origem])
+            self._reindexar_colunas(origem, destino)
+        elif tipo == MOV_PARA_FUNDACAO:
+            pilha_origem = self.tableau[origem]
+            if virou:
+                pilha_origem.esconder_topo()
+            pilha_origem.push(self.fundacoes[destino].pop(virar=False))
+            self._reindexar_colunas(origem)
+        else:
+            self.fundacoes[origem].push(self.tableau[destino].pop(virar=False))
+            self._reindexar_colunas(destino)
+
+    # ------------------------------------------------------------------
+    # MÉTODO: refazer
+    # Refaz o último movimento desfeito; retorna False se não houver nenhum
+    # Um lote desfeito de uma vez é refeito de uma vez (com a mesma marca)
+    # ------------------------------------------------------------------
+    def refazer(self) -> bool:
+        if not self.pode_refazer():
+            return False
+        refazer = self._refazer
+        self._refazendo = True
+        try:
+            while True:
+                entrada = refazer[-1]
+                tipo, origem, destino, quantidade, _ = _decodificar(entrada)
+                inicio = (0 if tipo == MOV_DA_FUNDACAO
+                          else self.tableau[origem].tamanho() - quantidade)
+                self._em_lote = bool(entrada & _LOTE)
+                if not self.aplicar(Movimento(tipo, origem, inicio, destino)):
+                    return False
+                refazer.pop()
+                if not (refazer and refazer[-1] & _LOTE):
+                    return True
+        finally:
+            self._refazendo = False
+            self._em_lote = False
+
+    # ------------------------------------------------------------------
+    # MÉTODO: ultimo_movimento
+    # O último movimento do diário como Movimento (None se não houver)
+    # 'inicio' sai do tamanho atual da origem: é onde as cartas estavam
+    # ------------------------------------------------------------------
+    def ultimo_movimento(self) -> Optional[Movimento]:
+        if not self._diario:
+            return None
+        tipo, origem, destino, _, _ = _decodificar(self._diario[-1])
+        inicio = 0 if tipo == MOV_DA_FUNDACAO else self.tableau[origem].tamanho()
+        return Movimento(tipo, origem, inicio, destino)
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _delta_zobrist
+    # XOR que leva o hash de antes para depois de um movimento (e vice-versa)
+    # Calculado sempre na posição DEPOIS do movimento: quem registra chama
+    # após mover; desfazer chama antes de voltar as cartas
+    # ------------------------------------------------------------------
+    def _delta_zobrist(self, tipo: int, origem: int, destino: int, quantidade: int,
+                       virou: bool) -> int:
+        if tipo == MOV_DA_FUNDACAO:
+            cartas = self.tableau[destino].cartas
+            carta = cartas[-1].id
+            fund = self.fundacoes[origem].cartas
+            topo = fund[-1].id if fund else VAZIA
+            return (Z_POSICAO[carta * POSICOES_NO_TABLEAU + destino * 52 + len(cartas) - 1]
+                    ^ Z_FUNDACAO[origem * 53 + carta] ^ Z_FUNDACAO[origem * 53 + topo])
+
+        cartas_origem = self.tableau[origem].cartas
+        base_origem = origem * 52 + len(cartas_origem)
+        if tipo == MOV_TABLEAU:
+            cartas_destino = self.tableau[destino].cartas
+            inicio = len(cartas_destino) - quantidade
+            base_destino = destino * 52 + inicio
+            delta = 0
+            for k in range(quantidade):
+                pos = cartas_destino[inicio + k].id * POSICOES_NO_TABLEAU
+                delta ^= Z_POSICAO[pos + base_origem + k] ^ Z_POSICAO[pos + base_destino + k]
+        else:
+            fund = self.fundacoes[destino].cartas
+            carta = fund[-1].id
+            abaixo = fund[-2].id if len(fund) > 1 else VAZIA
+            delta = (Z_POSICAO[carta * POSICOES_NO_TABLEAU + base_origem]
+                     ^ Z_FUNDACAO[destino * 53 + carta] ^ Z_FUNDACAO[destino * 53 + abaixo])
+
+        if virou:
+            delta ^= Z_OCULTA[cartas_origem[-1].id]
+        return delta
+
+    # ------------------------------------------------------------------
+    # MÉTODOS: pode_desfazer / pode_refazer / limpar_historico
+    # ------------------------------------------------------------------
+    def pode_desfazer(self) -> bool:
+        return len(self._diario) > 0
+
+    def pode_refazer(self) -> bool:
+        return len(self._refazer) > 0 and len(self._diario) == self._refazer_em
+
+    def limpar_historico(self):
+        del self._diario[:]
+        del self._refazer[:]
+        self._refazer_em = 0
+        self._corte = None
+
+    # ------------------------------------------------------------------
+    # MÉTODO: reindexar
+    # Reconstrói o índice de movimentos de todas as colunas, os índices de
+    # cada pilha (ocultas e sequências) e o hash Zobrist
+    # Necessário depois de mexer em pilha.cartas diretamente (ex: testes)
+    # ------------------------------------------------------------------
+    def reindexar(self):
+        for pilha in self.tableau + self.fundacoes:
+            pilha.reindexar()
+        self.hash_zobrist = hash_jogo(self)
+        self._local.clear()
+        self._destinos.clear()
+        self._topos = [VAZIA] * 7
+        self._visiveis = [[] for _ in range(7)]
+        self._reindexar_colunas(*range(7))
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _reindexar_colunas
+    # Atualiza o índice só das colunas alteradas por um movimento
+    # Primeiro retira tudo o que essas colunas tinham, depois coloca de novo
+    # (uma carta pode ter saído de uma coluna e entrado na outra)
+    # ------------------------------------------------------------------
+    def _reindexar_colunas(self, *colunas: int):
+        local = self._local
+        destinos = self._destinos
+        for col in colunas:
+            for carta_id in self._visiveis[col]:
+                if local.get(carta_id, (None,))[0] == col:
+                    del local[carta_id]
+            for carta_id in CABEM_SOBRE[self._topos[col]]:
+                cols = destinos.get(carta_id)
+                if cols is not None:
+                    cols.discard(col)
+                    if not cols:
+                        del destinos[carta_id]
+
+        for col in colunas:
+            pilha = self.tableau[col]
+            cartas = pilha.cartas
+            visiveis = []
+            for j in range(pilha.ocultas, len(cartas)):
+                carta_id = cartas[j].id
+                local[carta_id] = (col, j)
+                visiveis.append(carta_id)
+            self._visiveis[col] = visiveis
+
+            topo = cartas[-1].id if cartas else VAZIA
+            self._topos[col] = topo
+            for carta_id in CABEM_SOBRE[topo]:
+                destinos.setdefault(carta_id, set()).add(col)
+
+    # ------------------------------------------------------------------
+    # MÉTODO: movimentos_legais
+    # Lista os movimentos válidos usando o índice (sem varrer as colunas)
+    # Formato e ordem iguais a EstadoCompacto.movimentos:
+    # Movimento(tipo, origem, inicio, destino); tableau → tableau,
+    # tableau → fundação, fundação → tableau
+    # Posições já vistas (ex: depois de desfazer) vêm do cache pelo hash
+    # ------------------------------------------------------------------
+    def movimentos_legais(self) -> List[Movimento]:
+        guardada = self._cache_movimentos.obter(self.hash_zobrist)
+        if guardada is not None:
+            return list(guardada)
+
+        local = self._local
+        lista = []
+
+        # TABLEAU → TABLEAU: cada carta que cabe em algum topo e está visível
+        for carta_id, cols in self._destinos.items():
+            posicao = local.get(carta_id)
+            if posicao is None:
+                continue
+            origem, inicio = posicao
+            for destino in cols:
+                if destino != origem:
+                    lista.append(Movimento(MOV_TABLEAU, origem, inicio, destino))
+        lista.sort()
+
+        # TABLEAU → FUNDAÇÃO: só olha o topo visível de cada coluna
+        for col in range(7):
+            topo = self._topos[col]
+            if topo == VAZIA or local.get(topo) is None:
+                continue
+            for fund_idx, fund in enumerate(self.fundacoes):
+                topo_fund = fund.cartas[-1].id if fund.cartas else VAZIA
+                if SEGUE_NA_FUNDACAO[topo * 53 + topo_fund]:
+                    lista.append(Movimento(MOV_PARA_FUNDACAO, col, local[topo][1], fund_idx))
+                    break
+
+        # FUNDAÇÃO → TABLEAU: o topo da fundação em cada coluna onde cabe
+        for fund_idx, fund in enumerate(self.fundacoes):
+            if fund.cartas:
+                for destino in sorted(self._destinos.get(fund.cartas[-1].id, ())):
+                    lista.append(Movimento(MOV_DA_FUNDACAO, fund_idx, 0, destino))
+
+        self._cache_movimentos.guardar(self.hash_zobrist, tuple(lista))
+        return lista
+
+    # ------------------------------------------------------------------
+    # MÉTODO: gerar_movimentos
+    # Gerador com os mesmos movimentos de movimentos_legais
+    # Uso típico (busca):
+    #   for mov in jogo.gerar_movimentos():
+    #       jogo.aplicar(mov); ...; jogo.desfazer(mov)
+    # A lista é tirada antes do primeiro yield, então aplicar/desfazer
+    # durante o laço não atrapalha a enumeração
+    # ------------------------------------------------------------------
+    def gerar_movimentos(self) -> Iterator[Movimento]:
+        yield from self.movimentos_legais()
+
     # ------------------------------------------------------------------
     # MÉTODO: verificar_vitoria
     # ------------------------------------------------------------------
@@ -154,21 +628,28 @@ class JogoYukon:
         print("="*50)
 
     # ------------------------------------------------------------------
-    # MÉTODOS DE DESFAZER
+    # MÉTODOS DE SNAPSHOT
+    # Cópia completa da posição (para desfazer jogadas, use desfazer/refazer)
+    # As cartas não guardam estado da partida: basta copiar as listas e a
+    # fronteira de ocultas de cada coluna
     # ------------------------------------------------------------------
     def salvar_estado(self):
-        """Retorna uma cópia profunda do estado atual do jogo."""
+        """Retorna uma cópia do estado atual do jogo."""
         return {
             'tableau': [pilha.cartas[:] for pilha in self.tableau],
             'fundacoes': [pilha.cartas[:] for pilha in self.fundacoes],
+            'ocultas': [pilha.ocultas for pilha in self.tableau],
         }
 
     def restaurar_estado(self, estado):
         """Restaura o estado do jogo a partir de um snapshot."""
-        # Limpa e restaura tableau
+        # Restaura tableau e fundações dentro das listas que já existem
+        # (o snapshot continua intacto para ser usado de novo)
         for i, pilha in enumerate(self.tableau):
-            pilha.cartas = estado['tableau'][i][:]
+            pilha.definir_cartas(estado['tableau'][i], estado['ocultas'][i])
 
-        # Limpa e restaura fundações
         for i, pilha in enumerate(self.fundacoes):
-            pilha.cartas = estado['fundacoes'][i][:]
\ No newline at end of file
+            pilha.definir_cartas(estado['fundacoes'][i])
+
+        self.reindexar()
+        self.limpar_historico()
\ No newline at end of file
@@ -0,0 +1,39 @@
+# src/game/movimento.py
+# Tipo de movimento compartilhado pelo JogoYukon, EstadoCompacto, solver e simulador
+# Um Movimento é uma tupla imutável (tipo, origem, inicio, destino): compara igual
+# às tuplas simples que o EstadoCompacto gera, então as duas formas se misturam
+
+from typing import NamedTuple
+
+# Tipos de movimento
+# MOV_TABLEAU:       coluna origem, índice inicial da subpilha, coluna destino
+# MOV_PARA_FUNDACAO: coluna origem, índice da carta do topo, fundação destino
+# MOV_DA_FUNDACAO:   fundação origem, 0, coluna destino
+MOV_TABLEAU = 0
+MOV_PARA_FUNDACAO = 1
+MOV_DA_FUNDACAO = 2
+
+_NOMES = {MOV_TABLEAU: "tableau", MOV_PARA_FUNDACAO: "para fundação",
+          MOV_DA_FUNDACAO: "da fundação"}
+
+
+# ----------------------------------------------------------------------
+# CLASSE: Movimento
+# Um movimento completo, com tudo o que é preciso para aplicar e desfazer
+# 'inicio' é o índice (na coluna de origem, ANTES do movimento) da primeira
+# carta movida; depois do movimento a coluna de origem tem exatamente 'inicio' cartas
+# ----------------------------------------------------------------------
+class Movimento(NamedTuple):
+    tipo: int
+    origem: int
+    inicio: int
+    destino: int
+
+    # ------------------------------------------------------------------
+    # MÉTODO ESPECIAL: __str__
+    # Ex: "tableau 3[5] → 1", "para fundação 0[0] → 2", "da fundação 2 → 4"
+    # ------------------------------------------------------------------
+    def __str__(self):
+        if self.tipo == MOV_DA_FUNDACAO:
+            return f"{_NOMES[self.tipo]} {self.origem} → {self.destino}"
+        return f"{_NOMES[self.tipo]} {self.origem}[{self.inicio}] → {self.destino}"
@@ -0,0 +1,124 @@
+# src/game/notacao.py
+# Notação de posição em uma linha (parecida com o FEN do xadrez)
+# Serve para guardar posições em texto: fixtures de teste, relatos de bug,
+# reproduções do fuzzer e listas de posições para o solver
+#
+# Formato: "<7 colunas separadas por /> <4 fundações separadas por />"
+#   - Carta: 2 caracteres, valor (A 2-9 T J Q K) + naipe (C copas, O ouros,
+#     P paus, E espadas). Ex: "AC" = Ás de copas, "TE" = 10 de espadas
+#   - Coluna: cartas do fundo para o topo; as viradas para baixo vêm antes
+#     de um "|" (sem "|" = todas viradas para cima); "-" = coluna vazia
+#   - Fundação: a carta do topo (as de baixo ficam implícitas) ou "-"
+#
+# Exemplo (distribuição inicial de um jogo):
+#   9P/3C|4E2O8C7P5O/... -/-/-/-
+#
+# Uso:
+#   texto = escrever_notacao(colunas, ocultas, fundacoes)
+#   colunas, ocultas, fundacoes = ler_notacao(texto)
+# (EstadoCompacto e JogoYukon têm de_notacao/notacao prontos)
+
+from typing import List, Sequence, Tuple
+
+from src.models.carta import NAIPE_ID, TOTAL_CARTAS, VALOR_ID, VAZIA
+
+_LETRAS_VALOR = "A23456789TJQK"
+_LETRAS_NAIPE = "COPE"  # Mesma ordem de Naipe.ORDEM
+
+# Código de 2 letras de cada id (0 a 51) e o caminho inverso
+CODIGOS = tuple(_LETRAS_VALOR[VALOR_ID[i] - 1] + _LETRAS_NAIPE[NAIPE_ID[i]]
+                for i in range(TOTAL_CARTAS))
+_ID_DO_CODIGO = {codigo: i for i, codigo in enumerate(CODIGOS)}
+
+VAZIO = "-"
+
+# Posição lida: (ids de cada coluna, fundo → topo), ocultas por coluna, topo de cada fundação
+PosicaoLida = Tuple[List[List[int]], List[int], List[int]]
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: escrever_notacao
+# Monta a linha de texto de uma posição
+# colunas: 7 sequências de ids (fundo → topo); ocultas: quantas viradas em cada uma
+# fundacoes: id do topo de cada fundação (VAZIA = vazia)
+# ------------------------------------------------------------------
+def escrever_notacao(colunas: Sequence[Sequence[int]], ocultas: Sequence[int],
+                     fundacoes: Sequence[int]) -> str:
+    partes = []
+    for cartas, n in zip(colunas, ocultas):
+        if not cartas:
+            partes.append(VAZIO)
+        elif n:
+            partes.append("".join([CODIGOS[c] for c in cartas[:n]]) + "|"
+                          + "".join([CODIGOS[c] for c in cartas[n:]]))
+        else:
+            partes.append("".join([CODIGOS[c] for c in cartas]))
+    topos = [VAZIO if f == VAZIA else CODIGOS[f] for f in fundacoes]
+    return "/".join(partes) + " " + "/".join(topos)
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO PRIVADA: _ids
+# Converte uma sequência de códigos ("AC9P...") em ids
+# ------------------------------------------------------------------
+def _ids(texto: str) -> List[int]:
+    if len(texto) % 2:
+        raise ValueError(f"Cartas inválidas: {texto!r}")
+    try:
+        return [_ID_DO_CODIGO[texto[i:i + 2]] for i in range(0, len(texto), 2)]
+    except KeyError as erro:
+        raise ValueError(f"Carta desconhecida: {erro.args[0]!r}") from None
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: ler_notacao
+# Interpreta a linha de texto (espaços nas pontas são ignorados)
+# Confere que as 52 cartas aparecem exatamente uma vez (contando as que
+# ficam implícitas embaixo do topo de cada fundação) e que o topo de toda
+# coluna com cartas está virado para cima
+# Lança ValueError se o texto não for uma posição válida
+# ------------------------------------------------------------------
+def ler_notacao(texto: str) -> PosicaoLida:
+    campos = texto.split()
+    if len(campos) != 2:
+        raise ValueError(f"Notação deve ter colunas e fundações separadas por espaço: {texto!r}")
+    textos_colunas = campos[0].split("/")
+    textos_fundacoes = campos[1].split("/")
+    if len(textos_colunas) != 7 or len(textos_fundacoes) != 4:
+        raise ValueError(f"Esperadas 7 colunas e 4 fundações: {texto!r}")
+
+    colunas = []
+    ocultas = []
+    todas = []
+    for parte in textos_colunas:
+        if parte == VAZIO:
+            colunas.append([])
+            ocultas.append(0)
+            continue
+        viradas, barra, visiveis = parte.partition("|")
+        if not barra:
+            viradas, visiveis = "", viradas
+        if not visiveis:
+            raise ValueError(f"Coluna com o topo virado para baixo: {parte!r}")
+        if len(viradas) % 2:
+            raise ValueError(f"Cartas inválidas: {parte!r}")
+        cartas = _ids(viradas + visiveis)
+        colunas.append(cartas)
+        ocultas.append(len(viradas) // 2)
+        todas += cartas
+
+    fundacoes = []
+    for parte in textos_fundacoes:
+        if parte == VAZIO:
+            fundacoes.append(VAZIA)
+            continue
+        topo = _ids(parte)
+        if len(topo) != 1:
+            raise ValueError(f"Fundação deve ter só a carta do topo: {parte!r}")
+        topo = topo[0]
+        fundacoes.append(topo)
+        todas += range(topo - VALOR_ID[topo] + 1, topo + 1)  # Do Ás até o topo
+
+    if len(todas) != TOTAL_CARTAS or len(set(todas)) != TOTAL_CARTAS:
+        raise ValueError(f"A posição deve ter as 52 cartas, cada uma uma vez: {texto!r}")
+    return colunas, ocultas, fundacoes
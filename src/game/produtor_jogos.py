@@ -0,0 +1,257 @@
+# src/game/produtor_jogos.py
+# Jogos garantidamente vencíveis e censo de quantas distribuições têm solução
+#
+# ProdutorJogos: uma thread sorteia números de distribuição, manda cada um
+# para o solver (com orçamento) em um pool de processos e guarda numa fila
+# limitada só os que o solver provou vencíveis. O NOVO JOGO da interface pega
+# o próximo da fila na hora, sem esperar o solver.
+#
+# censo: resolve N distribuições numeradas em paralelo e conta os resultados.
+# Como o solver tem orçamento, a fração vencível fica entre as vitórias
+# provadas e as vitórias + as que ficaram sem resposta.
+#
+# Uso:
+#   produtor = ProdutorJogos(capacidade=8)
+#   numero = produtor.proximo()        # None se a fila ainda está vazia
+#   produtor.encerrar()
+#
+#   python -m src.game.produtor_jogos --jogos 10000 --max-nos 20000
+
+import argparse
+import os
+import queue
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, BrokenExecutor, ProcessPoolExecutor, wait
+from typing import List, NamedTuple, Optional, Tuple
+
+from src.game.estado_compacto import EstadoCompacto
+from src.game.solver import Solver, VITORIA, DERROTA, DESCONHECIDO
+from src.models.baralho import ordem_do_jogo
+
+CAPACIDADE_PADRAO = 8        # Jogos vencíveis guardados na fila
+MAX_NOS_PADRAO = 20_000      # Orçamento do solver por distribuição
+TEMPO_LIMITE_PADRAO = 2.0    # Segundos do solver por distribuição
+MAX_NUMERO_PADRAO = 1_000_000
+TAMANHO_LOTE_CENSO = 200     # Distribuições enviadas de uma vez a um processo no censo
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: verificar_jogo
+# Resolve a distribuição 'numero' (executada dentro de cada processo)
+# Retorna (numero, status, nós usados)
+# ------------------------------------------------------------------
+def verificar_jogo(numero: int, max_nos: int = MAX_NOS_PADRAO,
+                   tempo_limite: float = TEMPO_LIMITE_PADRAO) -> Tuple[int, str, int]:
+    resultado = Solver(max_nos=max_nos, tempo_limite=tempo_limite).resolver(
+        EstadoCompacto.distribuir(ordem_do_jogo(numero)))
+    return numero, resultado.status, resultado.nos
+
+
+# ----------------------------------------------------------------------
+# CLASSE: ProdutorJogos
+# Mantém uma fila de até 'capacidade' números de distribuição provados
+# vencíveis, abastecida em segundo plano
+# semente: sorteio dos números reproduzível (None = aleatório)
+# processos: tamanho do pool (padrão: os núcleos menos um, no mínimo 1;
+#            mesmo com 1 o solver roda em outro processo e não trava a interface)
+# executor: pool já existente (o produtor não o encerra)
+# ----------------------------------------------------------------------
+class ProdutorJogos:
+    def __init__(self, capacidade: int = CAPACIDADE_PADRAO, max_nos: int = MAX_NOS_PADRAO,
+                 tempo_limite: float = TEMPO_LIMITE_PADRAO, processos: int = None,
+                 semente: Optional[int] = None, max_numero: int = MAX_NUMERO_PADRAO,
+                 executor=None):
+        self.capacidade = capacidade
+        self.max_nos = max_nos
+        self.tempo_limite = tempo_limite
+        self.processos = processos or max(1, (os.cpu_count() or 1) - 1)
+        self.max_numero = max_numero
+        self._rng = random.Random(semente)
+
+        # Contadores do que já foi verificado (um pequeno censo de graça)
+        self.verificados = 0
+        self.vencidos = 0
+        # Verificações que lançaram exceção (a thread segue abastecendo)
+        self.falhas = 0
+        self.ultimo_erro: Optional[BaseException] = None
+
+        self._fila = queue.Queue(maxsize=capacidade)
+        self._vaga = threading.Condition()  # Avisada quando alguém tira da fila
+        self._parar = threading.Event()
+        self._proprio = executor is None
+        self._executor = executor or ProcessPoolExecutor(max_workers=self.processos)
+        self._thread = threading.Thread(target=self._abastecer, name="produtor-jogos", daemon=True)
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # MÉTODO: proximo
+    # Tira um número vencível da fila
+    # espera: segundos aguardando se a fila estiver vazia (0 = não espera)
+    # Retorna None se não havia nenhum pronto
+    # ------------------------------------------------------------------
+    def proximo(self, espera: float = 0) -> Optional[int]:
+        try:
+            numero = self._fila.get(timeout=espera) if espera else self._fila.get_nowait()
+        except queue.Empty:
+            return None
+        with self._vaga:
+            self._vaga.notify()
+        return numero
+
+    # ------------------------------------------------------------------
+    # MÉTODO: prontos
+    # Quantos jogos vencíveis estão esperando na fila
+    # ------------------------------------------------------------------
+    def prontos(self) -> int:
+        return self._fila.qsize()
+
+    # ------------------------------------------------------------------
+    # MÉTODO: encerrar
+    # Para a thread e o pool (chamado ao fechar a janela)
+    # ------------------------------------------------------------------
+    def encerrar(self, espera: float = 1.0):
+        self._parar.set()
+        with self._vaga:
+            self._vaga.notify()
+        self._thread.join(espera)
+        if self._proprio:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _abastecer
+    # Laço da thread: mantém cada processo com um jogo para verificar
+    # enquanto a fila não está cheia; com a fila cheia, dorme até alguém tirar
+    # ------------------------------------------------------------------
+    def _abastecer(self):
+        pendentes = set()
+        while not self._parar.is_set():
+            with self._vaga:
+                while self._fila.full() and not self._parar.is_set():
+                    self._vaga.wait()
+            if self._parar.is_set():
+                break
+            try:
+                while len(pendentes) < self.processos:
+                    numero = self._rng.randrange(self.max_numero)
+                    pendentes.add(self._executor.submit(verificar_jogo, numero, self.max_nos,
+                                                        self.tempo_limite))
+            except BrokenExecutor as erro:
+                # Um processo morreu e levou o pool junto: recria o nosso;
+                # um pool de fora não é nosso para trocar, então para
+                self._registrar_falha(erro)
+                if not self._proprio:
+                    break
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = ProcessPoolExecutor(max_workers=self.processos)
+                continue
+            prontos, pendentes = wait(pendentes, timeout=0.2, return_when=FIRST_COMPLETED)
+            for futuro in prontos:
+                try:
+                    numero, status, _ = futuro.result()
+                except Exception as erro:
+                    self._registrar_falha(erro)
+                    continue
+                self.verificados += 1
+                if status == VITORIA:
+                    self.vencidos += 1
+                    try:
+                        self._fila.put_nowait(numero)
+                    except queue.Full:
+                        pass  # Chegou depois de a fila encher: descartado
+        for futuro in pendentes:
+            futuro.cancel()
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _registrar_falha
+    # Conta uma verificação que falhou e guarda o erro para quem quiser ver
+    # ------------------------------------------------------------------
+    def _registrar_falha(self, erro: BaseException):
+        self.falhas += 1
+        self.ultimo_erro = erro
+
+
+# ----------------------------------------------------------------------
+# CLASSE: ResultadoCenso
+# Contagem dos status do solver em 'jogos' distribuições
+# ----------------------------------------------------------------------
+class ResultadoCenso(NamedTuple):
+    jogos: int
+    vitorias: int
+    derrotas: int
+    desconhecidos: int
+    segundos: float
+
+    # Fração provada vencível (limite inferior)
+    @property
+    def fracao_minima(self) -> float:
+        return self.vitorias / self.jogos if self.jogos else 0.0
+
+    # Fração que pode ser vencível: as sem resposta podem ter solução (limite superior)
+    @property
+    def fracao_maxima(self) -> float:
+        return (self.vitorias + self.desconhecidos) / self.jogos if self.jogos else 0.0
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO PRIVADA: _censo_lote
+# Executada dentro de cada processo: status das distribuições [inicio, fim)
+# ------------------------------------------------------------------
+def _censo_lote(inicio: int, fim: int, max_nos: int, tempo_limite: float) -> List[str]:
+    return [verificar_jogo(numero, max_nos, tempo_limite)[1] for numero in range(inicio, fim)]
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: censo
+# Resolve as distribuições [primeiro_jogo, primeiro_jogo + quantidade)
+# divididas entre processos (processos=1 roda tudo no próprio processo)
+# ------------------------------------------------------------------
+def censo(quantidade: int, primeiro_jogo: int = 0, max_nos: int = MAX_NOS_PADRAO,
+          tempo_limite: float = TEMPO_LIMITE_PADRAO, processos: int = None,
+          tamanho_lote: int = TAMANHO_LOTE_CENSO) -> ResultadoCenso:
+    processos = processos or os.cpu_count() or 1
+    fim = primeiro_jogo + quantidade
+    lotes = [(inicio, min(inicio + tamanho_lote, fim), max_nos, tempo_limite)
+             for inicio in range(primeiro_jogo, fim, tamanho_lote)]
+
+    comeco = time.perf_counter()
+    contagem = {VITORIA: 0, DERROTA: 0, DESCONHECIDO: 0}
+    if processos == 1:
+        for lote in lotes:
+            for status in _censo_lote(*lote):
+                contagem[status] += 1
+    else:
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            for status_lote in executor.map(_censo_lote, *zip(*lotes)):
+                for status in status_lote:
+                    contagem[status] += 1
+    return ResultadoCenso(quantidade, contagem[VITORIA], contagem[DERROTA],
+                          contagem[DESCONHECIDO], time.perf_counter() - comeco)
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: main
+# Ponto de entrada da linha de comando (python -m src.game.produtor_jogos)
+# ------------------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Censo de distribuições vencíveis do Yukon")
+    parser.add_argument("--jogos", type=int, default=1000, help="quantidade de distribuições")
+    parser.add_argument("--primeiro-jogo", type=int, default=0, help="número da primeira distribuição")
+    parser.add_argument("--max-nos", type=int, default=MAX_NOS_PADRAO, help="orçamento do solver por jogo")
+    parser.add_argument("--tempo-limite", type=float, default=TEMPO_LIMITE_PADRAO,
+                        help="segundos do solver por jogo")
+    parser.add_argument("--processos", type=int, default=None, help="padrão: todos os núcleos")
+    args = parser.parse_args(argv)
+
+    r = censo(args.jogos, args.primeiro_jogo, args.max_nos, args.tempo_limite, args.processos)
+    print(f"Distribuições:   {r.jogos} (a partir do nº {args.primeiro_jogo})")
+    for status, total in ((VITORIA, r.vitorias), (DERROTA, r.derrotas),
+                          (DESCONHECIDO, r.desconhecidos)):
+        print(f"{status + ':':<17}{total}")
+    print(f"Vencíveis:       {r.fracao_minima:.1%} a {r.fracao_maxima:.1%}")
+    print(f"Tempo:           {r.segundos:.2f} s ({r.jogos / r.segundos:.1f} jogos/s)")
+
+
+if __name__ == "__main__":
+    main()
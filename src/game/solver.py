@@ -0,0 +1,288 @@
+# src/game/solver.py
+# Solver do Yukon: procura uma sequência de movimentos que vence o jogo
+# Técnicas usadas:
+#   - Chave canônica da posição: as colunas são intercambiáveis, então duas
+#     posições com as mesmas colunas em ordem diferente têm a mesma chave
+#   - Tabela de transposição limitada: guarda posições já exploradas sem vitória
+#   - Ordenação de movimentos: fundação e cartas viradas primeiro
+#   - Aprofundamento iterativo: limite de profundidade crescente
+#   - Orçamento de nós e de tempo: ao estourar, o resultado é DESCONHECIDO
+#   - Detector de impasse na raiz: posição sem progresso possível é DERROTA
+#     sem abrir a busca
+# Para a busca em paralelo (src/game/solver_paralelo.py), cada Solver pode
+# ter outra ordem de movimentos, desempate aleatório, um sinal de cancelamento
+# e uma tabela de posições perdidas compartilhada entre processos
+
+import hashlib
+import os
+import random
+import time
+from itertools import islice
+from typing import Callable, List, NamedTuple, Optional
+
+from src.game.cache_lru import CacheLRU
+from src.game.impasse import provar_sem_progresso
+from src.game.estado_compacto import (
+    EstadoCompacto, MOV_PARA_FUNDACAO, MOV_DA_FUNDACAO,
+    OFF_TAMANHO, OFF_OCULTAS, OFF_FUNDACAO, OFF_COLUNAS,
+)
+from src.models.carta import NAIPE_ID, VALOR_ID, VAZIA, e_segura  # e_segura: regra compartilhada
+
+# Resultados possíveis
+VITORIA = "VITORIA"            # Encontrou uma sequência vencedora
+DERROTA = "DERROTA"            # Busca completa: não existe vitória
+DESCONHECIDO = "DESCONHECIDO"  # Orçamento esgotado antes de decidir
+
+# Profundidade usada na tabela para posições perdidas em qualquer profundidade
+_SEM_LIMITE = 1 << 30
+
+# Ordens de movimentos (parâmetro 'ordem' do Solver); as duas começam pela
+# fundação e por virar cartas, e diferem em qual coluna virar primeiro
+ORDEM_FUNDAS = "FUNDAS"  # Colunas com mais cartas viradas para baixo primeiro (padrão)
+ORDEM_RASAS = "RASAS"    # Colunas com menos cartas viradas primeiro (abrem espaço antes)
+
+# Vereditos definitivos (VITORIA/DERROTA) de resolver_jogo, pelo hash Zobrist
+# da posição; DESCONHECIDO não é guardado porque depende do orçamento
+_VEREDITOS = CacheLRU(256)
+
+
+# ----------------------------------------------------------------------
+# CLASSE: ResultadoSolver
+# status: VITORIA, DERROTA ou DESCONHECIDO
+# movimentos: sequência vencedora (tuplas do EstadoCompacto), vazia se não venceu
+# ----------------------------------------------------------------------
+class ResultadoSolver(NamedTuple):
+    status: str
+    movimentos: List[tuple]
+    nos: int
+    segundos: float
+
+
+class _OrcamentoEsgotado(Exception):
+    """Interrompe a busca quando acaba o limite de nós ou de tempo."""
+
+
+# Chave da posição que ignora a ordem das colunas e das fundações
+# (o detector de impasse usa a mesma chave; ver EstadoCompacto.chave_canonica)
+chave_canonica = EstadoCompacto.chave_canonica
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: chave_estavel
+# Hash de 64 bits da chave canônica que é o mesmo em qualquer processo
+# (o hash() do Python muda de um processo para outro); nunca é 0
+# ------------------------------------------------------------------
+def chave_estavel(canonica: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(canonica, digest_size=8).digest(), "little") or 1
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: alturas_por_naipe
+# Quantas cartas de cada naipe já estão nas fundações (índice = NAIPE_ID)
+# ------------------------------------------------------------------
+def alturas_por_naipe(estado: EstadoCompacto) -> List[int]:
+    alturas = [0, 0, 0, 0]
+    for topo in estado.dados[OFF_FUNDACAO:OFF_COLUNAS]:
+        if topo != VAZIA:
+            alturas[NAIPE_ID[topo]] = VALOR_ID[topo]
+    return alturas
+
+
+# ----------------------------------------------------------------------
+# CLASSE: Solver
+# max_nos / tempo_limite: orçamento da busca inteira
+# tamanho_tabela: máximo de posições na tabela de transposição
+# profundidade_inicial: primeiro limite do aprofundamento iterativo (dobra a cada rodada)
+# ordem: ORDEM_FUNDAS ou ORDEM_RASAS (ver _ordenar)
+# semente: desempata movimentos de mesma nota ao acaso (None = ordem fixa)
+# cancelado: função consultada junto com o relógio; se retornar True, a busca
+#            para com DESCONHECIDO (ex: outro processo já resolveu)
+# tabela_compartilhada: objeto com contem(chave)/adicionar(chave) para as
+#            posições provadas perdidas, pela chave_estavel (ver solver_paralelo)
+# ----------------------------------------------------------------------
+class Solver:
+    def __init__(self, max_nos: int = 500_000, tempo_limite: float = 5.0,
+                 tamanho_tabela: int = 1_000_000, profundidade_inicial: int = 256,
+                 ordem: str = ORDEM_FUNDAS, semente: Optional[int] = None,
+                 cancelado: Optional[Callable[[], bool]] = None, tabela_compartilhada=None):
+        if ordem not in (ORDEM_FUNDAS, ORDEM_RASAS):
+            raise ValueError(f"Ordem de movimentos desconhecida: {ordem}")
+        self.max_nos = max_nos
+        self.tempo_limite = tempo_limite
+        self.tamanho_tabela = tamanho_tabela
+        self.profundidade_inicial = profundidade_inicial
+        self.ordem = ordem
+        self.cancelado = cancelado
+        self.tabela_compartilhada = tabela_compartilhada
+        self._rng = random.Random(semente) if semente is not None else None
+
+        # Tabela de transposição: hash da chave canônica → profundidade restante
+        # com que a posição já foi explorada sem achar vitória
+        self._tabela = {}
+        self._caminho = set()   # Posições na linha atual (evita ciclos)
+        self._linha = []        # Movimentos da linha atual
+        self._nos = 0
+        self._cortes = 0        # Quantas vezes o limite de profundidade cortou a busca
+        self._prazo = 0.0
+
+    # ------------------------------------------------------------------
+    # MÉTODO: resolver
+    # Procura uma vitória a partir do estado (o estado recebido não é alterado)
+    # ------------------------------------------------------------------
+    def resolver(self, estado: EstadoCompacto) -> ResultadoSolver:
+        comeco = time.perf_counter()
+        self._prazo = comeco + self.tempo_limite
+        self._nos = 0
+        self._caminho.clear()
+        self._linha = []
+
+        if provar_sem_progresso(estado):
+            return ResultadoSolver(DERROTA, [], 0, time.perf_counter() - comeco)
+
+        status = DESCONHECIDO
+        profundidade = self.profundidade_inicial
+        try:
+            while True:
+                self._cortes = 0
+                if self._buscar(estado.clone(), profundidade):
+                    status = VITORIA
+                    break
+                if self._cortes == 0:
+                    # Nenhum ramo foi cortado pela profundidade: a busca foi completa
+                    status = DERROTA
+                    break
+                profundidade *= 2
+        except _OrcamentoEsgotado:
+            self._caminho.clear()
+
+        movimentos = list(self._linha) if status == VITORIA else []
+        return ResultadoSolver(status, movimentos, self._nos, time.perf_counter() - comeco)
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _buscar
+    # Busca em profundidade limitada; retorna True se achou vitória
+    # (a linha vencedora fica em self._linha)
+    # ------------------------------------------------------------------
+    def _buscar(self, estado: EstadoCompacto, profundidade: int) -> bool:
+        self._nos += 1
+        if self._nos > self.max_nos:
+            raise _OrcamentoEsgotado()
+        if not self._nos & 1023 and (time.perf_counter() > self._prazo or (
+                self.cancelado is not None and self.cancelado())):
+            raise _OrcamentoEsgotado()
+
+        if estado.verificar_vitoria():
+            return True
+        if profundidade == 0:
+            self._cortes += 1
+            return False
+
+        canonica = chave_canonica(estado)
+        chave = hash(canonica)
+        if chave in self._caminho:
+            return False
+        explorada = self._tabela.get(chave)
+        if explorada is not None and explorada >= profundidade:
+            if explorada < _SEM_LIMITE:
+                self._cortes += 1  # Só foi explorada até um limite: mais fundo pode vencer
+            return False
+        compartilhada = self.tabela_compartilhada
+        if compartilhada is not None:
+            estavel = chave_estavel(canonica)
+            if compartilhada.contem(estavel):
+                return False  # Outro processo já provou que está perdida
+
+        self._caminho.add(chave)
+        cortes_antes = self._cortes
+        for mov in self._ordenar(estado):
+            filho = estado.clone()
+            filho.aplicar(mov)
+            self._linha.append(mov)
+            if self._buscar(filho, profundidade - 1):
+                return True
+            self._linha.pop()
+        self._caminho.discard(chave)
+
+        # Sem cortes abaixo deste nó, ele está perdido em qualquer profundidade
+        if self._cortes > cortes_antes:
+            self._guardar(chave, profundidade)
+        else:
+            self._guardar(chave, _SEM_LIMITE)
+            if compartilhada is not None:
+                compartilhada.adicionar(estavel)
+        return False
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _guardar
+    # Grava na tabela; quando ela enche, descarta o quarto mais antigo
+    # ------------------------------------------------------------------
+    def _guardar(self, chave: int, profundidade: int):
+        tabela = self._tabela
+        if len(tabela) >= self.tamanho_tabela:
+            for antiga in list(islice(tabela, max(1, self.tamanho_tabela // 4))):
+                del tabela[antiga]
+        tabela[chave] = profundidade
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _ordenar
+    # Gera os movimentos do estado na ordem em que vale a pena testá-los
+    # Um movimento seguro para a fundação é feito sozinho (não há o que perder)
+    # Com semente, movimentos de mesma nota vêm em ordem aleatória
+    # ------------------------------------------------------------------
+    def _ordenar(self, estado: EstadoCompacto) -> List[tuple]:
+        dados = estado.dados
+        alturas = None
+        pontuados = []
+        rasas = self.ordem == ORDEM_RASAS
+        for mov in estado.movimentos():
+            tipo, origem, inicio, destino = mov
+            if tipo == MOV_PARA_FUNDACAO:
+                if alturas is None:
+                    alturas = alturas_por_naipe(estado)
+                if e_segura(estado.carta(origem, inicio), alturas):
+                    return [mov]
+                nota = 0
+            elif tipo == MOV_DA_FUNDACAO:
+                nota = 5
+            else:
+                ocultas = dados[OFF_OCULTAS + origem]
+                if inicio == 0 and VALOR_ID[estado.carta(origem, 0)] == 13 \
+                        and dados[OFF_TAMANHO + destino] == 0:
+                    continue  # Rei do fundo para outra coluna vazia: não muda nada
+                if inicio == ocultas and ocultas > 0:
+                    # Vira uma carta; prefere as colunas mais fundas (ou as mais rasas)
+                    nota = 1 + ocultas / 100 if rasas else 1 - ocultas / 100
+                elif inicio == 0:
+                    nota = 2  # Esvazia uma coluna
+                else:
+                    nota = 3
+            pontuados.append((nota, mov))
+        if self._rng is not None:
+            aleatorio = self._rng.random
+            pontuados = [(nota, aleatorio(), mov) for nota, mov in pontuados]
+        pontuados.sort()
+        return [item[-1] for item in pontuados]
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: resolver_jogo
+# Atalho para resolver a posição atual de um JogoYukon
+# Os movimentos retornados usam os índices reais de colunas e fundações
+# Uma posição já decidida antes (ex: o jogador desfez até ela) não é resolvida de novo
+# processos > 1: portfólio de buscas em paralelo (ver src/game/solver_paralelo.py),
+#   no máximo um processo por núcleo: processos a mais só dividem a mesma CPU
+#   e deixam a resposta mais lenta; com um núcleo só, roda o solver padrão
+# opcoes: as do Solver (max_nos, tempo_limite, tamanho_tabela, ...), nos dois casos
+# ------------------------------------------------------------------
+def resolver_jogo(jogo, processos: int = 1, **opcoes) -> ResultadoSolver:
+    resultado = _VEREDITOS.obter(jogo.hash_zobrist)
+    if resultado is None:
+        if processos == 1:
+            resultado = Solver(**opcoes).resolver(EstadoCompacto.de_jogo(jogo))
+        else:
+            from src.game.solver_paralelo import resolver_paralelo  # Local: ele importa este módulo
+            resultado = resolver_paralelo(jogo, min(processos, os.cpu_count() or 1), **opcoes)
+        if resultado.status == DESCONHECIDO:
+            return resultado
+        _VEREDITOS.guardar(jogo.hash_zobrist, resultado)
+    return resultado._replace(movimentos=list(resultado.movimentos))
@@ -0,0 +1,250 @@
+# src/game/solver_paralelo.py
+# Solver em paralelo para UMA posição difícil ("portfólio" de buscas)
+# Cada processo roda um Solver configurado de um jeito (ordem de movimentos,
+# desempate aleatório, profundidade inicial). Quem achar a resposta primeiro
+# ganha: os outros são avisados e param.
+# Os processos dividem uma tabela de posições provadas perdidas em memória
+# compartilhada (multiprocessing.shared_memory): o que um descobriu, os
+# outros não precisam explorar de novo.
+#
+# Uso:
+#   resultado = resolver_paralelo(jogo, processos=4, tempo_limite=30)
+#   python -m src.game.solver_paralelo --jogo 9 --processos 4
+
+import argparse
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Optional
+
+from src.game.estado_compacto import EstadoCompacto
+from src.game.solver import (
+    Solver, ResultadoSolver, ORDEM_FUNDAS, ORDEM_RASAS, DESCONHECIDO,
+)
+from src.models.baralho import ordem_do_jogo
+
+POSICOES_TABELA_PADRAO = 1 << 21  # Posições na tabela compartilhada (8 bytes cada: 16 MB)
+_TENTATIVAS = 8                    # Posições vizinhas testadas antes de desistir (sondagem linear)
+_ESPERA_CANCELADO = 0.05           # Segundos entre consultas a 'cancelado' enquanto espera
+
+# Configurações do portfólio: o processo i usa PORTFOLIO[i]; o primeiro é o
+# solver padrão, então o paralelo nunca explora menos que o sequencial.
+# Ordenadas pelo que cada uma acrescenta às anteriores (medido nas
+# distribuições 2, 3, 14, 15 e 17): ORDEM_RASAS sem semente quase sempre refaz
+# a busca do padrão, e profundidade inicial pequena não respondeu nenhuma,
+# então ficam para o fim ou de fora
+PORTFOLIO = (
+    {},
+    {"semente": 6},
+    {"ordem": ORDEM_RASAS, "semente": 4, "profundidade_inicial": 1024},
+    {"ordem": ORDEM_RASAS, "semente": 2},
+    {"semente": 1},
+    {"ordem": ORDEM_RASAS},
+)
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: configuracao
+# Configuração do processo 'indice' (depois do PORTFOLIO, sementes novas
+# alternando as ordens)
+# ------------------------------------------------------------------
+def configuracao(indice: int) -> dict:
+    if indice < len(PORTFOLIO):
+        return dict(PORTFOLIO[indice])
+    return {"ordem": (ORDEM_FUNDAS, ORDEM_RASAS)[indice % 2], "semente": 100 + indice}
+
+
+# ----------------------------------------------------------------------
+# CLASSE: TabelaCompartilhada
+# Conjunto de chaves de 64 bits (chave_estavel das posições perdidas) num
+# bloco de memória compartilhada, com endereçamento aberto
+#   [0]       sinal de parada (≠ 0 = parar)
+#   [1 .. n]  chaves (0 = posição livre)
+# Sem trava: cada posição é lida/escrita inteira (8 bytes); duas escritas
+# ao mesmo tempo podem perder uma chave, o que só custa explorar de novo
+# Cheia, a tabela para de aceitar chaves (a busca continua correta)
+# nome=None cria o bloco; com nome, abre o bloco criado por outro processo
+# ----------------------------------------------------------------------
+class TabelaCompartilhada:
+    def __init__(self, posicoes: int = POSICOES_TABELA_PADRAO, nome: Optional[str] = None):
+        if posicoes & (posicoes - 1):
+            raise ValueError("A quantidade de posições deve ser uma potência de 2")
+        self.posicoes = posicoes
+        self._mascara = posicoes - 1
+        self._dono = nome is None
+        if self._dono:
+            self._memoria = shared_memory.SharedMemory(create=True, size=(posicoes + 1) * 8)
+            self._memoria.buf[:] = bytes(len(self._memoria.buf))
+        else:
+            self._memoria = shared_memory.SharedMemory(name=nome)
+        self._chaves = self._memoria.buf.cast("Q")
+        self.nome = self._memoria.name
+
+    # ------------------------------------------------------------------
+    # MÉTODOS: contem / adicionar
+    # ------------------------------------------------------------------
+    def contem(self, chave: int) -> bool:
+        chaves = self._chaves
+        i = chave & self._mascara
+        for _ in range(_TENTATIVAS):
+            atual = chaves[i + 1]
+            if atual == chave:
+                return True
+            if atual == 0:
+                return False
+            i = (i + 1) & self._mascara
+        return False
+
+    def adicionar(self, chave: int):
+        chaves = self._chaves
+        i = chave & self._mascara
+        for _ in range(_TENTATIVAS):
+            atual = chaves[i + 1]
+            if atual == chave:
+                return
+            if atual == 0:
+                chaves[i + 1] = chave
+                return
+            i = (i + 1) & self._mascara
+
+    # ------------------------------------------------------------------
+    # MÉTODOS: parar / parado
+    # Sinal para todos os processos encerrarem a busca
+    # ------------------------------------------------------------------
+    def parar(self):
+        self._chaves[0] = 1
+
+    def parado(self) -> bool:
+        return self._chaves[0] != 0
+
+    # ------------------------------------------------------------------
+    # MÉTODO: fechar
+    # Solta o bloco neste processo; quem criou também o apaga do sistema
+    # ------------------------------------------------------------------
+    def fechar(self):
+        self._chaves.release()
+        self._memoria.close()
+        if self._dono:
+            self._memoria.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *erro):
+        self.fechar()
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO PRIVADA: _trabalhar
+# Executada dentro de cada processo: um Solver do portfólio sobre a posição
+# opcoes: opções do Solver pedidas por quem chamou; as da configuração do
+#         processo vêm por cima (o processo 0 não muda nenhuma)
+# Resposta definitiva (VITORIA/DERROTA) avisa os outros processos
+# ------------------------------------------------------------------
+def _trabalhar(dados: bytes, config: dict, max_nos: int, tempo_limite: float,
+               nome_tabela: str, posicoes: int, opcoes: Optional[dict] = None) -> ResultadoSolver:
+    tabela = TabelaCompartilhada(posicoes, nome=nome_tabela)
+    try:
+        solver = Solver(max_nos=max_nos, tempo_limite=tempo_limite, cancelado=tabela.parado,
+                        tabela_compartilhada=tabela, **dict(opcoes or {}, **config))
+        resultado = solver.resolver(EstadoCompacto(bytearray(dados)))
+        if resultado.status != DESCONHECIDO:
+            tabela.parar()
+        return resultado
+    finally:
+        tabela.fechar()
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: resolver_paralelo
+# Resolve a posição com 'processos' buscas diferentes ao mesmo tempo
+# posicao: JogoYukon ou EstadoCompacto
+# max_nos / tempo_limite: orçamento de CADA processo
+# Retorna o resultado de quem respondeu primeiro, com os nós de todos somados
+# processos=1 roda só o solver padrão no próprio processo; executor permite
+# reaproveitar um pool. O padrão é um processo por núcleo: mais processos que
+# núcleos dividem a mesma CPU, e cada busca anda proporcionalmente mais devagar
+# opcoes: as demais opções do Solver (tamanho_tabela, ordem, semente...),
+#         repassadas a cada processo; 'cancelado' é consultado aqui e para todos
+# ------------------------------------------------------------------
+def resolver_paralelo(posicao, processos: int = None, max_nos: int = 500_000,
+                      tempo_limite: float = 5.0, posicoes_tabela: int = POSICOES_TABELA_PADRAO,
+                      executor=None, **opcoes) -> ResultadoSolver:
+    estado = posicao if isinstance(posicao, EstadoCompacto) else EstadoCompacto.de_jogo(posicao)
+    processos = processos or os.cpu_count() or 1
+    if processos == 1 and executor is None:
+        return Solver(max_nos=max_nos, tempo_limite=tempo_limite, **opcoes).resolver(estado)
+    if "tabela_compartilhada" in opcoes:
+        raise TypeError("resolver_paralelo cria a própria tabela compartilhada")
+    cancelado = opcoes.pop("cancelado", None)  # Função local: não vai para os processos
+
+    comeco = time.perf_counter()
+    dados = bytes(estado.dados)
+    proprio = executor is None
+    if proprio:
+        executor = ProcessPoolExecutor(max_workers=processos)
+    vencedor = None
+    nos = 0
+    try:
+        with TabelaCompartilhada(posicoes_tabela) as tabela:
+            pendentes = {executor.submit(_trabalhar, dados, configuracao(i), max_nos, tempo_limite,
+                                         tabela.nome, posicoes_tabela, opcoes)
+                         for i in range(processos)}
+            while pendentes:
+                prontos, pendentes = wait(pendentes, timeout=_ESPERA_CANCELADO if cancelado else None,
+                                          return_when=FIRST_COMPLETED)
+                if cancelado is not None and cancelado():
+                    tabela.parar()
+                for futuro in prontos:
+                    try:
+                        resultado = futuro.result()
+                    except Exception:
+                        tabela.parar()  # Erro num processo: os outros param também
+                        raise
+                    nos += resultado.nos
+                    if vencedor is None and resultado.status != DESCONHECIDO:
+                        vencedor = resultado
+                        tabela.parar()  # Os outros param na próxima consulta ao relógio
+    finally:
+        if proprio:
+            executor.shutdown()
+
+    status = vencedor.status if vencedor else DESCONHECIDO
+    movimentos = list(vencedor.movimentos) if vencedor else []
+    return ResultadoSolver(status, movimentos, nos, time.perf_counter() - comeco)
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: main
+# Ponto de entrada da linha de comando (python -m src.game.solver_paralelo)
+# Com --comparar, roda também o solver sequencial em cada distribuição e
+# mostra os tempos somados (o benchmark do portfólio)
+# ------------------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solver do Yukon em paralelo (portfólio)")
+    parser.add_argument("--jogo", type=int, default=0, help="número da (primeira) distribuição")
+    parser.add_argument("--distribuicoes", type=int, default=1, help="quantas distribuições a partir de --jogo")
+    parser.add_argument("--processos", type=int, default=None, help="padrão: todos os núcleos")
+    parser.add_argument("--max-nos", type=int, default=5_000_000, help="orçamento por processo")
+    parser.add_argument("--tempo-limite", type=float, default=60.0, help="segundos")
+    parser.add_argument("--comparar", action="store_true", help="roda também o solver sequencial")
+    args = parser.parse_args(argv)
+
+    total_paralelo = total_sequencial = 0.0
+    for numero in range(args.jogo, args.jogo + args.distribuicoes):
+        estado = EstadoCompacto.distribuir(ordem_do_jogo(numero))
+        r = resolver_paralelo(estado, args.processos, args.max_nos, args.tempo_limite)
+        total_paralelo += r.segundos
+        print(f"Jogo nº {numero}: {r.status} em {r.segundos:.2f} s, {r.nos} nós "
+              f"({len(r.movimentos)} movimentos)")
+        if args.comparar:
+            s = Solver(max_nos=args.max_nos, tempo_limite=args.tempo_limite).resolver(estado)
+            total_sequencial += s.segundos
+            print(f"Sequencial:  {s.status} em {s.segundos:.2f} s, {s.nos} nós")
+    if args.comparar and args.distribuicoes > 1:
+        print(f"Total: paralelo {total_paralelo:.2f} s, sequencial {total_sequencial:.2f} s "
+              f"({total_sequencial / total_paralelo:.2f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+# src/game/zobrist.py
+# Hash Zobrist de posições do Yukon
+# Cada "fato" da posição tem um número aleatório de 64 bits fixo:
+#   - carta X na coluna C, índice I
+#   - carta X virada para baixo no tableau
+#   - fundação F com a carta X no topo (ou vazia)
+# O hash é o XOR dos números de todos os fatos verdadeiros. Um movimento
+# muda poucos fatos, então o hash é atualizado com poucos XORs (ver JogoYukon)
+
+import random
+
+from src.models.carta import TOTAL_CARTAS, VAZIA
+
+POSICOES_POR_COLUNA = 52
+POSICOES_NO_TABLEAU = 7 * POSICOES_POR_COLUNA
+
+# Semente fixa: o mesmo hash para a mesma posição em qualquer execução
+_rng = random.Random(0x59554B4F4E)
+
+# Z_POSICAO[carta * POSICOES_NO_TABLEAU + coluna * 52 + indice]
+Z_POSICAO = tuple(_rng.getrandbits(64) for _ in range(TOTAL_CARTAS * POSICOES_NO_TABLEAU))
+# Z_OCULTA[carta]: a carta está virada para baixo
+Z_OCULTA = tuple(_rng.getrandbits(64) for _ in range(TOTAL_CARTAS))
+# Z_FUNDACAO[fundacao * 53 + topo] (topo pode ser VAZIA)
+Z_FUNDACAO = tuple(_rng.getrandbits(64) for _ in range(4 * (TOTAL_CARTAS + 1)))
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: hash_jogo
+# Calcula o hash completo de um JogoYukon (sem usar o valor incremental)
+# ------------------------------------------------------------------
+def hash_jogo(jogo) -> int:
+    h = 0
+    for col, pilha in enumerate(jogo.tableau):
+        base = col * POSICOES_POR_COLUNA
+        for idx, carta in enumerate(pilha.cartas):
+            h ^= Z_POSICAO[carta.id * POSICOES_NO_TABLEAU + base + idx]
+            if idx < pilha.ocultas:
+                h ^= Z_OCULTA[carta.id]
+    for fund_idx, fund in enumerate(jogo.fundacoes):
+        topo = fund.cartas[-1].id if fund.cartas else VAZIA
+        h ^= Z_FUNDACAO[fund_idx * 53 + topo]
+    return h
@@ -4,9 +4,18 @@
 # Silvia Brandão 2025
 
 import pygame
+import random
+import sqlite3
 import sys
 import os
 from src.game.jogo_yukon import JogoYukon
+from src.game.movimento import MOV_PARA_FUNDACAO, MOV_DA_FUNDACAO
+from src.game.cache_lru import CacheLRU
+from src.game.cache_solucoes import CacheSolucoes
+from src.game.impasse import DetectorImpasse, SEM_MOVIMENTOS, SO_REPETICOES, SEM_PROGRESSO
+from src.game.produtor_jogos import ProdutorJogos
+from src.gui.regioes_sujas import RegioesSujas
+from src.gui.servico_dicas import ServicoDicas, EVENTO_DICAS
 
 # ===================================================================
 # CONFIGURAÇÕES GLOBAIS DO JOGO
@@ -76,18 +85,34 @@ BOTAO_PAUSA_MARGEM_DIREITA = CRONOMETRO_LARGURA + 10
 TABLEAU_X_INICIAL = PAINEL_X + PAINEL_LARGURA + 20  # X inicial do tableau
 TABLEAU_Y = 20  # Y inicial do tableau
 
+# Distribuições sorteadas pela interface vão de 0 a MAX_NUMERO_JOGO - 1
+MAX_NUMERO_JOGO = 1_000_000
+
+# Quantas jogadas (empatadas na melhor nota) a dica destaca depois do cálculo com lances à frente
+DICAS_MOSTRADAS = 3
+
+# Detector de impasse: posições exploradas a cada jogada, divididas entre os
+# frames (no máximo PASSOS_IMPASSE_POR_FRAME por frame, sem travar a tela)
+LIMITE_NOS_IMPASSE = 500
+PASSOS_IMPASSE_POR_FRAME = 20
+MENSAGENS_IMPASSE = {
+    SEM_MOVIMENTOS: "Sem jogadas possíveis",
+    SEM_PROGRESSO: "Sem progresso possível",
+    SO_REPETICOES: "Só restam jogadas repetidas",
+}
+
 
 # ===================================================================
 # CLASSE PRINCIPAL DA INTERFACE GRÁFICA
 # ===================================================================
 class InterfacePygame:
-    def __init__(self):
+    def __init__(self, numero_jogo=None):
         """
         Inicializa a interface gráfica do jogo Paciência Yukon.
         Configura a janela, fontes, imagens, estado do jogo e variáveis de controle.
+        'numero_jogo' abre uma distribuição específica (None = sorteia uma).
         """
         pygame.init()
-        pygame.display.set_caption("Paciência Yukon")
 
         # Controle de tela cheia
         self.tela_cheia = False
@@ -100,6 +125,10 @@ class InterfacePygame:
         # Controle de FPS
         self.clock = pygame.time.Clock()
 
+        # Redesenho só do que mudou: cada frame atualiza na tela apenas as
+        # regiões (colunas, fundações, botões, cronômetro, arrasto) alteradas
+        self.regioes = RegioesSujas()
+
         # Fontes utilizadas no jogo
         self.fonte = pygame.font.SysFont("Arial", 24, bold=True)  # Fonte principal
         self.fonte_pequena = pygame.font.SysFont(
@@ -108,10 +137,37 @@ class InterfacePygame:
         self.fonte_vitoria = pygame.font.SysFont(
             "Arial", 48, bold=True
         )  # Fonte para mensagem de vitória
+        self.fonte_naipes = pygame.font.SysFont(
+            "Segoe UI Symbol", 16
+        )  # Fonte dos naipes nas fundações vazias
+
+        # Camada de fundo pronta (mesa, painel, título, molduras das fundações),
+        # montada uma vez e refeita só quando a tela muda de tamanho ou de modo;
+        # os botões ficam prontos por (texto, tamanho, hover)
+        self.fundo_estatico = None
+        self.botoes_prontos = {}
+        self.naipes_vazia = None  # As duas linhas de naipes das fundações vazias
+
+        # Coleta automática: depois de cada jogada, leva as cartas seguras
+        # para as fundações (Shift+A liga/desliga; A coleta uma vez)
+        self.coleta_automatica = False
+
+        # Só jogos vencíveis: um produtor em segundo plano guarda distribuições
+        # provadas vencíveis pelo solver (tecla V liga/desliga; None = desligado)
+        self.produtor_jogos = None
+        self.jogo_vencivel = False  # A partida atual veio do produtor
 
         # Carrega imagens das cartas
         self.imagens_cartas = self.carregar_imagens()
-        self.jogo = JogoYukon()  # Instancia o jogo lógico
+        self.jogo = JogoYukon(self.sortear_numero(numero_jogo))  # Instancia o jogo lógico
+        self.atualizar_titulo_janela()
+
+        # Impasse: tabela de repetições da partida, o motivo mostrado (None = nenhum)
+        # e o diagnóstico em andamento (avança um pedaço por frame)
+        self.detector_impasse = DetectorImpasse(LIMITE_NOS_IMPASSE)
+        self.impasse = None
+        self.verificacao_impasse = None
+        self.atualizar_impasse()
 
         # Estado do arrasto de cartas
         self.arrastando = False
@@ -123,7 +179,6 @@ class InterfacePygame:
         self.origem_tipo = None
 
         # Histórico para desfazer jogadas
-        self.historico = [self.jogo.salvar_estado()]
         self.ultimo_desfazer = 0
         self.DEBOUNCE_TEMPO = 300  # Evita múltiplos cliques rápidos
 
@@ -142,6 +197,15 @@ class InterfacePygame:
         # Sistema de dicas
         self.dica_ativa = False
         self.cartas_destacadas = []
+        self.cache_dicas = CacheLRU(256)  # Dicas já calculadas, pelo hash da posição
+        # Dicas com lances à frente, calculadas numa thread (chegam por EVENTO_DICAS)
+        # Vereditos do solver ficam em disco entre partidas (None se não der para abrir)
+        try:
+            self.cache_solucoes = CacheSolucoes()
+        except (sqlite3.Error, OSError):
+            self.cache_solucoes = None
+        self.servico_dicas = ServicoDicas(cache_solucoes=self.cache_solucoes)
+        self.geracao_dicas = None
 
         # --- NOVO: Controle de Pausa ---
         self.pausado = False  # Indica se o jogo está atualmente pausado
@@ -162,6 +226,8 @@ class InterfacePygame:
             self.tela = pygame.display.set_mode(
                 (self.largura_padrao, self.altura_padrao), pygame.RESIZABLE
             )
+        self.regioes.invalidar()  # Superfície nova: desenha tudo de novo
+        self.fundo_estatico = None  # e remonta a camada de fundo
 
     def carregar_imagens(self):
         """
@@ -249,11 +315,39 @@ class InterfacePygame:
 
     def desenhar_fundo(self):
         """
-        Desenha o fundo verde da mesa e o painel lateral esquerdo.
+        Desenha a camada de fundo (mesa, painel, título e molduras das
+        fundações) com um único blit, montando-a antes se a tela mudou.
+        """
+        if self.fundo_estatico is None or self.fundo_estatico.get_size() != self.tela.get_size():
+            self.montar_fundo()
+        self.tela.blit(self.fundo_estatico, (0, 0))
+
+    def montar_fundo(self):
+        """
+        Monta a camada de fundo: tudo o que não muda durante a partida.
+        Também deixa prontos os botões (normal e hover) e os naipes das
+        fundações vazias.
+        """
+        fundo = pygame.Surface(self.tela.get_size()).convert()
+        self.desenhar_painel(fundo)
+        self.desenhar_titulo(fundo)
+        self.desenhar_molduras_fundacoes(fundo)
+        self.fundo_estatico = fundo
+
+        for texto in ("DICA", "NOVO JOGO", "DESFAZER"):
+            for hover in (False, True):
+                self.botao_pronto(texto, BOTAO_LARGURA, BOTAO_ALTURA, hover)
+        for texto in ("PAUSAR", "CONTINUAR"):
+            for hover in (False, True):
+                self.botao_pronto(texto, BOTAO_PAUSA_LARGURA, BOTAO_PAUSA_ALTURA, hover)
+
+    def desenhar_painel(self, destino):
+        """
+        Desenha o fundo verde da mesa e o painel lateral esquerdo em 'destino'.
         Calcula dinamicamente a altura do painel para cobrir todas as fundações.
         """
-        self.tela.fill(VERDE_MESA)
-        largura_atual, altura_atual = self.tela.get_size()
+        destino.fill(VERDE_MESA)
+        largura_atual, altura_atual = destino.get_size()
 
         # Calcula a posição Y da última fundação
         ultima_fundacao_y = FUNDAÇÃO_Y_INICIAL + 3 * FUNDAÇÃO_ESPACO_VERTICAL
@@ -265,24 +359,33 @@ class InterfacePygame:
 
         # Desenha o retângulo do painel com borda
         painel_rect = pygame.Rect(PAINEL_X, PAINEL_Y, PAINEL_LARGURA, painel_altura)
-        pygame.draw.rect(self.tela, PAINEL_COR, painel_rect)
-        pygame.draw.rect(self.tela, PAINEL_BORDA, painel_rect, 4)
+        pygame.draw.rect(destino, PAINEL_COR, painel_rect)
+        pygame.draw.rect(destino, PAINEL_BORDA, painel_rect, 4)
+
+    def botao_pronto(self, texto, largura, altura, hover=False):
+        """
+        Superfície do botão já desenhada (cantos arredondados transparentes),
+        criada na primeira vez e guardada por (texto, largura, altura, hover).
+        """
+        chave = (texto, largura, altura, hover)
+        botao = self.botoes_prontos.get(chave)
+        if botao is None:
+            botao = pygame.Surface((largura, altura), pygame.SRCALPHA)
+            cor_fundo = HOVER_BOTAO if hover else (0, 100, 0)
+            # Desenha o retângulo do botão com cantos arredondados
+            pygame.draw.rect(botao, cor_fundo, (0, 0, largura, altura), border_radius=10)
+            pygame.draw.rect(botao, BRANCO, (0, 0, largura, altura), 3, border_radius=10)
+            txt = self.fonte_pequena.render(texto, True, BRANCO)
+            botao.blit(txt, txt.get_rect(center=(largura // 2, altura // 2)))
+            botao = botao.convert_alpha()
+            self.botoes_prontos[chave] = botao
+        return botao
 
     def desenhar_botao(self, texto, x, y, largura, altura, hover=False):
         """
-        Desenha um botão com efeito hover.
+        Desenha um botão com efeito hover (um blit da versão pronta).
         """
-        cor_fundo = HOVER_BOTAO if hover else (0, 100, 0)
-        # Desenha o retângulo do botão com cantos arredondados
-        pygame.draw.rect(
-            self.tela, cor_fundo, (x, y, largura, altura), border_radius=10
-        )
-        pygame.draw.rect(
-            self.tela, BRANCO, (x, y, largura, altura), 3, border_radius=10
-        )
-        txt = self.fonte_pequena.render(texto, True, BRANCO)
-        txt_rect = txt.get_rect(center=(x + largura // 2, y + altura // 2))
-        self.tela.blit(txt, txt_rect)
+        self.tela.blit(self.botao_pronto(texto, largura, altura, hover), (x, y))
 
     def desenhar_botao_dica(self):
         """
@@ -315,7 +418,7 @@ class InterfacePygame:
         """
         Desenha o botão "DESFAZER" apenas se houver jogadas para desfazer.
         """
-        if len(self.historico) <= 1:
+        if not self.jogo.pode_desfazer():
             return
         mouse_x, mouse_y = pygame.mouse.get_pos()
         dentro = (
@@ -333,15 +436,21 @@ class InterfacePygame:
 
     def desfazer_ultima_jogada(self):
         """
-        Restaura o estado anterior do jogo e desativa a dica.
+        Desfaz a última jogada (diário do JogoYukon) e desativa a dica.
         """
-        if len(self.historico) > 1:
-            self.historico.pop()
-            self.jogo.restaurar_estado(self.historico[-1])
-            self.dica_ativa = False
-            self.cartas_destacadas = []
+        if self.jogo.desfazer():
+            self.desativar_dica()
+            self.atualizar_impasse()
 
-    def desenhar_titulo(self):
+    def refazer_jogada(self):
+        """
+        Refaz a última jogada desfeita e desativa a dica.
+        """
+        if self.jogo.refazer():
+            self.desativar_dica()
+            self.atualizar_impasse()
+
+    def desenhar_titulo(self, destino):
         """
         Desenha o título "PACIÊNCIA YUKON" no painel, agora centralizado.
         """
@@ -360,9 +469,9 @@ class InterfacePygame:
         # YUKON: Também usa o centro X do painel.
         yuk_rect = yuk.get_rect(centerx=centro_x_painel, y=TITULO_Y + 30)
 
-        # 4. Desenha na tela
-        self.tela.blit(pac, pac_rect)
-        self.tela.blit(yuk, yuk_rect)
+        # 4. Desenha na camada de fundo
+        destino.blit(pac, pac_rect)
+        destino.blit(yuk, yuk_rect)
 
     def desenhar_tableau(self):
         """
@@ -395,33 +504,41 @@ class InterfacePygame:
                 destaque_final = destaque_dica or (
                     destaque_arrasto and not self.pausado
                 )
-                self.desenhar_carta(carta, x, y, carta.face_up, destaque_final)
+                self.desenhar_carta(carta, x, y, pilha.visivel(i), destaque_final)
+
+    def desenhar_molduras_fundacoes(self, destino):
+        """
+        Desenha em 'destino' as molduras das 4 fundações e deixa prontas as
+        linhas de naipes das vazias (as imagens das cartas têm bordas
+        translúcidas, então os naipes não podem ficar por baixo delas).
+        """
+        for i in range(4):
+            y = FUNDAÇÃO_Y_INICIAL + i * FUNDAÇÃO_ESPACO_VERTICAL
+            rect = pygame.Rect(FUNDAÇÃO_X, y, LARGURA_CARTA, ALTURA_CARTA)
+            pygame.draw.rect(destino, (0, 60, 0), rect, border_radius=12)
+            pygame.draw.rect(destino, BRANCO, rect, 3, border_radius=12)
+        if self.naipes_vazia is None:
+            cor = (200, 200, 200)
+            # Linha superior: ♠ ♥ / linha inferior: ♦ ♣ (fonte pequena para caber)
+            self.naipes_vazia = (
+                self.fonte_naipes.render("♠  ♥", True, cor),
+                self.fonte_naipes.render("♦  ♣", True, cor),
+            )
 
     def desenhar_fundacoes_vertical(self):
         """
-        Desenha as 4 fundações verticais no painel esquerdo.
+        Desenha as 4 fundações verticais no painel esquerdo (as molduras já
+        estão na camada de fundo).
         Mostra ícones dos naipes quando vazias e a carta do topo quando ocupadas.
         """
         for i, fund in enumerate(self.jogo.fundacoes):
             x = FUNDAÇÃO_X
             y = FUNDAÇÃO_Y_INICIAL + i * FUNDAÇÃO_ESPACO_VERTICAL
-            rect = pygame.Rect(x, y, LARGURA_CARTA, ALTURA_CARTA)
-            pygame.draw.rect(self.tela, (0, 60, 0), rect, border_radius=12)
-            pygame.draw.rect(self.tela, BRANCO, rect, 3, border_radius=12)
             if fund.is_vazia():
-                # Fonte pequena para caber
-                fonte = pygame.font.SysFont("Segoe UI Symbol", 16)
-                cor = (200, 200, 200)
-
-                # Linha superior: ♠ ♥
-                linha1 = fonte.render("♠  ♥", True, cor)
-                linha1_rect = linha1.get_rect(centerx=rect.centerx, y=y + 30)
-                self.tela.blit(linha1, linha1_rect)
-
-                # Linha inferior: ♦ ♣
-                linha2 = fonte.render("♦  ♣", True, cor)
-                linha2_rect = linha2.get_rect(centerx=rect.centerx, y=y + 55)
-                self.tela.blit(linha2, linha2_rect)
+                centro_x = x + LARGURA_CARTA // 2
+                linha1, linha2 = self.naipes_vazia
+                self.tela.blit(linha1, linha1.get_rect(centerx=centro_x, y=y + 30))
+                self.tela.blit(linha2, linha2.get_rect(centerx=centro_x, y=y + 55))
             else:
                 destaque = self.dica_ativa and any(
                     o == -1 and inc == i for o, inc, _ in self.cartas_destacadas
@@ -464,72 +581,49 @@ class InterfacePygame:
                         if idx == len(pilha.cartas) - 1
                         else y_inicial + (idx + 1) * SOBREPOSICAO
                     )
-                    if y_topo <= my < y_limite and carta.face_up:
+                    if y_topo <= my < y_limite and pilha.visivel(idx):
                         return col_idx, idx
         return None
 
     def calcular_dicas_completas(self):
         """
         Calcula todas as jogadas válidas possíveis para o sistema de dicas.
+        Usa o índice de movimentos do jogo em vez de varrer todas as cartas
+        e guarda o resultado pelo hash Zobrist da posição.
         """
-        self.cartas_destacadas = []
-
-        # TABLEAU → TABLEAU
-        for origem in range(7):
-            pilha = self.jogo.tableau[origem]
-            if not pilha.cartas:
-                continue
-
-            for inicio in range(len(pilha.cartas)):
-                if not pilha.cartas[inicio].face_up:
-                    continue
-
-                subpilha = [pilha.cartas[inicio]]
-                for i in range(inicio + 1, len(pilha.cartas)):
-                    proxima = pilha.cartas[i]
-                    anterior = subpilha[-1]
-                    if (
-                        proxima.valor == anterior.valor - 1
-                        and proxima.is_vermelho() != anterior.is_vermelho()
-                    ):
-                        subpilha.append(proxima)
-                    else:
-                        break
-
-                if len(subpilha) >= 1:
-                    for destino in range(7):
-                        if origem == destino:
-                            continue
-                        if self.jogo.tableau[destino].pode_adicionar_subpilha(subpilha):
-                            self.cartas_destacadas.append(
-                                (origem, inicio, len(subpilha))
-                            )
-                            break
-
-        # TABLEAU → FUNDAÇÃO
-        for col in range(7):
-            pilha = self.jogo.tableau[col]
-            if pilha.cartas and pilha.cartas[-1].face_up:
-                carta = pilha.cartas[-1]
-                for fund_idx in range(4):
-                    if self.jogo.pode_mover_para_fundacao(carta, fund_idx):
-                        self.cartas_destacadas.append((col, len(pilha.cartas) - 1, 1))
-                        break
-
-        # FUNDAÇÃO → TABLEAU
-        for fund_idx in range(4):
-            fund = self.jogo.fundacoes[fund_idx]
-            if fund.is_vazia():
-                continue
-            carta = fund.peek()
-            for col in range(7):
-                if self.jogo.tableau[col].pode_adicionar_subpilha([carta]):
-                    self.cartas_destacadas.append((-1, fund_idx, 1))
-                    break
+        guardadas = self.cache_dicas.obter(self.jogo.hash_zobrist)
+        if guardadas is not None:
+            self.cartas_destacadas = list(guardadas)
+            return
 
-    def desenhar_botao_pausa(self):
+        self.cartas_destacadas = []
+        vistos = set()
+
+        for mov in self.jogo.movimentos_legais():
+            dica = self.dica_do_movimento(mov)
+            if dica not in vistos:
+                vistos.add(dica)
+                self.cartas_destacadas.append(dica)
+
+        self.cache_dicas.guardar(self.jogo.hash_zobrist, tuple(self.cartas_destacadas))
+
+    def dica_do_movimento(self, mov):
+        """Converte um movimento no destaque (coluna, inicio, quantidade) da dica."""
+        tipo, origem, inicio, _ = mov
+        if tipo == MOV_DA_FUNDACAO:
+            # FUNDAÇÃO → TABLEAU (destaca a carta do topo da fundação)
+            return (-1, origem, 1)
+        if tipo == MOV_PARA_FUNDACAO:
+            # TABLEAU → FUNDAÇÃO (só a carta do topo)
+            return (origem, inicio, 1)
+        # TABLEAU → TABLEAU (destaca a sequência alternada que começa em 'inicio',
+        # lida do índice de sequências da pilha)
+        return (origem, inicio, self.jogo.tableau[origem].sequencia(inicio))
+
+    def retangulo_botao_pausa(self):
         """
-        Desenha o botão de Pausa/Continuar ao lado do cronômetro.
+        Retângulo do botão de Pausa/Continuar (canto inferior direito, ao lado
+        do cronômetro), usado no desenho e na detecção de cliques.
         """
         largura, altura = self.tela.get_size()
 
@@ -541,34 +635,45 @@ class InterfacePygame:
             - CRONOMETRO_MARGEM
         )
         pausa_y = altura - BOTAO_PAUSA_ALTURA - CRONOMETRO_MARGEM
+        return pygame.Rect(pausa_x, pausa_y, BOTAO_PAUSA_LARGURA, BOTAO_PAUSA_ALTURA)
 
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-        dentro = (
-            pausa_x <= mouse_x <= pausa_x + BOTAO_PAUSA_LARGURA
-            and pausa_y <= mouse_y <= pausa_y + BOTAO_PAUSA_ALTURA
-        )
+    def desenhar_botao_pausa(self):
+        """
+        Desenha o botão de Pausa/Continuar ao lado do cronômetro.
+        """
+        pausa_rect = self.retangulo_botao_pausa()
+        dentro = pausa_rect.collidepoint(pygame.mouse.get_pos())
 
         texto_botao = "PAUSAR" if not self.pausado else "CONTINUAR"
 
         # Desenha o botão usando o método existente
         self.desenhar_botao(
             texto_botao,
-            pausa_x,
-            pausa_y,
+            pausa_rect.x,
+            pausa_rect.y,
             BOTAO_PAUSA_LARGURA,
             BOTAO_PAUSA_ALTURA,
             dentro,
         )
 
-        # Retorna o retângulo para uso na detecção de cliques
-        return pygame.Rect(pausa_x, pausa_y, BOTAO_PAUSA_LARGURA, BOTAO_PAUSA_ALTURA)
-
     def tratar_eventos(self):
         for evento in pygame.event.get():
             if evento.type == pygame.QUIT:
+                self.servico_dicas.encerrar()
+                if self.cache_solucoes is not None:
+                    self.cache_solucoes.fechar()
+                if self.produtor_jogos is not None:
+                    self.produtor_jogos.encerrar()
                 pygame.quit()
                 sys.exit()
 
+            elif evento.type == EVENTO_DICAS:
+                self.receber_dicas(evento)
+
+            elif evento.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # A janela foi descoberta: o conteúdo antigo pode ter se perdido
+                self.regioes.invalidar()
+
             elif evento.type == pygame.KEYDOWN:
                 if evento.key == pygame.K_F11:
                     self.alternar_tela_cheia()
@@ -577,13 +682,28 @@ class InterfacePygame:
                 elif evento.key == pygame.K_ESCAPE:
                     self.alternar_pausa()
                     continue
+                elif evento.mod & pygame.KMOD_CTRL and not self.pausado:
+                    # Ctrl+Z desfaz; Ctrl+Y (ou Ctrl+Shift+Z) refaz
+                    if evento.key == pygame.K_y or (
+                        evento.key == pygame.K_z and evento.mod & pygame.KMOD_SHIFT
+                    ):
+                        self.refazer_jogada()
+                    elif evento.key == pygame.K_z:
+                        self.desfazer_ultima_jogada()
+                elif evento.key == pygame.K_a and not self.pausado:
+                    if evento.mod & pygame.KMOD_SHIFT:
+                        self.alternar_coleta_automatica()
+                    else:
+                        self.coletar_seguras()
+                elif evento.key == pygame.K_v:
+                    self.alternar_so_venciveis()
 
             elif evento.type == pygame.MOUSEBUTTONDOWN and evento.button == 1:
                 x, y = evento.pos
                 agora = pygame.time.get_ticks()
 
                 # TRATAMENTO DO BOTÃO PAUSA
-                pausa_rect = self.desenhar_botao_pausa()
+                pausa_rect = self.retangulo_botao_pausa()
                 if pausa_rect.collidepoint(x, y):
                     self.alternar_pausa()
                     continue
@@ -611,7 +731,7 @@ class InterfacePygame:
 
                 # Botão DESFAZER
                 if (
-                    len(self.historico) > 1
+                    self.jogo.pode_desfazer()
                     and BOTAO_DESFAZER_X <= x <= BOTAO_DESFAZER_X + BOTAO_LARGURA
                     and BOTAO_DESFAZER_Y <= y <= BOTAO_DESFAZER_Y + BOTAO_ALTURA
                     and agora - self.ultimo_desfazer > self.DEBOUNCE_TEMPO
@@ -625,8 +745,7 @@ class InterfacePygame:
                 if self.dica_ativa and (
                     tipo_clique == "tableau" or tipo_clique == "fundacao"
                 ):
-                    self.dica_ativa = False
-                    self.cartas_destacadas = []
+                    self.desativar_dica()
                     continue
 
                 # Duplo clique
@@ -651,19 +770,9 @@ class InterfacePygame:
                 resultado = self.encontrar_subpilha_clicada(x, y)
                 if resultado is not None:
                     col, idx = resultado
-                    pilha = self.jogo.tableau[col]
-                    subpilha = [pilha.cartas[idx]]
-                    for i in range(idx + 1, len(pilha.cartas)):
-                        proxima = pilha.cartas[i]
-                        anterior = subpilha[-1]
-                        if (
-                            proxima.valor == anterior.valor - 1
-                            and proxima.is_vermelho() != anterior.is_vermelho()
-                        ):
-                            subpilha.append(proxima)
-                        else:
-                            break
-                    self.subpilha_arrastada = subpilha
+                    # Vista (sem copiar) das cartas que mover_subpilha vai levar:
+                    # da carta clicada até o topo da coluna
+                    self.subpilha_arrastada = self.jogo.tableau[col].vista(idx)
                     self.origem_coluna = col
                     self.origem_indice = idx
                     self.origem_tipo = "tableau"
@@ -679,8 +788,7 @@ class InterfacePygame:
                     if tipo == "fundacao":
                         fund = self.jogo.fundacoes[idx]
                         if not fund.is_vazia():
-                            carta = fund.peek()
-                            self.subpilha_arrastada = [carta]
+                            self.subpilha_arrastada = fund.vista(fund.tamanho() - 1)
                             self.origem_coluna = idx
                             self.origem_indice = 0
                             self.origem_tipo = "fundacao"
@@ -721,30 +829,139 @@ class InterfacePygame:
                         if self.jogo.mover_da_fundacao(self.origem_coluna, idx_destino):
                             movimento_valido = True
                     if movimento_valido:
-                        self.historico.append(self.jogo.salvar_estado())
-                        if self.dica_ativa:
-                            self.dica_ativa = False
-                            self.cartas_destacadas = []
+                        self.jogada_feita()
                     self.arrastando = False
                     self.subpilha_arrastada = []
                     self.origem_coluna = None
                     self.origem_indice = None
                     self.origem_tipo = None
 
+    def jogada_feita(self):
+        """
+        Chamado depois de cada jogada do jogador: apaga a dica e, com a coleta
+        automática ligada, leva as cartas seguras para as fundações no mesmo
+        lote da jogada (um desfazer volta as duas coisas).
+        """
+        self.desativar_dica()
+        if self.coleta_automatica:
+            self.jogo.coletar_seguras(agrupar=True)
+        self.atualizar_impasse()
+
+    def coletar_seguras(self):
+        """Tecla A: leva de uma vez as cartas seguras para as fundações."""
+        if self.jogo.coletar_seguras():
+            self.desativar_dica()
+            self.atualizar_impasse()
+
+    def alternar_coleta_automatica(self):
+        """Shift+A: liga/desliga a coleta automática (mostrada no título)."""
+        self.coleta_automatica = not self.coleta_automatica
+        self.atualizar_titulo_janela()
+        if self.coleta_automatica:
+            self.coletar_seguras()
+
+    def alternar_so_venciveis(self):
+        """
+        Tecla V: liga/desliga o modo só jogos vencíveis. Ligado, o NOVO JOGO
+        pega uma distribuição já provada vencível (sem esperar o solver);
+        se nenhuma ficou pronta ainda, sorteia uma qualquer.
+        """
+        if self.produtor_jogos is None:
+            self.produtor_jogos = ProdutorJogos(max_numero=MAX_NUMERO_JOGO)
+        else:
+            self.produtor_jogos.encerrar()
+            self.produtor_jogos = None
+        self.atualizar_titulo_janela()
+
+    def atualizar_impasse(self):
+        """
+        Registra a posição atual na tabela de repetições e começa a verificar
+        se a partida ainda pode progredir. A verificação termina nos próximos
+        frames (avancar_impasse); o motivo aparece na tela quando ela acaba.
+        """
+        self.detector_impasse.registrar(self.jogo)
+        self.impasse = None
+        self.verificacao_impasse = self.detector_impasse.iniciar(self.jogo)
+        self.avancar_impasse()
+
+    def avancar_impasse(self):
+        """
+        Um pedaço da verificação de impasse por frame (chamado pelo laço
+        principal); quando ela termina, mostra o motivo.
+        """
+        verificacao = self.verificacao_impasse
+        if verificacao is not None and verificacao.avancar(PASSOS_IMPASSE_POR_FRAME):
+            self.impasse = verificacao.motivo
+            self.verificacao_impasse = None
+
     def alternar_dica(self):
-        """Alterna o estado da dica e recalcula/limpa os destaques."""
-        self.dica_ativa = not self.dica_ativa
+        """
+        Alterna o estado da dica. Ao ativar, destaca na hora todas as jogadas
+        válidas e pede ao serviço de dicas a melhor delas (sem travar o frame).
+        """
         if self.dica_ativa:
-            self.calcular_dicas_completas()
-        else:
-            self.cartas_destacadas = []
+            self.desativar_dica()
+            return
+        self.dica_ativa = True
+        self.calcular_dicas_completas()
+        if self.cartas_destacadas:
+            self.geracao_dicas = self.servico_dicas.pedir(self.jogo)
 
-    def iniciar_novo_jogo(self):
-        """Reseta o jogo para o estado inicial."""
-        self.jogo = JogoYukon()
-        self.historico = [self.jogo.salvar_estado()]
+    def desativar_dica(self):
+        """Apaga os destaques e cancela o cálculo de dicas em andamento."""
         self.dica_ativa = False
         self.cartas_destacadas = []
+        if self.geracao_dicas is not None:
+            self.servico_dicas.cancelar()
+            self.geracao_dicas = None
+
+    def receber_dicas(self, evento):
+        """
+        Resultado do serviço de dicas: destaca só as jogadas mais bem avaliadas.
+        Resultados de pedidos antigos (ou de outra posição) são ignorados.
+        """
+        if (
+            not self.dica_ativa
+            or evento.geracao != self.geracao_dicas
+            or evento.hash != self.jogo.hash_zobrist
+            or not evento.dicas
+        ):
+            return
+        self.geracao_dicas = None
+        melhor_nota = evento.dicas[0][1]
+        self.cartas_destacadas = [
+            self.dica_do_movimento(mov)
+            for mov, nota in evento.dicas[:DICAS_MOSTRADAS]
+            if nota == melhor_nota
+        ]
+
+    @staticmethod
+    def sortear_numero(numero_jogo=None):
+        """Retorna o número pedido ou sorteia um número de distribuição."""
+        if numero_jogo is not None:
+            return numero_jogo
+        return random.randrange(MAX_NUMERO_JOGO)
+
+    def atualizar_titulo_janela(self):
+        """Mostra o número da distribuição no título (para reproduzir o jogo depois)."""
+        titulo = f"Paciência Yukon — jogo nº {self.jogo.numero_jogo}"
+        if self.jogo_vencivel:
+            titulo += " (vencível)"
+        if self.produtor_jogos is not None:
+            titulo += " — só vencíveis"
+        if self.coleta_automatica:
+            titulo += " — coleta automática"
+        pygame.display.set_caption(titulo)
+
+    def iniciar_novo_jogo(self):
+        """Reseta o jogo para o estado inicial (outra distribuição, mesmas cartas)."""
+        numero = self.produtor_jogos.proximo() if self.produtor_jogos is not None else None
+        self.jogo_vencivel = numero is not None
+        self.jogo.novo_jogo(self.sortear_numero(numero))
+        self.atualizar_titulo_janela()
+        self.desativar_dica()
+        self.detector_impasse.limpar()
+        self.atualizar_impasse()
         self.primeiro_clique_feito = False
         self.cronometro_ativo = False
         self.tempo_total_ms = 0
@@ -768,8 +985,7 @@ class InterfacePygame:
                 self.cronometro_ativo = True
 
         # Garante que a dica seja desativada ao pausar/despausar para evitar inconsistências
-        self.dica_ativa = False
-        self.cartas_destacadas = []
+        self.desativar_dica()
 
     def iniciar_cronometro(self):
         """
@@ -795,20 +1011,11 @@ class InterfacePygame:
         pilha = self.jogo.tableau[col]
         if idx != len(pilha.cartas) - 1:
             return
-        carta = pilha.cartas[-1]
-        if not carta.face_up:
+        if not pilha.visivel(idx):
             return
-        for fund_idx in range(4):
-            if self.jogo.pode_mover_para_fundacao(carta, fund_idx):
-                if self.jogo.mover_para_fundacao(col, fund_idx):
-                    self.historico.append(self.jogo.salvar_estado())
-
-                    # Se houve um movimento, desativa a dica (MELHORIA ANTERIOR)
-                    if self.dica_ativa:
-                        self.dica_ativa = False
-                        self.cartas_destacadas = []
-
-                    return
+        # A própria engine escolhe a fundação onde a carta cabe
+        if self.jogo.mover_para_fundacao(col):
+            self.jogada_feita()
 
     def formatar_tempo(self, ms):
         """
@@ -818,19 +1025,30 @@ class InterfacePygame:
         segundos = (ms % 60000) // 1000
         return f"{minutos:02d}:{segundos:02d}"
 
-    def desenhar_cronometro(self):
+    def tempo_decorrido_ms(self):
         """
-        Desenha o cronômetro no canto inferior direito.
+        Tempo de jogo em milissegundos, contando o trecho em andamento.
         """
-        largura, altura = self.tela.get_size()
-        x = largura - CRONOMETRO_LARGURA - CRONOMETRO_MARGEM
-        y = altura - CRONOMETRO_ALTURA - CRONOMETRO_MARGEM
-
         tempo_atual = self.tempo_total_ms
 
         # Só atualiza o tempo se o cronômetro estiver ativo (não pausado e não vitorioso)
         if self.cronometro_ativo and self.tempo_inicio is not None:
             tempo_atual += pygame.time.get_ticks() - self.tempo_inicio
+        return tempo_atual
+
+    def retangulo_cronometro(self):
+        """Retângulo do cronômetro no canto inferior direito."""
+        largura, altura = self.tela.get_size()
+        x = largura - CRONOMETRO_LARGURA - CRONOMETRO_MARGEM
+        y = altura - CRONOMETRO_ALTURA - CRONOMETRO_MARGEM
+        return pygame.Rect(x, y, CRONOMETRO_LARGURA, CRONOMETRO_ALTURA)
+
+    def desenhar_cronometro(self):
+        """
+        Desenha o cronômetro no canto inferior direito.
+        """
+        x, y = self.retangulo_cronometro().topleft
+        tempo_atual = self.tempo_decorrido_ms()
 
         texto = self.fonte.render(self.formatar_tempo(tempo_atual), True, BRANCO)
         texto_rect = texto.get_rect(
@@ -875,6 +1093,24 @@ class InterfacePygame:
             texto_y = altura_tela // 2 - mensagem.get_height() // 2
             self.tela.blit(mensagem, (texto_x, texto_y))
 
+    def desenhar_impasse(self):
+        """
+        Avisa, embaixo do tableau, que a partida não tem mais como progredir.
+        O jogo continua liberado (o jogador ainda pode desfazer).
+        """
+        if self.impasse is None or self.pausado:
+            return
+        mensagem = self.fonte.render(MENSAGENS_IMPASSE[self.impasse], True, (255, 215, 0))
+        largura_tela, altura_tela = self.tela.get_size()
+        fundo_largura = mensagem.get_width() + 40
+        fundo_altura = mensagem.get_height() + 20
+        fundo = pygame.Surface((fundo_largura, fundo_altura), pygame.SRCALPHA)
+        fundo.fill((0, 0, 0, 180))
+        fundo_x = largura_tela // 2 - fundo_largura // 2
+        fundo_y = altura_tela - fundo_altura - CRONOMETRO_MARGEM
+        self.tela.blit(fundo, (fundo_x, fundo_y))
+        self.tela.blit(mensagem, (fundo_x + 20, fundo_y + 10))
+
     def rodar(self):
         """
         Loop principal do jogo.
@@ -882,6 +1118,7 @@ class InterfacePygame:
         """
         while True:
             self.tratar_eventos()
+            self.avancar_impasse()
 
             largura_atual, altura_atual = self.tela.get_size()
             if not self.tela_cheia and (
@@ -899,32 +1136,139 @@ class InterfacePygame:
                     False  # Garante que a mensagem de pausa não sobreponha a de vitória
                 )
 
-            self.desenhar_fundo()
-            self.desenhar_titulo()
-            self.desenhar_botao_dica()
-            self.desenhar_botao_novo_jogo()
-            self.desenhar_botao_desfazer()
-            self.desenhar_fundacoes_vertical()
-            self.desenhar_tableau()
+            # Só as regiões que mudaram são redesenhadas e enviadas para a tela
+            self.marcar_regioes()
+            retangulos = self.regioes.retangulos(self.tela.get_rect())
+            for rect in retangulos:
+                # A cena é desenhada recortada no retângulo: o que fica fora
+                # dele não é tocado, e as camadas translúcidas saem iguais
+                self.tela.set_clip(rect)
+                self.desenhar_cena()
+            self.tela.set_clip(None)
+            if retangulos:
+                pygame.display.update(retangulos)
+            self.clock.tick(FPS)
+
+    def desenhar_cena(self):
+        """
+        Desenha a cena completa, de trás para a frente. Com um recorte
+        (set_clip) ativo, só os pixels dentro dele mudam.
+        """
+        self.desenhar_fundo()
+        self.desenhar_botao_dica()
+        self.desenhar_botao_novo_jogo()
+        self.desenhar_botao_desfazer()
+        self.desenhar_fundacoes_vertical()
+        self.desenhar_tableau()
+
+        # --- NOVO: Desenho do Botão de Pausa e Cronômetro ---
+        self.desenhar_botao_pausa()
+        self.desenhar_cronometro()
+        # ----------------------------------------------------
+
+        self.desenhar_vitoria()
+        self.desenhar_impasse()
+
+        # --- NOVO: Desenho da Mensagem de Pausa ---
+        self.desenhar_mensagem_pausa()
+        # ------------------------------------------
+
+        # A subpilha arrastada só deve ser desenhada se não estiver pausado
+        if self.arrastando and not self.pausado:
+            mx, my = pygame.mouse.get_pos()
+            self.desenhar_subpilha_arrastada(mx, my)
+
+    def mouse_sobre(self, x, y, largura, altura):
+        """O mouse está sobre o retângulo (mesmo critério do hover dos botões)?"""
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+        return x <= mouse_x <= x + largura and y <= mouse_y <= y + altura
+
+    def marcar_regioes(self):
+        """
+        Descreve o que cada região da tela mostra neste frame. As que mudaram
+        desde o frame anterior (jogada, destaque, hover, segundos do
+        cronômetro, subpilha arrastada) ficam sujas e são redesenhadas.
+        """
+        tela_rect = self.tela.get_rect()
+        largura_tela, altura_tela = tela_rect.size
+
+        # Mensagens sobre a mesa (vitória, pausa, impasse) ou outro tamanho de
+        # tela: a tela inteira muda
+        vitoria = self.jogo.verificar_vitoria()
+        self.regioes.marcar(
+            "cena", (tela_rect.size, vitoria, self.pausado, self.impasse), tela_rect
+        )
 
-            # --- NOVO: Desenho do Botão de Pausa e Cronômetro ---
-            self.desenhar_botao_pausa()
-            self.desenhar_cronometro()
-            # ----------------------------------------------------
+        # Colunas do tableau: cartas, quantas viradas e os destaques
+        espaco_disponivel = largura_tela - TABLEAU_X_INICIAL - 50
+        espaco_horizontal = espaco_disponivel // 7
+        for col_idx, pilha in enumerate(self.jogo.tableau):
+            dicas = ()
+            if self.dica_ativa:
+                dicas = tuple(d for d in self.cartas_destacadas if d[0] == col_idx)
+            arrasto = (
+                self.origem_indice
+                if self.arrastando
+                and self.origem_tipo == "tableau"
+                and self.origem_coluna == col_idx
+                else None
+            )
+            x = TABLEAU_X_INICIAL + col_idx * espaco_horizontal
+            self.regioes.marcar(
+                ("coluna", col_idx),
+                (tuple(pilha.cartas), pilha.ocultas, dicas, arrasto),
+                (x, TABLEAU_Y, LARGURA_CARTA, altura_tela - TABLEAU_Y),
+            )
 
-            self.desenhar_vitoria()
+        # Fundações: carta do topo e destaque da dica
+        for i, fund in enumerate(self.jogo.fundacoes):
+            destaque = self.dica_ativa and any(
+                o == -1 and inc == i for o, inc, _ in self.cartas_destacadas
+            )
+            y = FUNDAÇÃO_Y_INICIAL + i * FUNDAÇÃO_ESPACO_VERTICAL
+            self.regioes.marcar(
+                ("fundacao", i),
+                (fund.peek(), destaque),
+                (FUNDAÇÃO_X, y, LARGURA_CARTA, ALTURA_CARTA),
+            )
 
-            # --- NOVO: Desenho da Mensagem de Pausa ---
-            self.desenhar_mensagem_pausa()
-            # ------------------------------------------
+        # Botões: hover (e se o DESFAZER aparece)
+        for nome, x, y, visivel in (
+            ("dica", BOTAO_DICA_X, BOTAO_DICA_Y, True),
+            ("novo", BOTAO_NOVO_X, BOTAO_NOVO_Y, True),
+            ("desfazer", BOTAO_DESFAZER_X, BOTAO_DESFAZER_Y, self.jogo.pode_desfazer()),
+        ):
+            self.regioes.marcar(
+                ("botao", nome),
+                (visivel, self.mouse_sobre(x, y, BOTAO_LARGURA, BOTAO_ALTURA)),
+                (x, y, BOTAO_LARGURA, BOTAO_ALTURA),
+            )
+        pausa_rect = self.retangulo_botao_pausa()
+        self.regioes.marcar(
+            ("botao", "pausa"),
+            (self.pausado, self.mouse_sobre(*pausa_rect)),
+            pausa_rect,
+        )
 
-            # A subpilha arrastada só deve ser desenhada se não estiver pausado
-            if self.arrastando and not self.pausado:
-                mx, my = pygame.mouse.get_pos()
-                self.desenhar_subpilha_arrastada(mx, my)
+        # Cronômetro: só os dígitos mostrados
+        self.regioes.marcar(
+            "cronometro",
+            self.formatar_tempo(self.tempo_decorrido_ms()),
+            self.retangulo_cronometro(),
+        )
 
-            pygame.display.flip()
-            self.clock.tick(FPS)
+        # Subpilha arrastada: apaga onde estava e desenha onde está
+        arrasto_rect = None
+        if self.arrastando and self.subpilha_arrastada and not self.pausado:
+            mx, my = pygame.mouse.get_pos()
+            n = len(self.subpilha_arrastada)
+            arrasto_rect = (
+                mx - self.offset_x,
+                my - self.offset_y,
+                LARGURA_CARTA,
+                ALTURA_CARTA + (n - 1) * SOBREPOSICAO,
+            )
+        self.regioes.marcar("arrasto", None, arrasto_rect)
 
     def desenhar_subpilha_arrastada(self, mouse_x, mouse_y):
         """
@@ -0,0 +1,76 @@
+# src/gui/regioes_sujas.py
+# Controle das regiões da tela que mudaram desde o último frame
+# A cada frame a interface descreve cada região (coluna do tableau, fundação,
+# botão, cronômetro, subpilha arrastada) por uma "assinatura" barata: o que
+# aparece nela. Só as regiões cuja assinatura ou retângulo mudou são
+# redesenhadas e enviadas com pygame.display.update(retangulos); numa mesa
+# parada, o frame não desenha nada.
+#
+# Uso:
+#   regioes = RegioesSujas()
+#   regioes.marcar("coluna 0", (cartas, ocultas, destaque), rect)
+#   for rect in regioes.retangulos(tela.get_rect()): ...redesenha recortado em rect
+#   regioes.invalidar()                  # a tela inteira no próximo frame
+
+from typing import Hashable, List
+
+import pygame
+
+
+# ----------------------------------------------------------------------
+# CLASSE: RegioesSujas
+# Guarda, por chave, a assinatura e o retângulo do frame anterior e junta
+# os retângulos que precisam ser redesenhados
+# ----------------------------------------------------------------------
+class RegioesSujas:
+    def __init__(self):
+        self._anteriores = {}  # chave → (assinatura, retângulo como tupla)
+        self._sujos = []
+        self._tudo = True      # O primeiro frame desenha a tela inteira
+
+    # ------------------------------------------------------------------
+    # MÉTODO: marcar
+    # Informa o que a região 'chave' mostra neste frame
+    # Se mudou, suja o retângulo antigo (apagar) e o novo (desenhar)
+    # rect=None: a região não aparece neste frame (ex: nada sendo arrastado)
+    # ------------------------------------------------------------------
+    def marcar(self, chave: Hashable, assinatura: Hashable, rect=None):
+        atual = (assinatura, tuple(rect) if rect is not None else None)
+        anterior = self._anteriores.get(chave)
+        if anterior == atual:
+            return
+        self._anteriores[chave] = atual
+        if anterior is not None and anterior[1] is not None:
+            self._sujos.append(pygame.Rect(anterior[1]))
+        if atual[1] is not None:
+            self._sujos.append(pygame.Rect(atual[1]))
+
+    # ------------------------------------------------------------------
+    # MÉTODO: invalidar
+    # A tela inteira será redesenhada no próximo frame (ex: tela cheia)
+    # ------------------------------------------------------------------
+    def invalidar(self):
+        self._tudo = True
+
+    # ------------------------------------------------------------------
+    # MÉTODO: retangulos
+    # Retângulos a redesenhar neste frame (recortados à tela), com os que se
+    # sobrepõem juntados num só; esvazia a lista para o próximo frame
+    # ------------------------------------------------------------------
+    def retangulos(self, tela: pygame.Rect) -> List[pygame.Rect]:
+        sujos, self._sujos = self._sujos, []
+        if self._tudo:
+            self._tudo = False
+            return [pygame.Rect(tela)]
+        juntos = []
+        for rect in sujos:
+            rect = rect.clip(tela)
+            if not rect.width or not rect.height:
+                continue
+            # Junta com os que encostarem até não sobrar sobreposição
+            i = rect.collidelist(juntos)
+            while i != -1:
+                rect.union_ip(juntos.pop(i))
+                i = rect.collidelist(juntos)
+            juntos.append(rect)
+        return juntos
@@ -0,0 +1,161 @@
+# src/gui/servico_dicas.py
+# Serviço de dicas em segundo plano
+# A interface manda uma cópia compacta da posição (EstadoCompacto) e continua
+# desenhando a 60 FPS; uma thread calcula as jogadas olhando alguns lances à
+# frente, dentro de um tempo limite, e devolve o resultado como um evento do
+# pygame (EVENTO_DICAS). Se o jogador mexer antes, o pedido é cancelado.
+# Com um CacheSolucoes, uma posição sem cartas viradas para baixo (totalmente
+# conhecida) é respondida pelo solver: primeiro pelo cache em disco; se não
+# estiver lá, resolvendo e gravando o resultado para a próxima vez.
+#
+# Uso:
+#   servico = ServicoDicas()
+#   servico.pedir(jogo)                  # não bloqueia
+#   ... no laço de eventos:
+#   if evento.type == EVENTO_DICAS: evento.dicas → [(Movimento, nota), ...]
+
+import queue
+import threading
+from typing import Callable, Optional
+
+import pygame
+
+from src.game.avaliacao import (
+    DicasCanceladas, calcular_dicas, NOTA_VITORIA, TEMPO_LIMITE_PADRAO, PROFUNDIDADE_MAXIMA_PADRAO,
+)
+from src.game.cache_solucoes import CacheSolucoes, Veredito
+from src.game.estado_compacto import EstadoCompacto
+from src.game.movimento import Movimento
+from src.game.solver import Solver, VITORIA
+
+# Evento do pygame com o resultado (atributos: geracao, hash, dicas)
+EVENTO_DICAS = pygame.USEREVENT + 1
+
+MAX_NOS_SOLVER_PADRAO = 50_000  # orçamento do solver nas posições sem cartas viradas
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO PRIVADA: _postar_evento
+# Forma padrão de entregar o resultado: um evento na fila do pygame
+# (pygame.event.post pode ser chamado de outra thread)
+# ------------------------------------------------------------------
+def _postar_evento(geracao: int, hash_posicao: int, dicas: list):
+    pygame.event.post(pygame.event.Event(
+        EVENTO_DICAS, geracao=geracao, hash=hash_posicao, dicas=dicas))
+
+
+# ----------------------------------------------------------------------
+# CLASSE: ServicoDicas
+# Uma thread de trabalho que atende um pedido por vez
+# Cada pedido recebe um número de geração; pedir de novo ou cancelar()
+# aumenta a geração, e o cálculo que estiver em andamento desiste
+# publicar: função (geracao, hash, dicas) chamada na thread de trabalho
+#           (padrão: posta EVENTO_DICAS na fila do pygame)
+# cache_solucoes: vereditos do solver guardados em disco (None = só a busca rápida)
+# ----------------------------------------------------------------------
+class ServicoDicas:
+    def __init__(self, publicar: Callable = None, tempo_limite: float = TEMPO_LIMITE_PADRAO,
+                 profundidade_maxima: int = PROFUNDIDADE_MAXIMA_PADRAO,
+                 cache_solucoes: Optional[CacheSolucoes] = None,
+                 max_nos_solver: int = MAX_NOS_SOLVER_PADRAO):
+        self.tempo_limite = tempo_limite
+        self.profundidade_maxima = profundidade_maxima
+        self.cache_solucoes = cache_solucoes
+        self.max_nos_solver = max_nos_solver
+        self._publicar = publicar or _postar_evento
+        self._pedidos = queue.Queue()
+        self._trava = threading.Lock()
+        self._geracao = 0
+        # Pedidos em que o cálculo lançou exceção (publicados sem dicas)
+        self.falhas = 0
+        self.ultimo_erro: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._trabalhar, name="servico-dicas", daemon=True)
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # MÉTODO: pedir
+    # Tira uma cópia compacta da posição do jogo e enfileira o cálculo
+    # Retorna a geração do pedido (para conferir o evento que voltar)
+    # ------------------------------------------------------------------
+    def pedir(self, jogo) -> int:
+        estado = EstadoCompacto.de_jogo(jogo)
+        with self._trava:
+            self._geracao += 1
+            geracao = self._geracao
+        self._pedidos.put((geracao, jogo.hash_zobrist, estado))
+        return geracao
+
+    # ------------------------------------------------------------------
+    # MÉTODO: cancelar
+    # Descarta o pedido em andamento (ex: o jogador fez uma jogada)
+    # ------------------------------------------------------------------
+    def cancelar(self):
+        with self._trava:
+            self._geracao += 1
+
+    # ------------------------------------------------------------------
+    # MÉTODO: atual
+    # O resultado da geração 'geracao' ainda vale?
+    # ------------------------------------------------------------------
+    def atual(self, geracao: int) -> bool:
+        return geracao == self._geracao
+
+    # ------------------------------------------------------------------
+    # MÉTODO: encerrar
+    # Para a thread (chamado ao fechar a janela)
+    # ------------------------------------------------------------------
+    def encerrar(self, espera: float = 1.0):
+        self.cancelar()
+        self._pedidos.put(None)
+        self._thread.join(espera)
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _trabalhar
+    # Laço da thread: pega o pedido mais recente, calcula e publica
+    # Um erro no cálculo publica a lista vazia (a interface fica só com o
+    # destaque imediato) e o laço segue atendendo os próximos pedidos
+    # ------------------------------------------------------------------
+    def _trabalhar(self):
+        while True:
+            pedido = self._pedidos.get()
+            if pedido is None:
+                return
+            geracao, hash_posicao, estado = pedido
+            if not self.atual(geracao):
+                continue  # Já existe um pedido mais novo (ou foi cancelado)
+            try:
+                dicas = self._dicas_do_solver(estado, geracao)
+                if dicas is None:
+                    dicas = calcular_dicas(estado, self.tempo_limite, self.profundidade_maxima,
+                                           cancelado=lambda: not self.atual(geracao))
+            except DicasCanceladas:
+                continue
+            except Exception as erro:
+                self.falhas += 1
+                self.ultimo_erro = erro
+                dicas = []
+            if self.atual(geracao):
+                self._publicar(geracao, hash_posicao, dicas)
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _dicas_do_solver
+    # Posição sem cartas viradas para baixo: consulta o cache e, se ela não
+    # estiver lá, resolve (dentro do tempo limite) e grava o resultado
+    # Retorna [(jogada vencedora, nota de vitória)] ou None (segue a busca rápida)
+    # ------------------------------------------------------------------
+    def _dicas_do_solver(self, estado: EstadoCompacto, geracao: int) -> Optional[list]:
+        cache = self.cache_solucoes
+        if cache is None or any(estado.ocultas(col) for col in range(7)):
+            return None
+        veredito = cache.consultar(estado)
+        if veredito is None:
+            resultado = Solver(max_nos=self.max_nos_solver, tempo_limite=self.tempo_limite,
+                               cancelado=lambda: not self.atual(geracao)).resolver(estado)
+            if not self.atual(geracao):
+                raise DicasCanceladas()
+            cache.guardar(estado, resultado)
+            primeiro = Movimento(*resultado.movimentos[0]) if resultado.movimentos else None
+            veredito = Veredito(resultado.status, primeiro)
+        if veredito.status == VITORIA and veredito.movimento is not None:
+            return [(veredito.movimento, NOTA_VITORIA)]
+        return None
@@ -1,21 +1,45 @@
 # src/models/baralho.py
 # Esta classe representa o baralho completo com 52 cartas
 # Responsável por: criar, embaralhar e distribuir as cartas
+# Distribuições numeradas: o mesmo número gera sempre o mesmo jogo
+# (útil para reproduzir um problema relatado ou comparar jogadores)
 
 import random  # Para embaralhar as cartas
-from typing import List
-from src.models.carta import Carta, Naipe  # Importa Carta e Naipe
+from typing import List, Optional
+from src.models.carta import Carta, Naipe, TOTAL_CARTAS  # Importa Carta e Naipe
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: ordem_do_jogo
+# Ordem das 52 cartas (ids) da distribuição número 'numero'
+# Usa um random.Random próprio, então o mesmo número gera sempre o mesmo jogo
+# (é a mesma ordem usada pelo EstadoCompacto.distribuir e pelo simulador)
+# ------------------------------------------------------------------
+def ordem_do_jogo(numero: int) -> List[int]:
+    ordem = list(range(TOTAL_CARTAS))
+    random.Random(numero).shuffle(ordem)
+    return ordem
 
 
 class Baralho:
     # ------------------------------------------------------------------
     # CONSTRUTOR
     # Cria um baralho com 52 cartas (4 naipes × 13 valores)
+    # semente: se informada, o baralho usa o próprio random.Random(semente);
+    # sem semente, usa o módulo random global (comportamento antigo)
     # ------------------------------------------------------------------
-    def __init__(self):
+    def __init__(self, semente: Optional[int] = None):
         self.cartas: List[Carta] = []  # Lista que vai guardar todas as 52 cartas
         self._criar_baralho()          # Chama o método que monta o baralho
 
+        # As cartas na ordem dos ids (a ordem de criação), para montar distribuições numeradas
+        self._por_id: List[Carta] = self.cartas[:]
+        self._rng = random.Random(semente) if semente is not None else random
+
+        # Próxima carta a distribuir: distribuir só avança o cursor,
+        # sem recortar a lista (as 52 cartas continuam no baralho para o próximo jogo)
+        self._cursor = 0
+
     # ------------------------------------------------------------------
     # MÉTODO PRIVADO: _criar_baralho
     # Cria todas as 52 cartas e coloca na lista
@@ -34,32 +58,65 @@ class Baralho:
     # MÉTODO: embaralhar
     # Embaralha as cartas de forma aleatória
     # Usa o algoritmo Fisher-Yates (padrão do Python)
+    # Recolhe antes as cartas já distribuídas (todas voltam viradas para baixo)
     # ------------------------------------------------------------------
     def embaralhar(self):
-        random.shuffle(self.cartas)  # Embaralha a lista no local
+        self._recolher()
+        self._rng.shuffle(self.cartas)  # Embaralha a lista no local
+
+    # ------------------------------------------------------------------
+    # MÉTODO: embaralhar_jogo
+    # Coloca as cartas na ordem da distribuição número 'numero'
+    # ------------------------------------------------------------------
+    def embaralhar_jogo(self, numero: int):
+        self.organizar(ordem_do_jogo(numero))
+
+    # ------------------------------------------------------------------
+    # MÉTODO: organizar
+    # Coloca as cartas numa ordem dada por ids (ex: lida do banco de jogos)
+    # ------------------------------------------------------------------
+    def organizar(self, ordem):
+        self._recolher()
+        por_id = self._por_id
+        self.cartas[:] = [por_id[i] for i in ordem]
+
+    # ------------------------------------------------------------------
+    # MÉTODO: cartas_dos_ids
+    # As cartas deste baralho com os ids dados (ex: posição lida de uma notação)
+    # ------------------------------------------------------------------
+    def cartas_dos_ids(self, ids) -> List[Carta]:
+        por_id = self._por_id
+        return [por_id[i] for i in ids]
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _recolher
+    # Junta o baralho de novo: volta o cursor (a visibilidade das cartas é
+    # definida pelas pilhas, então não há nada a desvirar)
+    # Reaproveita os mesmos 52 objetos Carta de um jogo para o outro
+    # ------------------------------------------------------------------
+    def _recolher(self):
+        self._cursor = 0
 
     # ------------------------------------------------------------------
     # MÉTODO: distribuir
-    # Remove e retorna as primeiras 'quantidade' cartas do baralho
+    # Retorna as próximas 'quantidade' cartas do baralho
     # Ex: distribuir(5) → retorna 5 cartas do topo
+    # Só avança o cursor: distribuir o baralho todo é linear, não quadrático
     # ------------------------------------------------------------------
     def distribuir(self, quantidade: int) -> List[Carta]:
-        if quantidade > len(self.cartas):
+        if quantidade > len(self):
             raise ValueError("Não há cartas suficientes no baralho")
-        
-        # Pega as primeiras 'quantidade' cartas
-        cartas_distribuidas = self.cartas[:quantidade]
-        # Remove elas do baralho
-        self.cartas = self.cartas[quantidade:]
-        # Retorna as cartas distribuídas
-        return cartas_distribuidas
+
+        inicio = self._cursor
+        self._cursor = inicio + quantidade
+        return self.cartas[inicio:self._cursor]
 
     # ------------------------------------------------------------------
     # MÉTODO ESPECIAL: __len__
     # Permite usar len(baralho) para saber quantas cartas restam
     # ------------------------------------------------------------------
     def __len__(self) -> int:
-        return len(self.cartas)
+        return len(self.cartas) - self._cursor
 
     # ------------------------------------------------------------------
     # MÉTODO ESPECIAL: __str__
@@ -67,7 +124,7 @@ class Baralho:
     # Mostra só as primeiras 10 cartas para não poluir
     # ------------------------------------------------------------------
     def __str__(self) -> str:
-        if not self.cartas:
+        if not len(self):
             return "Baralho vazio"
-        amostra = self.cartas[:10]
-        return "Baralho: " + ", ".join(str(c) for c in amostra) + ("..." if len(self.cartas) > 10 else "")
\ No newline at end of file
+        amostra = self.cartas[self._cursor:self._cursor + 10]
+        return "Baralho: " + ", ".join(str(c) for c in amostra) + ("..." if len(self) > 10 else "")
\ No newline at end of file
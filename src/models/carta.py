@@ -15,6 +15,15 @@ class Naipe:
     PAUS = "paus"         # Naipe preto
     ESPADAS = "espadas"   # Naipe preto
 
+    # Ordem fixa dos naipes (é a mesma ordem em que o Baralho cria as cartas)
+    # A posição de cada naipe nesta tupla faz parte do id inteiro da carta
+    ORDEM = (COPAS, OUROS, PAUS, ESPADAS)
+    INDICE = {COPAS: 0, OUROS: 1, PAUS: 2, ESPADAS: 3}
+
+    # Conjuntos criados uma única vez (antes era criada uma lista a cada chamada)
+    _VERMELHOS = frozenset((COPAS, OUROS))
+    _PRETOS = frozenset((PAUS, ESPADAS))
+
     # ------------------------------------------------------------------
     # MÉTODO ESTÁTICO: is_vermelho
     # Verifica se um naipe é vermelho (copas ou ouros)
@@ -22,8 +31,8 @@ class Naipe:
     # ------------------------------------------------------------------
     @staticmethod
     def is_vermelho(naipe):
-        # Verifica se o naipe está na lista de naipes vermelhos
-        return naipe in [Naipe.COPAS, Naipe.OUROS]
+        # Verifica se o naipe está no conjunto de naipes vermelhos
+        return naipe in Naipe._VERMELHOS
 
     # ------------------------------------------------------------------
     # MÉTODO ESTÁTICO: is_preto
@@ -31,16 +40,102 @@ class Naipe:
     # ------------------------------------------------------------------
     @staticmethod
     def is_preto(naipe):
-        # Verifica se o naipe está na lista de naipes pretos
-        return naipe in [Naipe.PAUS, Naipe.ESPADAS]
+        # Verifica se o naipe está no conjunto de naipes pretos
+        return naipe in Naipe._PRETOS
+
+
+# ----------------------------------------------------------------------
+# TABELAS PRÉ-CALCULADAS (cartas como números inteiros de 0 a 51)
+# id = índice_do_naipe * 13 + (valor - 1)
+# Ex: Ás de copas = 0, Rei de copas = 12, Ás de ouros = 13, Rei de espadas = 51
+# As regras do jogo consultam estas tabelas em vez de comparar strings
+# ----------------------------------------------------------------------
+TOTAL_CARTAS = 52
+
+# Id "fictício" que representa uma coluna/fundação vazia nas tabelas de regra
+VAZIA = 52
+
+# Valor (1 a 13), índice do naipe (0 a 3) e cor de cada id
+VALOR_ID = tuple(i % 13 + 1 for i in range(TOTAL_CARTAS))
+NAIPE_ID = tuple(i // 13 for i in range(TOTAL_CARTAS))
+VERMELHO_ID = tuple(i < 26 for i in range(TOTAL_CARTAS))  # copas e ouros vêm primeiro
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: id_carta
+# Converte (valor, naipe) no id inteiro da carta
+# ------------------------------------------------------------------
+def id_carta(valor: int, naipe: str) -> int:
+    return Naipe.INDICE[naipe] * 13 + (valor - 1)
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO PRIVADA: _pode_sobre
+# Regra do tableau: 'a' pode ficar sobre 'b' se for 1 menor e de cor oposta
+# Sobre uma coluna vazia (b == VAZIA) só pode ficar o Rei
+# ------------------------------------------------------------------
+def _pode_sobre(a: int, b: int) -> bool:
+    if b == VAZIA:
+        return VALOR_ID[a] == 13
+    return VALOR_ID[a] == VALOR_ID[b] - 1 and VERMELHO_ID[a] != VERMELHO_ID[b]
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO PRIVADA: _segue_na_fundacao
+# Regra da fundação: 'a' pode ficar sobre 'b' se for do mesmo naipe e 1 maior
+# Numa fundação vazia (b == VAZIA) só pode entrar o Ás
+# ------------------------------------------------------------------
+def _segue_na_fundacao(a: int, b: int) -> bool:
+    if b == VAZIA:
+        return VALOR_ID[a] == 1
+    return NAIPE_ID[a] == NAIPE_ID[b] and VALOR_ID[a] == VALOR_ID[b] + 1
+
+
+# Tabelas de regra indexadas por [a * 53 + b] (b pode ser VAZIA)
+# Ex: PODE_SOBRE[dama_copas.id * 53 + rei_paus.id] → True
+PODE_SOBRE = tuple(_pode_sobre(a, b) for a in range(TOTAL_CARTAS) for b in range(TOTAL_CARTAS + 1))
+SEGUE_NA_FUNDACAO = tuple(
+    _segue_na_fundacao(a, b) for a in range(TOTAL_CARTAS) for b in range(TOTAL_CARTAS + 1)
+)
+
+# Naipe de mesma cor de cada naipe (copas ↔ ouros, paus ↔ espadas)
+_NAIPE_PAR = (1, 0, 3, 2)
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: e_segura
+# Uma carta indo para a fundação é "segura" quando nenhuma carta do
+# tableau pode mais precisar dela: Ás e 2 sempre; as demais quando os dois
+# naipes de cor oposta já têm valor-1 e o outro naipe da mesma cor tem valor-2
+# alturas: quantas cartas de cada naipe já estão nas fundações (índice = NAIPE_ID)
+# Usada pelo solver e pela coleta automática do JogoYukon
+# ------------------------------------------------------------------
+def e_segura(carta: int, alturas) -> bool:
+    valor = VALOR_ID[carta]
+    if valor <= 2:
+        return True
+    naipe = NAIPE_ID[carta]
+    opostos = (2, 3) if naipe < 2 else (0, 1)
+    return (alturas[opostos[0]] >= valor - 1 and alturas[opostos[1]] >= valor - 1
+            and alturas[_NAIPE_PAR[naipe]] >= valor - 2)
+
+
+# Lista inversa de PODE_SOBRE: CABEM_SOBRE[b] = ids que podem ficar sobre 'b'
+# (2 cartas para um topo normal, os 4 Reis para uma coluna vazia, nenhuma sobre um Ás)
+CABEM_SOBRE = tuple(
+    tuple(a for a in range(TOTAL_CARTAS) if PODE_SOBRE[a * 53 + b]) for b in range(TOTAL_CARTAS + 1)
+)
 
 
 # ----------------------------------------------------------------------
 # CLASSE: Carta
 # Representa uma única carta do baralho
 # Exemplo: Ás de copas, 7 de paus, Rei de espadas
+# Usa __slots__ para ocupar menos memória e acessar os atributos mais rápido
 # ----------------------------------------------------------------------
 class Carta:
+    __slots__ = ("valor", "naipe", "id")
+
     # Dicionário que converte números em nomes especiais
     # 1 = Ás, 11 = Valete, 12 = Dama, 13 = Rei
     # Outros números (2 a 10) ficam como estão
@@ -55,38 +150,75 @@ class Carta:
         if valor not in range(1, 14):
             # Se não estiver, dá erro com mensagem clara
             raise ValueError("Valor deve ser de 1 a 13")
-        
+
+        # Verifica se o naipe é um dos 4 naipes conhecidos
+        if naipe not in Naipe.INDICE:
+            raise ValueError(f"Naipe inválido: {naipe}")
+
         # Salva o valor da carta (1 = Ás, 13 = Rei)
         self.valor = valor
-        
+
         # Salva o naipe da carta (ex: "copas")
         self.naipe = naipe
-        
-        # Define se a carta está virada para cima ou para baixo
-        # False = virada para baixo (não visível no jogo)
-        self.face_up = False
+
+        # Id inteiro (0 a 51) usado nas tabelas de regra
+        self.id = id_carta(valor, naipe)
+
+        # A carta não guarda se está virada para cima: quem decide o que está
+        # visível é a pilha (Pilha.ocultas). Assim a mesma carta pode estar em
+        # várias representações ao mesmo tempo sem uma interferir na outra
+        # (face_up, abaixo, é só uma visão de leitura para código antigo)
+
+    # ------------------------------------------------------------------
+    # MÉTODO DE CLASSE: da_id
+    # Retorna a carta compartilhada (flyweight) correspondente a um id
+    # São só 52 objetos para o programa inteiro: servem para representações
+    # que guardam a visibilidade por fora (ex: estados compactos, notação)
+    # ------------------------------------------------------------------
+    @classmethod
+    def da_id(cls, id_: int) -> "Carta":
+        return _CARTAS_POR_ID[id_]
+
+    # ------------------------------------------------------------------
+    # PROPRIEDADE: face_up (compatibilidade, só leitura)
+    # Se a carta está virada para cima, respondido pela pilha onde ela está
+    # (ver pilha.carta_visivel); fora de qualquer pilha, False
+    # ------------------------------------------------------------------
+    @property
+    def face_up(self) -> bool:
+        from src.models.pilha import carta_visivel  # Local: pilha importa este módulo
+        return carta_visivel(self)
 
     # ------------------------------------------------------------------
     # MÉTODO: virar
-    # Vira a carta para cima (mostra o valor e naipe)
+    # Compatibilidade: não faz nada. A carta não muda; quem decide se ela
+    # entra virada para cima ou para baixo é Pilha.push(carta, oculta=...)
     # ------------------------------------------------------------------
     def virar(self):
-        self.face_up = True  # Agora a carta está visível
+        pass
 
     # ------------------------------------------------------------------
     # MÉTODO: is_vermelho
     # Verifica se ESTA carta é vermelha
-    # Usa o método da classe Naipe
+    # Consulta a tabela pré-calculada pelo id
     # ------------------------------------------------------------------
     def is_vermelho(self):
-        return Naipe.is_vermelho(self.naipe)
+        return VERMELHO_ID[self.id]
 
     # ------------------------------------------------------------------
     # MÉTODO: is_preto
     # Verifica se ESTA carta é preta
     # ------------------------------------------------------------------
     def is_preto(self):
-        return Naipe.is_preto(self.naipe)
+        return not VERMELHO_ID[self.id]
+
+    # ------------------------------------------------------------------
+    # MÉTODO: pode_ficar_sobre
+    # Verifica se ESTA carta pode ser colocada sobre 'outra' no tableau
+    # (1 menor e cor oposta)
+    # ------------------------------------------------------------------
+    def pode_ficar_sobre(self, outra: "Carta") -> bool:
+        return PODE_SOBRE[self.id * 53 + outra.id]
 
     # ------------------------------------------------------------------
     # MÉTODO ESPECIAL: __str__
@@ -97,4 +229,8 @@ class Carta:
         # Pega o nome do valor (A, J, Q, K) ou o número normal
         valor_str = self.VALORES.get(self.valor, str(self.valor))
         # Junta o valor + " de " + naipe
-        return f"{valor_str} de {self.naipe}"
\ No newline at end of file
+        return f"{valor_str} de {self.naipe}"
+
+
+# Conjunto fixo de 52 cartas compartilhadas (uma por id), usado por Carta.da_id
+_CARTAS_POR_ID = tuple(Carta(VALOR_ID[i], Naipe.ORDEM[NAIPE_ID[i]]) for i in range(TOTAL_CARTAS))
@@ -2,8 +2,56 @@
 # Esta classe representa uma pilha de cartas (como uma coluna no jogo)
 # Usamos lista do Python para simular uma pilha: o FINAL da lista é o TOPO
 
-from typing import List, Optional
-from src.models.carta import Carta  # Importa a classe Carta que criamos antes
+import weakref
+from typing import Iterator, List, Optional, Union
+from src.models.carta import Carta, PODE_SOBRE  # Importa a classe Carta e a tabela de regras
+
+# Pilhas vivas: só para responder a visão de compatibilidade Carta.face_up
+_PILHAS = weakref.WeakSet()
+
+
+# ----------------------------------------------------------------------
+# CLASSE: VistaSubpilha
+# "Janela" sobre uma pilha: as cartas de 'inicio' até o topo, SEM copiar a lista
+# Sempre lê a pilha no momento do uso (se a pilha mudar, a vista acompanha)
+# Usada para validar movimentos e no arrasto da interface
+# ----------------------------------------------------------------------
+class VistaSubpilha:
+    __slots__ = ("pilha", "inicio")
+
+    def __init__(self, pilha: "Pilha", inicio: int):
+        self.pilha = pilha
+        self.inicio = inicio
+
+    def __len__(self) -> int:
+        return max(0, len(self.pilha.cartas) - self.inicio)
+
+    def __iter__(self) -> Iterator[Carta]:
+        cartas = self.pilha.cartas
+        for i in range(self.inicio, len(cartas)):
+            yield cartas[i]
+
+    # ------------------------------------------------------------------
+    # MÉTODO ESPECIAL: __getitem__
+    # vista[0] é a carta de baixo da subpilha; índices negativos contam do topo
+    # Fatias (vista[1:3]) retornam uma lista nova
+    # ------------------------------------------------------------------
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return list(self)[i]
+        tamanho = len(self)
+        if i < 0:
+            i += tamanho
+        if not 0 <= i < tamanho:
+            raise IndexError("Índice fora da subpilha")
+        return self.pilha.cartas[self.inicio + i]
+
+    # ------------------------------------------------------------------
+    # MÉTODO: lista
+    # Copia as cartas da vista para uma lista (quando for preciso guardar)
+    # ------------------------------------------------------------------
+    def lista(self) -> List[Carta]:
+        return self.pilha.cartas[self.inicio:]
 
 
 class Pilha:
@@ -16,28 +64,51 @@ class Pilha:
         # Índice 0 = fundo da pilha
         # Último índice = topo da pilha (carta visível)
         self.cartas: List[Carta] = []
+        # Fronteira de visibilidade: as 'ocultas' primeiras cartas estão viradas
+        # para baixo, as demais para cima. É a fonte da verdade sobre o que está
+        # visível (a Carta não guarda esse estado)
+        self.ocultas = 0
+        # Índice de sequências: _sequencia[i] = quantas cartas, a partir de i,
+        # formam uma sequência válida (decrescente e de cores alternadas).
+        # Mantido a cada push/pop/adicionar/remover; como uma sequência tem
+        # no máximo 13 cartas, cada atualização custa no máximo 13 passos
+        self._sequencia: List[int] = []
+        _PILHAS.add(self)
 
     # ------------------------------------------------------------------
     # MÉTODO: push
     # Adiciona uma carta no topo da pilha
+    # oculta=True empilha a carta virada para baixo, o que só vale enquanto
+    # a pilha inteira estiver virada para baixo (o normal é usar definir_cartas)
     # ------------------------------------------------------------------
-    def push(self, carta: Carta):
+    def push(self, carta: Carta, oculta: bool = False):
+        self._conferir()
+        if oculta:
+            if self.ocultas != len(self.cartas):
+                raise ValueError("Carta oculta só entra sobre cartas ocultas")
+            self.ocultas += 1
         self.cartas.append(carta)  # Adiciona no final da lista = topo
+        self._estender_sequencia(len(self.cartas) - 1)
 
     # ------------------------------------------------------------------
     # MÉTODO: pop
     # Remove e retorna a carta do topo
     # Se a pilha estiver vazia, retorna None
+    # virar=False só tira a carta (quem chama decide se vira a nova do topo)
     # ------------------------------------------------------------------
-    def pop(self) -> Optional[Carta]:
+    def pop(self, virar: bool = True) -> Optional[Carta]:
         if not self.cartas:  # Se vazia
             return None
         
+        self._conferir()
         carta_removida = self.cartas.pop()
+        self._cortar_sequencia(len(self.cartas))
+        if self.ocultas > len(self.cartas):
+            self.ocultas = len(self.cartas)
         
         # Regra do Yukon: se ainda houver cartas, vira a do topo
-        if self.cartas:
-            self.cartas[-1].virar()  # Vira para cima
+        if virar:
+            self.virar_topo_se_necessario()
         
         return carta_removida
 
@@ -74,53 +145,178 @@ class Pilha:
     def get_subpilha(self, inicio: int) -> List[Carta]:
         return self.cartas[inicio:]  # Do índice 'inicio' até o final
 
+    # ------------------------------------------------------------------
+    # MÉTODO: vista
+    # Como get_subpilha, mas sem copiar: retorna uma VistaSubpilha
+    # ------------------------------------------------------------------
+    def vista(self, inicio: int) -> VistaSubpilha:
+        return VistaSubpilha(self, inicio)
+
     # ------------------------------------------------------------------
     # MÉTODO: pode_adicionar_subpilha
     # Verifica se pode colocar uma subpilha (várias cartas) sobre esta pilha
     # Regras do Yukon:
     # - Se a pilha estiver vazia → só aceita Rei (valor 13)
     # - Se não → a primeira carta da subpilha deve ser 1 menor e cor alternada
+    # 'subpilha' pode ser uma lista ou uma VistaSubpilha (só a primeira carta é lida)
     # ------------------------------------------------------------------
-    def pode_adicionar_subpilha(self, subpilha: List[Carta]) -> bool:
+    def pode_adicionar_subpilha(self, subpilha: Union[List[Carta], VistaSubpilha]) -> bool:
         if not subpilha:  # Subpilha vazia?
             return False
 
         carta_base = subpilha[0]  # Primeira carta da subpilha (a que vai encostar)
 
-        if self.is_vazia():
+        if not self.cartas:
             # Coluna vazia → só aceita Rei
             return carta_base.valor == 13
         else:
-            # Pega a carta do topo atual
-            topo_atual = self.peek()
-            # Verifica: 1 menor + cor diferente
-            return (carta_base.valor == topo_atual.valor - 1 and
-                    carta_base.is_vermelho() != topo_atual.is_vermelho())
+            # Verifica na tabela: 1 menor + cor diferente do topo atual
+            return PODE_SOBRE[carta_base.id * 53 + self.cartas[-1].id]
 
     # ------------------------------------------------------------------
     # MÉTODO: adicionar_subpilha
     # Adiciona várias cartas de uma vez no topo
     # ------------------------------------------------------------------
     def adicionar_subpilha(self, subpilha: List[Carta]):
+        self._conferir()
+        inicio = len(self.cartas)
         self.cartas.extend(subpilha)  # Junta as listas
+        for i in range(inicio, len(self.cartas)):
+            self._estender_sequencia(i)
 
     # ------------------------------------------------------------------
     # MÉTODO: remover_subpilha
     # Remove uma subpilha a partir de um índice e retorna ela
     # ------------------------------------------------------------------
     def remover_subpilha(self, inicio: int):
+        self._conferir()
         subpilha = self.cartas[inicio:]   # Pega do índice até o final
-        self.cartas = self.cartas[:inicio] # Remove da pilha original
+        del self.cartas[inicio:]          # Remove da pilha original (na mesma lista)
+        self._cortar_sequencia(len(self.cartas))
+        self.ocultas = min(self.ocultas, inicio)
         return subpilha
 
+    # ------------------------------------------------------------------
+    # MÉTODO: mover_para
+    # Passa as cartas de 'inicio' até o topo para o topo de 'destino'
+    # Feito com operações de fatia nas próprias listas (sem validar regras)
+    # ------------------------------------------------------------------
+    def mover_para(self, inicio: int, destino: "Pilha"):
+        self._conferir()
+        destino._conferir()
+        base = len(destino.cartas)
+        destino.cartas.extend(self.cartas[inicio:])
+        del self.cartas[inicio:]
+        self._cortar_sequencia(len(self.cartas))
+        self.ocultas = min(self.ocultas, inicio)
+        for i in range(base, len(destino.cartas)):
+            destino._estender_sequencia(i)
+
+    # ------------------------------------------------------------------
+    # MÉTODO: definir_cartas
+    # Troca o conteúdo da pilha de uma vez: as cartas (copiadas para a
+    # lista que já existe) e quantas delas, a partir do fundo, estão ocultas
+    # Usado na distribuição e ao restaurar um snapshot
+    # ------------------------------------------------------------------
+    def definir_cartas(self, cartas: List[Carta], ocultas: int = 0):
+        self.cartas[:] = cartas
+        self.ocultas = ocultas
+        self.recalcular_sequencias()
+
+    # ------------------------------------------------------------------
+    # MÉTODO: visivel
+    # A carta do índice 'i' está virada para cima? (só uma comparação)
+    # ------------------------------------------------------------------
+    def visivel(self, i: int) -> bool:
+        return i >= self.ocultas
+
+    # ------------------------------------------------------------------
+    # MÉTODO: sequencia
+    # Tamanho da sequência válida (decrescente, cores alternadas) que começa
+    # no índice 'inicio', em O(1) (lido do índice mantido pela pilha)
+    # Ex: [K♠, Q♥, J♣, 5♦] → sequencia(0) = 3, sequencia(3) = 1
+    # ------------------------------------------------------------------
+    def sequencia(self, inicio: int) -> int:
+        self._conferir()
+        return self._sequencia[inicio]
+
+    # ------------------------------------------------------------------
+    # MÉTODO: recalcular_sequencias
+    # Refaz o índice de sequências do zero (do topo para o fundo)
+    # Necessário depois de trocar pilha.cartas diretamente (ex: setup, restaurar)
+    # ------------------------------------------------------------------
+    def recalcular_sequencias(self):
+        cartas = self.cartas
+        sequencia = [1] * len(cartas)
+        for i in range(len(cartas) - 2, -1, -1):
+            if PODE_SOBRE[cartas[i + 1].id * 53 + cartas[i].id]:
+                sequencia[i] = sequencia[i + 1] + 1
+        self._sequencia = sequencia
+
+    # ------------------------------------------------------------------
+    # MÉTODO: reindexar
+    # Acerta a fronteira de ocultas e refaz o índice de sequências
+    # Necessário depois de mexer em pilha.cartas diretamente (ex: testes)
+    # ------------------------------------------------------------------
+    def reindexar(self):
+        self.ocultas = min(self.ocultas, len(self.cartas))
+        self.recalcular_sequencias()
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _conferir
+    # Se alguém mexeu em pilha.cartas por fora (append/pop/clear na lista),
+    # os tamanhos não batem: acerta os índices antes de usá-los
+    # ------------------------------------------------------------------
+    def _conferir(self):
+        if len(self._sequencia) != len(self.cartas):
+            self.reindexar()
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _estender_sequencia
+    # A carta do índice 'topo' acabou de entrar: se ela encaixa na de baixo,
+    # todas as sequências que chegavam ao topo anterior crescem 1
+    # ------------------------------------------------------------------
+    def _estender_sequencia(self, topo: int):
+        sequencia = self._sequencia
+        sequencia.append(1)
+        if topo and PODE_SOBRE[self.cartas[topo].id * 53 + self.cartas[topo - 1].id]:
+            i = topo - 1
+            while i >= 0 and sequencia[i] == topo - i:
+                sequencia[i] += 1
+                i -= 1
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _cortar_sequencia
+    # A pilha passou a ter 'tamanho' cartas: descarta o índice acima disso
+    # e encurta as sequências que passavam do novo topo
+    # ------------------------------------------------------------------
+    def _cortar_sequencia(self, tamanho: int):
+        sequencia = self._sequencia
+        del sequencia[tamanho:]
+        i = tamanho - 1
+        while i >= 0 and sequencia[i] > tamanho - i:
+            sequencia[i] = tamanho - i
+            i -= 1
+
     # ------------------------------------------------------------------
     # MÉTODO: virar_topo_se_necessario
     # Depois de remover uma carta, se a nova carta do topo estiver virada para baixo,
-    # vira ela para cima automaticamente
+    # vira ela para cima automaticamente (a fronteira de ocultas desce 1)
+    # Retorna True se virou alguma carta
     # ------------------------------------------------------------------
-    def virar_topo_se_necessario(self):
-        if self.cartas and not self.cartas[-1].face_up:
-            self.cartas[-1].virar()  # Vira a nova carta do topo
+    def virar_topo_se_necessario(self) -> bool:
+        if self.cartas and self.ocultas >= len(self.cartas):
+            self.ocultas = len(self.cartas) - 1
+            return True
+        return False
+
+    # ------------------------------------------------------------------
+    # MÉTODO: esconder_topo
+    # O contrário de virar_topo_se_necessario (usado ao desfazer um movimento)
+    # ------------------------------------------------------------------
+    def esconder_topo(self):
+        if self.cartas:
+            self.ocultas = len(self.cartas)
 
     # ------------------------------------------------------------------
     # MÉTODO ESPECIAL: __str__
@@ -129,11 +325,26 @@ class Pilha:
     # XX = carta virada para baixo
     # ------------------------------------------------------------------
     def __str__(self):
-        # Para cada carta: se face_up → mostra, senão → "XX"
+        # Para cada carta: se visível → mostra, senão → "XX"
         partes = []
-        for carta in self.cartas:
-            if carta.face_up:
+        for i, carta in enumerate(self.cartas):
+            if i >= self.ocultas:
                 partes.append(str(carta))
             else:
                 partes.append("XX")
-        return " | ".join(partes)
\ No newline at end of file
+        return " | ".join(partes)
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: carta_visivel
+# Responde Carta.face_up (código antigo): procura a carta nas pilhas vivas
+# e pergunta à pilha onde ela está; fora de qualquer pilha, False
+# Uma carta compartilhada (Carta.da_id) em várias pilhas responde pela
+# primeira encontrada. O motor não usa: ele lê Pilha.visivel / Pilha.ocultas
+# ------------------------------------------------------------------
+def carta_visivel(carta: Carta) -> bool:
+    for pilha in list(_PILHAS):
+        for i, outra in enumerate(pilha.cartas):
+            if outra is carta:
+                return pilha.visivel(i)
+    return False
@@ -0,0 +1,7 @@
+# src/sim/__main__.py
+# Permite rodar o simulador com: python -m src.sim
+
+from src.sim.simulador import main
+
+if __name__ == "__main__":
+    main()
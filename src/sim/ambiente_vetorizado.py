@@ -0,0 +1,390 @@
+# src/sim/ambiente_vetorizado.py
+# Ambiente vetorizado: N partidas de Yukon andando juntas em arrays NumPy
+# Feito para treinar e avaliar bots, que jogam milhares de partidas ao mesmo
+# tempo; em vez de uma chamada Python por jogo, cada passo é um punhado de
+# operações sobre arrays com todos os jogos
+#
+# Estado (N = quantidade de jogos):
+#   cartas  (N, 7, 52) ids das cartas de cada coluna, fundo → topo (VAZIA depois do topo)
+#   tamanho (N, 7)     cartas em cada coluna
+#   ocultas (N, 7)     cartas viradas para baixo no fundo de cada coluna
+#   alturas (N, 4)     cartas na fundação de cada naipe (índice = NAIPE_ID)
+#   posicao (N, 53)    coluna * 52 + índice de cada carta virada para cima no
+#                      tableau, -1 para as demais (a coluna 52 = VAZIA fica sempre -1)
+#
+# Os movimentos válidos não varrem o tableau: para cada topo de coluna há no
+# máximo 4 cartas que cabem nele (CABEM_SOBRE), e 'posicao' diz onde estão.
+# Cada jogo tem então 63 candidatos (28 tableau, 7 para a fundação, 28 da fundação)
+#
+# Ações (um inteiro por jogo; -1 = não joga neste passo):
+#   [0, 2548)     tableau → tableau: (origem * 52 + inicio) * 7 + destino
+#   [2548, 2555)  tableau → fundação: coluna (a fundação é a do naipe da carta)
+#   [2555, 2583)  fundação → tableau: naipe * 7 + destino
+#
+# Requer numpy (pip install numpy); o resto do jogo não depende dele
+#
+# Uso: python -m src.sim.ambiente_vetorizado --jogos 4096 --passos 200
+
+import argparse
+import time
+
+try:
+    import numpy as np
+except ImportError as erro:  # pragma: no cover - depende do ambiente
+    raise ImportError("O ambiente vetorizado precisa do numpy: pip install numpy") from erro
+
+from src.game.estado_compacto import (
+    EstadoCompacto, MOV_TABLEAU, MOV_PARA_FUNDACAO, MOV_DA_FUNDACAO,
+    OFF_TAMANHO, OFF_OCULTAS, OFF_FUNDACAO, OFF_COLUNAS, POSICOES_POR_COLUNA,
+    TAMANHOS_INICIAIS, OCULTAS_INICIAIS,
+)
+from src.models.baralho import ordem_do_jogo
+from src.models.carta import CABEM_SOBRE, PODE_SOBRE, NAIPE_ID, VALOR_ID, TOTAL_CARTAS, VAZIA
+
+ACOES_TABLEAU = 7 * 52 * 7
+ACOES_PARA_FUNDACAO = 7
+ACOES_DA_FUNDACAO = 4 * 7
+INICIO_PARA_FUNDACAO = ACOES_TABLEAU
+INICIO_DA_FUNDACAO = ACOES_TABLEAU + ACOES_PARA_FUNDACAO
+TOTAL_ACOES = INICIO_DA_FUNDACAO + ACOES_DA_FUNDACAO
+
+# ----------------------------------------------------------------------
+# TABELAS DE REGRA EM FORMA DE ARRAY (índice = id da carta, 52 = VAZIA)
+# CABEM: as cartas que podem ficar sobre cada topo (a mesma regra de
+#        PODE_SOBRE / Pilha.pode_adicionar_subpilha), completadas com VAZIA
+# ----------------------------------------------------------------------
+VALOR = np.array(VALOR_ID + (0,), dtype=np.int8)
+NAIPE = np.array(NAIPE_ID + (0,), dtype=np.intp)
+CABEM = np.array([cabem + (VAZIA,) * (4 - len(cabem)) for cabem in CABEM_SOBRE], dtype=np.intp)
+# PODE[a, b] = PODE_SOBRE[a * 53 + b]; a linha VAZIA (nenhuma carta) é toda False
+PODE = np.zeros((TOTAL_CARTAS + 1, TOTAL_CARTAS + 1), dtype=bool)
+PODE[:TOTAL_CARTAS] = np.array(PODE_SOBRE, dtype=bool).reshape(TOTAL_CARTAS, TOTAL_CARTAS + 1)
+
+# Quantidade de candidatos por jogo em acoes_candidatas
+CANDIDATOS = 7 * 4 + 7 + 4 * 7
+
+# Coluna e índice de cada posição da ordem de distribuição (mesma de EstadoCompacto.distribuir)
+_COLUNA_DA_POSICAO = np.repeat(np.arange(7), TAMANHOS_INICIAIS)
+_INDICE_DA_POSICAO = np.concatenate([np.arange(t) for t in TAMANHOS_INICIAIS])
+_POSICAO_NA_DISTRIBUICAO = _COLUNA_DA_POSICAO * 52 + _INDICE_DA_POSICAO
+_VISIVEL_NA_DISTRIBUICAO = _INDICE_DA_POSICAO >= np.array(OCULTAS_INICIAIS)[_COLUNA_DA_POSICAO]
+
+_INDICES = np.arange(52)
+_COLUNAS = np.arange(7)
+_NAIPES = np.arange(4)
+_ACOES_DA_FUNDACAO = INICIO_DA_FUNDACAO + _NAIPES[:, None] * 7 + _COLUNAS
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: codificar_acao
+# Converte (tipo, origem, inicio, destino) no inteiro da ação
+# Para MOV_PARA_FUNDACAO só a coluna importa; para MOV_DA_FUNDACAO a
+# origem é o NAIPE (índice em Naipe.ORDEM), não a posição da fundação
+# ------------------------------------------------------------------
+def codificar_acao(tipo: int, origem: int, inicio: int = 0, destino: int = 0) -> int:
+    if tipo == MOV_TABLEAU:
+        return (origem * 52 + inicio) * 7 + destino
+    if tipo == MOV_PARA_FUNDACAO:
+        return INICIO_PARA_FUNDACAO + origem
+    return INICIO_DA_FUNDACAO + origem * 7 + destino
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: decodificar_acao
+# Inverso de codificar_acao: retorna (tipo, origem, inicio, destino)
+# (inicio e destino valem 0 quando o tipo não usa)
+# ------------------------------------------------------------------
+def decodificar_acao(acao: int) -> tuple:
+    if acao < INICIO_PARA_FUNDACAO:
+        return MOV_TABLEAU, acao // 364, acao // 7 % 52, acao % 7
+    if acao < INICIO_DA_FUNDACAO:
+        return MOV_PARA_FUNDACAO, acao - INICIO_PARA_FUNDACAO, 0, 0
+    acao -= INICIO_DA_FUNDACAO
+    return MOV_DA_FUNDACAO, acao // 7, 0, acao % 7
+
+
+# ----------------------------------------------------------------------
+# CLASSE: AmbienteVetorizado
+# n_jogos: quantas partidas andam juntas
+# primeiro_jogo: o jogo i começa com a distribuição primeiro_jogo + i
+# ----------------------------------------------------------------------
+class AmbienteVetorizado:
+    def __init__(self, n_jogos: int, primeiro_jogo: int = 0):
+        self.n_jogos = n_jogos
+        self.cartas = np.full((n_jogos, 7, 52), VAZIA, dtype=np.uint8)
+        self.tamanho = np.zeros((n_jogos, 7), dtype=np.int16)
+        self.ocultas = np.zeros((n_jogos, 7), dtype=np.int16)
+        self.alturas = np.zeros((n_jogos, 4), dtype=np.int8)
+        self.posicao = np.full((n_jogos, TOTAL_CARTAS + 1), -1, dtype=np.int16)
+        self.numeros = np.zeros(n_jogos, dtype=np.int64)
+        self._todos = np.arange(n_jogos)
+        self.reiniciar(range(primeiro_jogo, primeiro_jogo + n_jogos))
+
+    # ------------------------------------------------------------------
+    # MÉTODO: reiniciar
+    # Distribui de novo os jogos indicados (todos, se jogos=None)
+    # numeros: um número de distribuição para cada jogo reiniciado
+    # ------------------------------------------------------------------
+    def reiniciar(self, numeros, jogos=None):
+        jogos = self._todos if jogos is None else np.asarray(jogos, dtype=np.intp)
+        numeros = list(numeros)
+        if len(numeros) != len(jogos):
+            raise ValueError("É preciso um número de distribuição para cada jogo")
+        ordens = np.array([ordem_do_jogo(n) for n in numeros], dtype=np.intp).reshape(-1, 52)
+
+        self.cartas[jogos] = VAZIA
+        self.cartas[jogos[:, None], _COLUNA_DA_POSICAO, _INDICE_DA_POSICAO] = ordens
+        self.tamanho[jogos] = TAMANHOS_INICIAIS
+        self.ocultas[jogos] = OCULTAS_INICIAIS
+        self.alturas[jogos] = 0
+        self.posicao[jogos] = -1
+        self.posicao[jogos[:, None], ordens[:, _VISIVEL_NA_DISTRIBUICAO]] = \
+            _POSICAO_NA_DISTRIBUICAO[_VISIVEL_NA_DISTRIBUICAO]
+        self.numeros[jogos] = numeros
+
+    # ------------------------------------------------------------------
+    # MÉTODO: topos
+    # Id da carta do topo de cada coluna, (N, 7) (VAZIA se vazia)
+    # ------------------------------------------------------------------
+    def topos(self) -> np.ndarray:
+        ultimo = np.maximum(self.tamanho - 1, 0)
+        topos = np.take_along_axis(self.cartas, ultimo[:, :, None], 2)[:, :, 0].astype(np.intp)
+        topos[self.tamanho == 0] = VAZIA
+        return topos
+
+    # ------------------------------------------------------------------
+    # MÉTODO: acoes_candidatas
+    # Forma compacta dos movimentos válidos: (acoes, validas), as duas (N, 63)
+    # Mesmas regras de Pilha.pode_adicionar_subpilha e
+    # JogoYukon.pode_mover_para_fundacao, calculadas para todos os jogos juntos
+    #   - tableau: para cada coluna destino, as até 4 cartas que cabem no
+    #     topo; vale se a carta está virada para cima em OUTRA coluna
+    #   - para a fundação: o topo da coluna é o próximo do seu naipe
+    #   - da fundação: o topo da fundação de cada naipe cabe no topo da coluna
+    # ------------------------------------------------------------------
+    def acoes_candidatas(self):
+        topos = self.topos()                                                     # (N, 7)
+
+        # TABLEAU → TABLEAU
+        pos = self.posicao.reshape(-1)[
+            self._todos[:, None, None] * (TOTAL_CARTAS + 1) + CABEM[topos]].astype(np.intp)  # (N, 7, 4)
+        tableau_ok = (pos >= 0) & (pos // 52 != _COLUNAS[:, None])
+        tableau = pos * 7 + _COLUNAS[:, None]
+
+        # TABLEAU → FUNDAÇÃO
+        altura_do_naipe = self.alturas[self._todos[:, None], NAIPE[topos]]
+        para_ok = (topos != VAZIA) & (VALOR[topos] == altura_do_naipe + 1)
+        para = np.broadcast_to(INICIO_PARA_FUNDACAO + _COLUNAS, para_ok.shape)
+
+        # FUNDAÇÃO → TABLEAU
+        cartas_fund = np.where(self.alturas > 0, _NAIPES * 13 + self.alturas - 1, VAZIA)
+        da_ok = PODE[cartas_fund[:, :, None], topos[:, None, :]]                 # (N, 4, 7)
+        da = np.broadcast_to(_ACOES_DA_FUNDACAO, da_ok.shape)                     # (N, 4, 7)
+
+        n = self.n_jogos
+        acoes = np.concatenate((tableau.reshape(n, -1), para, da.reshape(n, -1)), axis=1)
+        validas = np.concatenate((tableau_ok.reshape(n, -1), para_ok, da_ok.reshape(n, -1)), axis=1)
+        return acoes, validas
+
+    # ------------------------------------------------------------------
+    # MÉTODO: mascara_legal
+    # Matriz (N, TOTAL_ACOES) com True nas ações válidas de cada jogo
+    # (mais cara que acoes_candidatas; útil para redes com saída fixa)
+    # ------------------------------------------------------------------
+    def mascara_legal(self) -> np.ndarray:
+        acoes, validas = self.acoes_candidatas()
+        mascara = np.zeros((self.n_jogos, TOTAL_ACOES), dtype=bool)
+        linhas = np.broadcast_to(self._todos[:, None], acoes.shape)
+        mascara[linhas[validas], acoes[validas]] = True
+        return mascara
+
+    # ------------------------------------------------------------------
+    # MÉTODO: passo
+    # Aplica uma ação por jogo (-1 = não joga) e retorna (recompensas, vitorias)
+    # recompensa: +1 carta para a fundação, -1 carta tirada da fundação, 0 no resto
+    # As ações devem ser válidas; com verificar=True ações inválidas
+    # levantam ValueError (custa uma máscara a mais por passo)
+    # ------------------------------------------------------------------
+    def passo(self, acoes, verificar: bool = False):
+        acoes = np.asarray(acoes, dtype=np.intp)
+        if acoes.shape != (self.n_jogos,):
+            raise ValueError(f"É preciso uma ação para cada um dos {self.n_jogos} jogos")
+        if verificar:
+            jogando = np.nonzero(acoes >= 0)[0]
+            if not self.mascara_legal()[jogando, acoes[jogando]].all():
+                raise ValueError("Ação inválida para algum jogo")
+
+        recompensas = np.zeros(self.n_jogos, dtype=np.int8)
+
+        jogos = np.nonzero((acoes >= 0) & (acoes < INICIO_PARA_FUNDACAO))[0]
+        if jogos.size:
+            self._mover_tableau(jogos, acoes[jogos])
+
+        jogos = np.nonzero((acoes >= INICIO_PARA_FUNDACAO) & (acoes < INICIO_DA_FUNDACAO))[0]
+        if jogos.size:
+            self._para_fundacao(jogos, acoes[jogos] - INICIO_PARA_FUNDACAO)
+            recompensas[jogos] = 1
+
+        jogos = np.nonzero(acoes >= INICIO_DA_FUNDACAO)[0]
+        if jogos.size:
+            self._da_fundacao(jogos, acoes[jogos] - INICIO_DA_FUNDACAO)
+            recompensas[jogos] = -1
+
+        return recompensas, self.vitorias()
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _mover_tableau
+    # Move as subpilhas de vários jogos de uma vez (cada jogo com sua origem,
+    # início e destino); as cartas copiadas são marcadas com uma máscara (M, 52)
+    # ------------------------------------------------------------------
+    def _mover_tableau(self, jogos, acoes):
+        origem = acoes // 364
+        inicio = acoes // 7 % 52
+        destino = acoes % 7
+        tam_origem = self.tamanho[jogos, origem]
+        tam_destino = self.tamanho[jogos, destino]
+        quantidade = tam_origem - inicio
+
+        movidas = _INDICES < quantidade[:, None]                                 # (M, 52)
+        linhas = np.broadcast_to(jogos[:, None], movidas.shape)[movidas]
+        col_origem = np.broadcast_to(origem[:, None], movidas.shape)[movidas]
+        col_destino = np.broadcast_to(destino[:, None], movidas.shape)[movidas]
+        de = (inicio[:, None] + _INDICES)[movidas]
+        para = (tam_destino[:, None] + _INDICES)[movidas]
+
+        cartas = self.cartas[linhas, col_origem, de]
+        self.cartas[linhas, col_destino, para] = cartas
+        self.cartas[linhas, col_origem, de] = VAZIA
+        self.posicao[linhas, cartas] = col_destino * 52 + para
+        self.tamanho[jogos, origem] = inicio
+        self.tamanho[jogos, destino] = tam_destino + quantidade
+        self._virar_topos(jogos, origem)
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _para_fundacao
+    # ------------------------------------------------------------------
+    def _para_fundacao(self, jogos, colunas):
+        topo = self.tamanho[jogos, colunas] - 1
+        cartas = self.cartas[jogos, colunas, topo]
+        self.cartas[jogos, colunas, topo] = VAZIA
+        self.posicao[jogos, cartas] = -1
+        self.tamanho[jogos, colunas] = topo
+        self.alturas[jogos, NAIPE[cartas]] += 1
+        self._virar_topos(jogos, colunas)
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _da_fundacao
+    # ------------------------------------------------------------------
+    def _da_fundacao(self, jogos, acoes):
+        naipes = acoes // 7
+        destino = acoes % 7
+        alturas = self.alturas[jogos, naipes]
+        tam = self.tamanho[jogos, destino]
+        cartas = naipes * 13 + alturas - 1
+        self.cartas[jogos, destino, tam] = cartas
+        self.posicao[jogos, cartas] = destino * 52 + tam
+        self.tamanho[jogos, destino] = tam + 1
+        self.alturas[jogos, naipes] = alturas - 1
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _virar_topos
+    # Vira a carta do topo das colunas que ficaram só com cartas viradas para baixo
+    # ------------------------------------------------------------------
+    def _virar_topos(self, jogos, colunas):
+        tam = self.tamanho[jogos, colunas]
+        virar = (tam > 0) & (self.ocultas[jogos, colunas] == tam)
+        jogos, colunas, topo = jogos[virar], colunas[virar], tam[virar] - 1
+        self.ocultas[jogos, colunas] = topo
+        self.posicao[jogos, self.cartas[jogos, colunas, topo]] = colunas * 52 + topo
+
+    # ------------------------------------------------------------------
+    # MÉTODO: vitorias
+    # Vetor (N,) com True nos jogos com as 4 fundações completas
+    # ------------------------------------------------------------------
+    def vitorias(self) -> np.ndarray:
+        return (self.alturas == 13).all(axis=1)
+
+    # ------------------------------------------------------------------
+    # MÉTODO: estado
+    # Converte o jogo i para EstadoCompacto (fundação f = naipe f)
+    # ------------------------------------------------------------------
+    def estado(self, i: int) -> EstadoCompacto:
+        estado = EstadoCompacto()
+        dados = estado.dados
+        for col in range(7):
+            tam = int(self.tamanho[i, col])
+            base = OFF_COLUNAS + col * POSICOES_POR_COLUNA
+            dados[base:base + tam] = self.cartas[i, col, :tam].tobytes()
+            dados[OFF_TAMANHO + col] = tam
+            dados[OFF_OCULTAS + col] = int(self.ocultas[i, col])
+        for naipe in range(4):
+            altura = int(self.alturas[i, naipe])
+            dados[OFF_FUNDACAO + naipe] = naipe * 13 + altura - 1 if altura else VAZIA
+        return estado
+
+    # ------------------------------------------------------------------
+    # MÉTODO: carregar
+    # Coloca no jogo i a posição de um EstadoCompacto
+    # ------------------------------------------------------------------
+    def carregar(self, i: int, estado: EstadoCompacto):
+        dados = estado.dados
+        self.cartas[i] = VAZIA
+        self.posicao[i] = -1
+        for col in range(7):
+            tam = dados[OFF_TAMANHO + col]
+            ocultas = dados[OFF_OCULTAS + col]
+            base = OFF_COLUNAS + col * POSICOES_POR_COLUNA
+            self.cartas[i, col, :tam] = np.frombuffer(dados, np.uint8, tam, base)
+            self.tamanho[i, col] = tam
+            self.ocultas[i, col] = ocultas
+            for idx in range(ocultas, tam):
+                self.posicao[i, dados[base + idx]] = col * 52 + idx
+        self.alturas[i] = 0
+        for topo in dados[OFF_FUNDACAO:OFF_COLUNAS]:
+            if topo != VAZIA:
+                self.alturas[i, NAIPE_ID[topo]] = VALOR_ID[topo]
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: acoes_aleatorias
+# Sorteia uma ação válida por jogo a partir de acoes_candidatas()
+# (-1 nos jogos sem nenhuma ação válida)
+# ------------------------------------------------------------------
+def acoes_aleatorias(acoes: np.ndarray, validas: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    sorteio = rng.random(acoes.shape, dtype=np.float32)
+    sorteio[~validas] = -1.0
+    escolha = sorteio.argmax(axis=1)
+    escolhidas = acoes[np.arange(len(acoes)), escolha]
+    escolhidas[~validas.any(axis=1)] = -1
+    return escolhidas
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: main
+# Mede a velocidade do ambiente com jogadas aleatórias
+# ------------------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mede o ambiente vetorizado do Yukon")
+    parser.add_argument("--jogos", type=int, default=4096, help="partidas simultâneas")
+    parser.add_argument("--passos", type=int, default=200)
+    parser.add_argument("--semente", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    ambiente = AmbienteVetorizado(args.jogos)
+    rng = np.random.default_rng(args.semente)
+    movimentos = 0
+    comeco = time.perf_counter()
+    for _ in range(args.passos):
+        acoes = acoes_aleatorias(*ambiente.acoes_candidatas(), rng)
+        ambiente.passo(acoes)
+        movimentos += int((acoes >= 0).sum())
+    segundos = time.perf_counter() - comeco
+
+    print(f"Partidas:        {args.jogos}")
+    print(f"Movimentos:      {movimentos}")
+    print(f"Tempo:           {segundos:.2f} s")
+    print(f"Movimentos/s:    {movimentos / segundos:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+# src/sim/estimador.py
+# Estimador de Monte Carlo da chance de vitória a partir de uma posição
+# O jogador não sabe quais cartas estão viradas para baixo; o estimador sorteia
+# essas cartas (só entre as que não aparecem em lugar nenhum), joga a partida
+# até o fim com uma política rápida e conta as vitórias. Cada movimento
+# candidato é testado na MESMA distribuição sorteada (números aleatórios
+# comuns), então a comparação entre movimentos tem menos ruído.
+# As rodadas são divididas entre processos até acabar o tempo limite.
+#
+# Uso: python -m src.sim.estimador --jogo 1234 --tempo 5
+
+import argparse
+import math
+import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import List, NamedTuple, Optional
+
+from src.game.estado_compacto import EstadoCompacto, OFF_COLUNAS, POSICOES_POR_COLUNA
+from src.game.movimento import Movimento
+from src.models.baralho import ordem_do_jogo
+from src.sim.politicas import POLITICAS
+from src.sim.simulador import MAX_MOVIMENTOS_PADRAO, jogar_a_partir_de
+
+TEMPO_LIMITE_PADRAO = 2.0   # segundos por estimativa
+RODADAS_POR_LOTE = 8        # rodadas (distribuições sorteadas) enviadas de uma vez a um processo
+Z_95 = 1.96                 # intervalo de confiança de 95%
+
+
+# ----------------------------------------------------------------------
+# CLASSE: Estimativa
+# Resultado para a posição atual (movimento=None) ou para um movimento candidato
+# baixo/alto: intervalo de confiança de Wilson para a taxa de vitória
+# ----------------------------------------------------------------------
+class Estimativa(NamedTuple):
+    movimento: Optional[Movimento]
+    partidas: int
+    vitorias: int
+    baixo: float
+    alto: float
+
+    @property
+    def taxa_vitoria(self) -> float:
+        return self.vitorias / self.partidas if self.partidas else 0.0
+
+
+# ----------------------------------------------------------------------
+# CLASSE: ResultadoEstimativa
+# posicao: chance de vitória de "daqui" (a política escolhe o próximo lance)
+# movimentos: uma estimativa por candidato, da maior taxa para a menor
+# ----------------------------------------------------------------------
+class ResultadoEstimativa(NamedTuple):
+    posicao: Estimativa
+    movimentos: List[Estimativa]
+    rodadas: int
+    segundos: float
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: intervalo_wilson
+# Intervalo de confiança de Wilson para 'vitorias' em 'partidas'
+# (funciona bem mesmo com taxas perto de 0 ou 1 e poucas partidas)
+# ------------------------------------------------------------------
+def intervalo_wilson(vitorias: int, partidas: int, z: float = Z_95):
+    if partidas == 0:
+        return 0.0, 1.0
+    p = vitorias / partidas
+    z2 = z * z
+    centro = (p + z2 / (2 * partidas)) / (1 + z2 / partidas)
+    margem = z * math.sqrt(p * (1 - p) / partidas + z2 / (4 * partidas * partidas)) / (1 + z2 / partidas)
+    return max(0.0, centro - margem), min(1.0, centro + margem)
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: sortear_ocultas
+# Cópia do estado com as cartas viradas para baixo embaralhadas entre si
+# As cartas visíveis e as fundações não mudam, então toda amostra é
+# coerente com o que o jogador vê
+# ------------------------------------------------------------------
+def sortear_ocultas(estado: EstadoCompacto, rng: random.Random) -> EstadoCompacto:
+    amostra = estado.clone()
+    dados = amostra.dados
+    posicoes = []
+    for col in range(7):
+        base = OFF_COLUNAS + col * POSICOES_POR_COLUNA
+        posicoes.extend(range(base, base + estado.ocultas(col)))
+    ids = [dados[pos] for pos in posicoes]
+    rng.shuffle(ids)
+    for pos, carta in zip(posicoes, ids):
+        dados[pos] = carta
+    return amostra
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO PRIVADA: _rodar_lote
+# Executada dentro de cada processo: 'rodadas' distribuições sorteadas;
+# em cada uma, joga a partir da posição e a partir de cada candidato
+# Retorna uma lista [vitorias da posição, vitorias do candidato 0, ...]
+# ------------------------------------------------------------------
+def _rodar_lote(dados: bytes, candidatos: list, rodadas: int, lote: int, semente: int,
+                politica: str, max_movimentos: int) -> List[int]:
+    escolher = POLITICAS[politica]
+    estado = EstadoCompacto(bytearray(dados))
+    vitorias = [0] * (len(candidatos) + 1)
+    for rodada in range(rodadas):
+        # Fluxo próprio de cada rodada: o resultado não depende dos processos
+        rng = random.Random(f"{semente}:{lote}:{rodada}")
+        amostra = sortear_ocultas(estado, rng)
+        semente_partida = rng.getrandbits(32)
+        vitorias[0] += jogar_a_partir_de(amostra, escolher, random.Random(semente_partida),
+                                         max_movimentos)[0]
+        for i, mov in enumerate(candidatos, 1):
+            filho = amostra.clone()
+            filho.aplicar(mov)
+            vitorias[i] += jogar_a_partir_de(filho, escolher, random.Random(semente_partida),
+                                             max_movimentos)[0]
+    return vitorias
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: estimar
+# Estima a chance de vitória da posição e de cada movimento candidato
+# posicao: JogoYukon ou EstadoCompacto
+# candidatos: movimentos a comparar (padrão: todos os movimentos válidos)
+# tempo_limite: para de enviar rodadas quando o tempo acaba
+# max_rodadas: limite fixo de rodadas (com semente igual, resultado reproduzível)
+# processos=1 roda tudo no próprio processo; executor permite reaproveitar um pool
+# ------------------------------------------------------------------
+def estimar(posicao, candidatos=None, tempo_limite: float = TEMPO_LIMITE_PADRAO,
+            max_rodadas: int = None, politica: str = "gulosa", processos: int = None,
+            semente: int = 0, max_movimentos: int = MAX_MOVIMENTOS_PADRAO,
+            rodadas_por_lote: int = RODADAS_POR_LOTE, executor=None) -> ResultadoEstimativa:
+    if politica not in POLITICAS:
+        raise ValueError(f"Política desconhecida: {politica}")
+    estado = posicao if isinstance(posicao, EstadoCompacto) else EstadoCompacto.de_jogo(posicao)
+    if candidatos is None:
+        candidatos = estado.movimentos()
+    candidatos = [Movimento(*mov) for mov in candidatos]
+    processos = processos or os.cpu_count() or 1
+
+    comeco = time.perf_counter()
+    prazo = comeco + tempo_limite
+    dados = bytes(estado.dados)
+    totais = [0] * (len(candidatos) + 1)
+    rodadas = 0
+    lote = 0
+
+    def proximo_lote():
+        nonlocal lote
+        n = rodadas_por_lote
+        if max_rodadas is not None:
+            n = min(n, max_rodadas - lote * rodadas_por_lote)
+        argumentos = (dados, candidatos, n, lote, semente, politica, max_movimentos)
+        lote += 1
+        return n, argumentos
+
+    def ha_mais():
+        if max_rodadas is not None and lote * rodadas_por_lote >= max_rodadas:
+            return False
+        return time.perf_counter() < prazo
+
+    if processos == 1 and executor is None:
+        while ha_mais():
+            n, argumentos = proximo_lote()
+            for i, v in enumerate(_rodar_lote(*argumentos)):
+                totais[i] += v
+            rodadas += n
+    else:
+        proprio = executor is None
+        if proprio:
+            executor = ProcessPoolExecutor(max_workers=processos)
+        try:
+            # Mantém cada processo ocupado com até 2 lotes na fila
+            pendentes = {}
+            while True:
+                while ha_mais() and len(pendentes) < 2 * processos:
+                    n, argumentos = proximo_lote()
+                    pendentes[executor.submit(_rodar_lote, *argumentos)] = n
+                if not pendentes:
+                    break
+                prontos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+                for futuro in prontos:
+                    for i, v in enumerate(futuro.result()):
+                        totais[i] += v
+                    rodadas += pendentes.pop(futuro)
+        finally:
+            if proprio:
+                executor.shutdown(cancel_futures=True)
+
+    def estimativa(mov, vitorias):
+        return Estimativa(mov, rodadas, vitorias, *intervalo_wilson(vitorias, rodadas))
+
+    movimentos = [estimativa(mov, totais[i]) for i, mov in enumerate(candidatos, 1)]
+    movimentos.sort(key=lambda e: -e.vitorias)  # sort estável: empates na ordem dos candidatos
+    return ResultadoEstimativa(estimativa(None, totais[0]), movimentos, rodadas,
+                               time.perf_counter() - comeco)
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: main
+# Ponto de entrada da linha de comando (python -m src.sim.estimador)
+# ------------------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Chance de vitória no Yukon por Monte Carlo")
+    parser.add_argument("--jogo", type=int, default=0, help="número da distribuição")
+    parser.add_argument("--tempo", type=float, default=TEMPO_LIMITE_PADRAO, help="segundos")
+    parser.add_argument("--politica", choices=sorted(POLITICAS), default="gulosa")
+    parser.add_argument("--processos", type=int, default=None, help="padrão: todos os núcleos")
+    parser.add_argument("--semente", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    estado = EstadoCompacto.distribuir(ordem_do_jogo(args.jogo))
+    r = estimar(estado, tempo_limite=args.tempo, politica=args.politica,
+                processos=args.processos, semente=args.semente)
+    p = r.posicao
+    print(f"Jogo nº {args.jogo}: {r.rodadas} rodadas em {r.segundos:.2f} s")
+    print(f"Chance de vitória daqui: {p.taxa_vitoria:.1%} (IC 95%: {p.baixo:.1%} a {p.alto:.1%})")
+    for e in r.movimentos:
+        print(f"  {str(e.movimento):<28} {e.taxa_vitoria:6.1%}  [{e.baixo:.1%}, {e.alto:.1%}]")
+
+
+if __name__ == "__main__":
+    main()
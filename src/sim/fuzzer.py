@@ -0,0 +1,445 @@
+# src/sim/fuzzer.py
+# Fuzzer do motor do jogo: sequências aleatórias de jogadas, desfazer,
+# refazer e coletas em distribuições numeradas, conferindo invariantes do
+# JogoYukon e das Pilhas depois de CADA passo:
+#   - as 52 cartas continuam no jogo, sem repetição
+#   - fundações com um só naipe, do Ás para cima
+#   - cartas viradas para baixo só no fundo das colunas (e o topo sempre visível)
+#   - índice de sequências de cada pilha igual ao recalculado do zero
+#   - desfazer volta exatamente à posição de antes (e refazer à de depois)
+#   - hash Zobrist e índice de movimentos iguais aos calculados do zero
+#   - o par aplicar/desfazer(mov) das buscas volta à posição exata sem mexer
+#     no refazer do jogador
+# Cada passo tira uma impressão da posição inteira (ids das 52 cartas,
+# tamanhos e fronteiras, numa passada): com ela confere as 52 cartas sem
+# repetição e compara exatamente a posição depois de desfazer/refazer. O que
+# pede recalcular do zero (hash, índice de movimentos, índice de sequências
+# inteiro) roda a cada CONFERIR_TUDO_A_CADA passos e no fim de cada partida.
+# Uma falha é encolhida até uma sequência mínima de ações que ainda falha.
+#
+# Uso: python -m src.sim.fuzzer --passos 1000000 --processos 4
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, NamedTuple, Optional, Tuple
+
+from src.game.estado_compacto import EstadoCompacto
+from src.game.jogo_yukon import JogoYukon
+from src.game.movimento import Movimento
+from src.game.zobrist import hash_jogo
+from src.models.carta import PODE_SOBRE, VALOR_ID
+
+# Ações (tuplas): (ACAO_MOVER, tipo, origem, inicio, destino), (ACAO_DESFAZER,),
+# (ACAO_REFAZER,), (ACAO_COLETAR, agrupar) e (ACAO_SONDAR, tipo, origem, inicio,
+# destino): aplicar + desfazer(mov), como nas buscas
+ACAO_MOVER = "mover"
+ACAO_SONDAR = "sondar"
+ACAO_DESFAZER = "desfazer"
+ACAO_REFAZER = "refazer"
+ACAO_COLETAR = "coletar"
+
+PASSOS_POR_JOGO_PADRAO = 400  # Passos em cada distribuição antes de passar para a próxima
+CONFERIR_TUDO_A_CADA = 64     # Passos entre conferências completas
+JOGOS_POR_LOTE = 50           # Distribuições enviadas de uma vez a cada processo
+
+# Chance de cada tipo de ação (o resto são jogadas)
+_CHANCE_DESFAZER = 0.20
+_CHANCE_REFAZER = 0.05
+_CHANCE_COLETAR = 0.02
+_CHANCE_SONDAR = 0.05
+
+
+class ViolacaoInvariante(Exception):
+    """Um invariante do jogo deixou de valer depois de um passo."""
+
+
+# ----------------------------------------------------------------------
+# CLASSE: Reproducao
+# Falha encolhida: distribuição e a sequência mínima de ações que a provoca
+# ----------------------------------------------------------------------
+class Reproducao(NamedTuple):
+    numero: int
+    acoes: List[tuple]
+    mensagem: str
+
+    def __str__(self) -> str:
+        linhas = [f"Jogo nº {self.numero}, {len(self.acoes)} ações: {self.mensagem}"]
+        for acao in self.acoes:
+            if acao[0] in (ACAO_MOVER, ACAO_SONDAR):
+                linhas.append(f"  {acao[0]} {Movimento(*acao[1:])}")
+            elif acao[0] == ACAO_COLETAR:
+                linhas.append(f"  {ACAO_COLETAR}{' (agrupar)' if acao[1] else ''}")
+            else:
+                linhas.append(f"  {acao[0]}")
+        return "\n".join(linhas)
+
+
+# ----------------------------------------------------------------------
+# CLASSE: ResultadoFuzz
+# falha: None se nenhum invariante quebrou
+# ----------------------------------------------------------------------
+class ResultadoFuzz(NamedTuple):
+    jogos: int
+    passos: int
+    segundos: float
+    falha: Optional[Reproducao]
+
+    @property
+    def passos_por_segundo(self) -> float:
+        return self.passos / self.segundos if self.segundos else 0.0
+
+
+# Impressão da posição inteira: (ids de todas as cartas, pilha por pilha;
+# tamanho e fronteira de ocultas de cada pilha). Duas posições são iguais
+# se, e só se, as impressões são iguais
+Impressao = Tuple[bytes, bytes]
+
+
+# ----------------------------------------------------------------------
+# CLASSE PRIVADA: _Execucao
+# Um JogoYukon mais as impressões de "antes/depois" de cada ação, espelhando
+# o desfazer/refazer do jogo, para conferir que eles voltam à posição exata
+# estrito: uma jogada recusada é falha (no fuzz as jogadas vêm de
+#          movimentos_legais); ao repetir uma sequência encolhida, é ignorada
+# ----------------------------------------------------------------------
+class _Execucao:
+    def __init__(self, numero: int, estrito: bool = True):
+        self.jogo = JogoYukon(numero)
+        self.pilhas = self.jogo.tableau + self.jogo.fundacoes
+        self.estrito = estrito
+        self._feitos: List[tuple] = []     # (antes, depois, hash antes, hash depois)
+        self._desfeitos: List[tuple] = []
+        self._atual = self._impressao()    # Impressão da posição atual
+
+    # ------------------------------------------------------------------
+    # MÉTODO: executar
+    # Faz uma ação e confere os invariantes (lança ViolacaoInvariante)
+    # ------------------------------------------------------------------
+    def executar(self, acao: tuple, conferir_tudo: bool = False):
+        jogo = self.jogo
+        tipo = acao[0]
+        antes, hash_antes = self._atual, jogo.hash_zobrist
+        if tipo == ACAO_MOVER or tipo == ACAO_SONDAR:
+            mov = Movimento(*acao[1:])
+            if not jogo.aplicar(mov):
+                if self.estrito:
+                    raise ViolacaoInvariante(f"movimento legal recusado: {mov}")
+                return
+            depois = self._conferir()
+            if tipo == ACAO_MOVER:
+                self._feitos.append((antes, depois, hash_antes, jogo.hash_zobrist))
+                self._desfeitos.clear()
+            else:
+                # Par aplicar/desfazer de uma busca: volta à posição exata sem
+                # mexer no histórico do jogador
+                jogo.desfazer(mov)
+                self._comparar(antes, hash_antes, "sondagem")
+                if jogo.pode_refazer() != bool(self._desfeitos):
+                    raise ViolacaoInvariante("sondagem mexeu no refazer do jogador")
+        elif tipo == ACAO_DESFAZER:
+            if jogo.desfazer() != bool(self._feitos):
+                raise ViolacaoInvariante("desfazer não acompanha o histórico")
+            if self._feitos:
+                registro = self._feitos.pop()
+                self._comparar(registro[0], registro[2], "desfazer")
+                self._desfeitos.append(registro)
+        elif tipo == ACAO_REFAZER:
+            if jogo.refazer() != bool(self._desfeitos):
+                raise ViolacaoInvariante("refazer não acompanha o histórico")
+            if self._desfeitos:
+                registro = self._desfeitos.pop()
+                self._comparar(registro[1], registro[3], "refazer")
+                self._feitos.append(registro)
+        else:
+            agrupar = acao[1]
+            if jogo.coletar_seguras(agrupar):
+                if agrupar and self._feitos:
+                    # O lote entrou na mesma entrada da ação anterior
+                    anterior = self._feitos.pop()
+                    antes, hash_antes = anterior[0], anterior[2]
+                self._feitos.append((antes, self._conferir(), hash_antes, jogo.hash_zobrist))
+                self._desfeitos.clear()
+            else:
+                self._comparar(antes, hash_antes, "coleta sem cartas")
+
+        if conferir_tudo:
+            self.conferir_tudo()
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _impressao
+    # Impressão da posição atual (uma passada pelas 52 cartas)
+    # ------------------------------------------------------------------
+    def _impressao(self) -> Impressao:
+        pilhas = self.pilhas
+        ids = bytes([carta.id for pilha in pilhas for carta in pilha.cartas])
+        forma = bytes([len(pilha.cartas) for pilha in pilhas] + [pilha.ocultas for pilha in pilhas])
+        return ids, forma
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _conferir
+    # Invariantes de todo passo: 52 cartas sem repetição, fronteira de
+    # ocultas e sequência do topo de cada coluna, fundações em ordem
+    # completa: o índice de sequências das colunas inteiras
+    # Retorna (e guarda) a impressão da posição
+    # ------------------------------------------------------------------
+    def _conferir(self, completa: bool = False) -> Impressao:
+        impressao = self._atual = self._impressao()
+        ids = impressao[0]
+        if len(ids) != 52:
+            raise ViolacaoInvariante(f"{len(ids)} cartas no jogo (esperado 52)")
+        if len(set(ids)) != 52:
+            raise ViolacaoInvariante("carta repetida no jogo")
+        pilhas = self.pilhas
+        for i in range(7):
+            _conferir_coluna(pilhas[i], i, completa)
+        for i in range(7, 11):
+            _conferir_fundacao(pilhas[i], i)
+        return impressao
+
+    # ------------------------------------------------------------------
+    # MÉTODO PRIVADO: _comparar
+    # A posição é exatamente a da impressão (e o hash igual ao guardado)?
+    # ------------------------------------------------------------------
+    def _comparar(self, esperada: Impressao, hash_esperado: int, contexto: str):
+        atual = self._conferir()
+        if atual != esperada:
+            i = _pilha_diferente(atual, esperada)
+            raise ViolacaoInvariante(f"{contexto} não voltou a {_nome_pilha(i)} ao estado exato")
+        if self.jogo.hash_zobrist != hash_esperado:
+            raise ViolacaoInvariante(f"{contexto} não voltou o hash Zobrist")
+
+    # ------------------------------------------------------------------
+    # MÉTODO: conferir_tudo
+    # Todos os invariantes, inclusive os que pedem recalcular do zero
+    # ------------------------------------------------------------------
+    def conferir_tudo(self):
+        jogo = self.jogo
+        self._conferir(completa=True)
+        if jogo.hash_zobrist != hash_jogo(jogo):
+            raise ViolacaoInvariante("hash Zobrist incremental diferente do calculado do zero")
+        if jogo.movimentos_legais() != EstadoCompacto.de_jogo(jogo).movimentos():
+            raise ViolacaoInvariante("índice de movimentos diferente do EstadoCompacto")
+
+
+# ------------------------------------------------------------------
+# FUNÇÕES PRIVADAS: conferências de uma pilha
+# ------------------------------------------------------------------
+def _nome_pilha(i: int) -> str:
+    return f"coluna {i}" if i < 7 else f"fundação {i - 7}"
+
+
+def _pilha_diferente(a: Impressao, b: Impressao) -> int:
+    # Índice da primeira pilha em que as impressões diferem
+    inicio_a = inicio_b = 0
+    for i in range(11):
+        fim_a, fim_b = inicio_a + a[1][i], inicio_b + b[1][i]
+        if a[0][inicio_a:fim_a] != b[0][inicio_b:fim_b] or a[1][11 + i] != b[1][11 + i]:
+            return i
+        inicio_a, inicio_b = fim_a, fim_b
+    return 0
+
+
+def _conferir_coluna(pilha, i: int, completa: bool = True):
+    cartas = pilha.cartas
+    n = len(cartas)
+    ocultas = pilha.ocultas
+    if not 0 <= ocultas <= n or (n and ocultas == n):
+        raise ViolacaoInvariante(f"coluna {i}: fronteira de ocultas {ocultas} com {n} cartas")
+    # Índice de sequências (lido direto do atributo: sequencia() se autocorrige)
+    # Sem 'completa', só a sequência do topo, que é onde as jogadas mexem
+    sequencia = pilha._sequencia
+    if len(sequencia) != n:
+        raise ViolacaoInvariante(f"coluna {i}: índice de sequências desatualizado")
+    esperado = 1
+    for k in range(n - 1, -1, -1):
+        if sequencia[k] != esperado:
+            raise ViolacaoInvariante(f"coluna {i}: índice de sequências desatualizado")
+        if k and PODE_SOBRE[cartas[k].id * 53 + cartas[k - 1].id]:
+            esperado += 1
+        elif completa:
+            esperado = 1
+        else:
+            break
+
+
+def _conferir_fundacao(pilha, i: int):
+    cartas = pilha.cartas
+    if pilha.ocultas:
+        raise ViolacaoInvariante(f"fundação {i - 7}: {pilha.ocultas} cartas ocultas")
+    if not cartas:
+        return
+    base = cartas[0].id
+    if VALOR_ID[base] != 1 or any(cartas[k].id != base + k for k in range(len(cartas))):
+        raise ViolacaoInvariante(f"fundação {i - 7}: fora de ordem ou com naipes misturados")
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: fuzz_jogo
+# Faz 'passos' ações aleatórias na distribuição 'numero'
+# Retorna None ou (ações até a falha, mensagem)
+# ------------------------------------------------------------------
+def fuzz_jogo(numero: int, passos: int = PASSOS_POR_JOGO_PADRAO, semente: int = 0,
+              conferir_a_cada: int = CONFERIR_TUDO_A_CADA):
+    rng = random.Random(f"{semente}:{numero}")
+    execucao = _Execucao(numero)
+    acoes = []
+    try:
+        for passo in range(passos):
+            sorteio = rng.random()
+            if sorteio < _CHANCE_DESFAZER:
+                acao = (ACAO_DESFAZER,)
+            elif sorteio < _CHANCE_DESFAZER + _CHANCE_REFAZER:
+                acao = (ACAO_REFAZER,)
+            elif sorteio < _CHANCE_DESFAZER + _CHANCE_REFAZER + _CHANCE_COLETAR:
+                acao = (ACAO_COLETAR, rng.random() < 0.5)
+            else:
+                movimentos = execucao.jogo.movimentos_legais()
+                sondar = sorteio < _CHANCE_DESFAZER + _CHANCE_REFAZER + _CHANCE_COLETAR + _CHANCE_SONDAR
+                if movimentos:
+                    acao = (ACAO_SONDAR if sondar else ACAO_MOVER, *rng.choice(movimentos))
+                else:
+                    acao = (ACAO_DESFAZER,)
+            acoes.append(acao)
+            execucao.executar(acao, conferir_tudo=passo % conferir_a_cada == conferir_a_cada - 1)
+        execucao.conferir_tudo()
+    except Exception as erro:  # Exceção do motor também é falha
+        return acoes, _mensagem(erro)
+    return None
+
+
+def _mensagem(erro: Exception) -> str:
+    if isinstance(erro, ViolacaoInvariante):
+        return str(erro)
+    return f"{type(erro).__name__}: {erro}"
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: reproduzir
+# Repete as ações numa distribuição nova, conferindo tudo a cada passo
+# Retorna None se nada falhou, ou (índice da ação que falhou, mensagem)
+# Jogadas que deixaram de ser válidas (sequência encolhida) são ignoradas
+# ------------------------------------------------------------------
+def reproduzir(numero: int, acoes: List[tuple]) -> Optional[Tuple[int, str]]:
+    execucao = _Execucao(numero, estrito=False)
+    indice = 0
+    try:
+        execucao.conferir_tudo()
+        for indice, acao in enumerate(acoes):
+            execucao.executar(acao, conferir_tudo=True)
+    except Exception as erro:
+        return indice, _mensagem(erro)
+    return None
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: encolher
+# Reduz a sequência de ações mantendo a falha (delta debugging simplificado):
+# tenta tirar blocos de ações, do maior para o menor; cada tentativa que
+# ainda falha é cortada logo depois da ação que falhou
+# ------------------------------------------------------------------
+def encolher(numero: int, acoes: List[tuple]) -> Reproducao:
+    falha = reproduzir(numero, acoes)
+    if falha is None:
+        raise ValueError("A sequência não reproduz nenhuma falha")
+    acoes = acoes[:falha[0] + 1]
+    bloco = max(1, len(acoes) // 2)
+    while True:
+        removeu = False
+        i = 0
+        while i < len(acoes):
+            candidata = acoes[:i] + acoes[i + bloco:]
+            resultado = reproduzir(numero, candidata)
+            if resultado is not None:
+                acoes = candidata[:resultado[0] + 1]
+                falha = resultado
+                removeu = True
+            else:
+                i += bloco
+        if not removeu:
+            if bloco == 1:
+                break
+            bloco //= 2
+    return Reproducao(numero, acoes, falha[1])
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO PRIVADA: _fuzz_lote
+# Executada dentro de cada processo: distribuições [inicio, fim)
+# Para na primeira falha e a devolve sem encolher
+# ------------------------------------------------------------------
+def _fuzz_lote(inicio: int, fim: int, passos_por_jogo: int, semente: int, conferir_a_cada: int):
+    passos = 0
+    for numero in range(inicio, fim):
+        falha = fuzz_jogo(numero, passos_por_jogo, semente, conferir_a_cada)
+        if falha is not None:
+            acoes, mensagem = falha
+            return numero - inicio + 1, passos + len(acoes), (numero, acoes, mensagem)
+        passos += passos_por_jogo
+    return fim - inicio, passos, None
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: fuzz
+# Roda pelo menos 'passos' ações divididas em distribuições numeradas
+# a partir de 'primeiro_jogo'; a falha de menor número é encolhida
+# Com processos=1 tudo roda no próprio processo
+# ------------------------------------------------------------------
+def fuzz(passos: int, processos: int = None, semente: int = 0, primeiro_jogo: int = 0,
+         passos_por_jogo: int = PASSOS_POR_JOGO_PADRAO,
+         conferir_a_cada: int = CONFERIR_TUDO_A_CADA) -> ResultadoFuzz:
+    processos = processos or os.cpu_count() or 1
+    jogos = -(-passos // passos_por_jogo)
+    ultimo = primeiro_jogo + jogos
+    lotes = [
+        (inicio, min(inicio + JOGOS_POR_LOTE, ultimo), passos_por_jogo, semente, conferir_a_cada)
+        for inicio in range(primeiro_jogo, ultimo, JOGOS_POR_LOTE)
+    ]
+
+    comeco = time.perf_counter()
+    if processos == 1:
+        parciais = [_fuzz_lote(*lote) for lote in lotes]
+    else:
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            parciais = list(executor.map(_fuzz_lote, *zip(*lotes)))
+    segundos = time.perf_counter() - comeco
+
+    falhas = [falha for _, _, falha in parciais if falha is not None]
+    reproducao = None
+    if falhas:
+        numero, acoes, _ = min(falhas, key=lambda f: f[0])
+        reproducao = encolher(numero, acoes)
+    return ResultadoFuzz(sum(p[0] for p in parciais), sum(p[1] for p in parciais),
+                         segundos, reproducao)
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: main
+# Ponto de entrada da linha de comando (python -m src.sim.fuzzer)
+# ------------------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fuzzer do motor de Paciência Yukon")
+    parser.add_argument("--passos", type=int, default=1_000_000, help="total de ações")
+    parser.add_argument("--processos", type=int, default=None, help="padrão: todos os núcleos")
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--primeiro-jogo", type=int, default=0, help="número da primeira distribuição")
+    parser.add_argument("--passos-por-jogo", type=int, default=PASSOS_POR_JOGO_PADRAO)
+    args = parser.parse_args(argv)
+
+    r = fuzz(args.passos, args.processos, args.semente, args.primeiro_jogo, args.passos_por_jogo)
+    print(f"Distribuições:   {r.jogos}")
+    print(f"Passos:          {r.passos}")
+    print(f"Tempo:           {r.segundos:.2f} s")
+    print(f"Passos/s:        {r.passos_por_segundo:,.0f}")
+    if r.falha is None:
+        print("Nenhum invariante quebrado")
+        return 0
+    print("FALHA (sequência mínima):")
+    print(r.falha)
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
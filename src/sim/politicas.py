@@ -0,0 +1,73 @@
+# src/sim/politicas.py
+# Políticas de jogo para o simulador (sem interface gráfica)
+# Uma política recebe o estado, a lista de movimentos válidos e um gerador
+# aleatório, e devolve os movimentos em ORDEM DE PREFERÊNCIA
+# O simulador executa o primeiro que leva a uma posição ainda não vista
+
+import random
+from typing import Callable, Dict, List
+
+from src.game.avaliacao import avaliar
+from src.game.estado_compacto import EstadoCompacto
+from src.game.movimento import MOV_PARA_FUNDACAO, MOV_DA_FUNDACAO
+
+
+# ------------------------------------------------------------------
+# POLÍTICA: aleatoria
+# Qualquer movimento válido, em ordem aleatória
+# ------------------------------------------------------------------
+def politica_aleatoria(estado: EstadoCompacto, movimentos: List[tuple], rng: random.Random) -> List[tuple]:
+    ordem = list(movimentos)
+    rng.shuffle(ordem)
+    return ordem
+
+
+# ------------------------------------------------------------------
+# POLÍTICA: gulosa
+# 1. Manda cartas para a fundação
+# 2. Movimentos que deixam uma carta virada para baixo exposta
+# 3. Os demais movimentos do tableau
+# 4. Por último, tirar cartas da fundação
+# Dentro de cada grupo a ordem é aleatória
+# ------------------------------------------------------------------
+def politica_gulosa(estado: EstadoCompacto, movimentos: List[tuple], rng: random.Random) -> List[tuple]:
+    grupos = ([], [], [], [])
+    for mov in movimentos:
+        tipo, origem, inicio, _ = mov
+        if tipo == MOV_PARA_FUNDACAO:
+            grupos[0].append(mov)
+        elif tipo == MOV_DA_FUNDACAO:
+            grupos[3].append(mov)
+        elif inicio > 0 and inicio == estado.ocultas(origem):
+            grupos[1].append(mov)
+        else:
+            grupos[2].append(mov)
+    ordem = []
+    for grupo in grupos:
+        rng.shuffle(grupo)
+        ordem.extend(grupo)
+    return ordem
+
+
+# ------------------------------------------------------------------
+# POLÍTICA: dica
+# Ordena as jogadas pela nota da avaliação do serviço de dicas com 1 lance
+# (a posição logo depois da jogada); empates ficam na ordem de geração,
+# sem nenhuma aleatoriedade
+# ------------------------------------------------------------------
+def politica_dica(estado: EstadoCompacto, movimentos: List[tuple], rng: random.Random) -> List[tuple]:
+    notas = []
+    for mov in movimentos:
+        filho = estado.clone()
+        filho.aplicar(mov)
+        notas.append(avaliar(filho))
+    ordem = sorted(range(len(movimentos)), key=lambda i: -notas[i])  # sort estável
+    return [movimentos[i] for i in ordem]
+
+
+# Políticas disponíveis pelo nome (o nome é o que vai para os processos)
+POLITICAS: Dict[str, Callable] = {
+    "aleatoria": politica_aleatoria,
+    "gulosa": politica_gulosa,
+    "dica": politica_dica,
+}
@@ -0,0 +1,161 @@
+# src/sim/simulador.py
+# Simulador de partidas em massa, sem interface gráfica
+# Joga N distribuições numeradas com uma política de jogo, dividindo o
+# trabalho entre vários processos, e mede: taxa de vitória, movimentos/s e jogos/s
+#
+# Uso: python -m src.sim --jogos 10000 --politica gulosa --processos 4
+
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+from src.game.estado_compacto import EstadoCompacto
+from src.game.impasse import DetectorImpasse
+from src.models.baralho import ordem_do_jogo
+from src.sim.politicas import POLITICAS
+
+MAX_MOVIMENTOS_PADRAO = 1000  # Limite de movimentos por partida
+TAMANHO_LOTE_PADRAO = 250     # Partidas enviadas de uma vez para cada processo
+
+
+# ----------------------------------------------------------------------
+# CLASSE: ResultadoSimulacao
+# Totais de uma simulação (ou de um lote dela)
+# ----------------------------------------------------------------------
+class ResultadoSimulacao(NamedTuple):
+    jogos: int
+    vitorias: int
+    movimentos: int
+    segundos: float
+
+    @property
+    def taxa_vitoria(self) -> float:
+        return self.vitorias / self.jogos if self.jogos else 0.0
+
+    @property
+    def movimentos_por_segundo(self) -> float:
+        return self.movimentos / self.segundos if self.segundos else 0.0
+
+    @property
+    def jogos_por_segundo(self) -> float:
+        return self.jogos / self.segundos if self.segundos else 0.0
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: jogar_partida
+# Joga uma partida completa e retorna (venceu, quantidade de movimentos)
+# ------------------------------------------------------------------
+def jogar_partida(numero: int, politica: str, semente: int = 0,
+                  max_movimentos: int = MAX_MOVIMENTOS_PADRAO):
+    # Fluxo aleatório próprio de cada partida: o resultado não depende de
+    # quantos processos existem nem de qual processo jogou a partida
+    rng = random.Random(f"{semente}:{numero}")
+    estado = EstadoCompacto.distribuir(ordem_do_jogo(numero))
+    return jogar_a_partir_de(estado, POLITICAS[politica], rng, max_movimentos)
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: jogar_a_partir_de
+# Joga de uma posição qualquer até o fim e retorna (venceu, movimentos)
+# A política ordena os movimentos; executa o primeiro que leva a uma
+# posição ainda não vista nesta partida (tabela de repetições do DetectorImpasse)
+# Pela chave canônica, trocar a ordem das colunas (ex: o Rei indo de uma
+# coluna vazia para outra) não conta como posição nova
+# A partida termina com vitória, sem movimentos novos ou no limite de movimentos
+# O estado recebido não é alterado
+# ------------------------------------------------------------------
+def jogar_a_partir_de(estado: EstadoCompacto, escolher, rng: random.Random,
+                      max_movimentos: int = MAX_MOVIMENTOS_PADRAO):
+    detector = DetectorImpasse()
+    detector.registrar(estado)
+    feitos = 0
+
+    while feitos < max_movimentos and not estado.verificar_vitoria():
+        proximo = None
+        for mov in escolher(estado, estado.movimentos(), rng):
+            tentativa = estado.clone()
+            tentativa.aplicar(mov)
+            if detector.registrar_nova(tentativa):
+                proximo = tentativa
+                break
+        if proximo is None:
+            break
+        estado = proximo
+        feitos += 1
+
+    return estado.verificar_vitoria(), feitos
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO PRIVADA: _jogar_lote
+# Executada dentro de cada processo: joga as partidas [inicio, fim)
+# ------------------------------------------------------------------
+def _jogar_lote(inicio: int, fim: int, politica: str, semente: int, max_movimentos: int):
+    vitorias = 0
+    movimentos = 0
+    for numero in range(inicio, fim):
+        venceu, feitos = jogar_partida(numero, politica, semente, max_movimentos)
+        vitorias += venceu
+        movimentos += feitos
+    return fim - inicio, vitorias, movimentos
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: simular
+# Joga 'jogos' distribuições a partir de 'primeiro_jogo' e soma os resultados
+# Com processos=1 tudo roda no próprio processo (útil para testes e perfis)
+# ------------------------------------------------------------------
+def simular(jogos: int, politica: str = "gulosa", processos: int = None, semente: int = 0,
+            primeiro_jogo: int = 0, max_movimentos: int = MAX_MOVIMENTOS_PADRAO,
+            tamanho_lote: int = TAMANHO_LOTE_PADRAO) -> ResultadoSimulacao:
+    if politica not in POLITICAS:
+        raise ValueError(f"Política desconhecida: {politica}")
+    processos = processos or os.cpu_count() or 1
+
+    lotes = [
+        (inicio, min(inicio + tamanho_lote, primeiro_jogo + jogos), politica, semente, max_movimentos)
+        for inicio in range(primeiro_jogo, primeiro_jogo + jogos, tamanho_lote)
+    ]
+
+    total_jogos = total_vitorias = total_movimentos = 0
+    comeco = time.perf_counter()
+    if processos == 1:
+        parciais = [_jogar_lote(*lote) for lote in lotes]
+    else:
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            parciais = list(executor.map(_jogar_lote, *zip(*lotes)))
+    for n, v, m in parciais:
+        total_jogos += n
+        total_vitorias += v
+        total_movimentos += m
+
+    return ResultadoSimulacao(total_jogos, total_vitorias, total_movimentos,
+                              time.perf_counter() - comeco)
+
+
+# ------------------------------------------------------------------
+# FUNÇÃO: main
+# Ponto de entrada da linha de comando (python -m src.sim)
+# ------------------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulador de partidas de Paciência Yukon")
+    parser.add_argument("--jogos", type=int, default=1000, help="quantidade de partidas")
+    parser.add_argument("--politica", choices=sorted(POLITICAS), default="gulosa")
+    parser.add_argument("--processos", type=int, default=None, help="padrão: todos os núcleos")
+    parser.add_argument("--semente", type=int, default=0, help="semente das políticas aleatórias")
+    parser.add_argument("--primeiro-jogo", type=int, default=0, help="número da primeira distribuição")
+    parser.add_argument("--max-movimentos", type=int, default=MAX_MOVIMENTOS_PADRAO)
+    args = parser.parse_args(argv)
+
+    r = simular(args.jogos, args.politica, args.processos, args.semente,
+                args.primeiro_jogo, args.max_movimentos)
+    print(f"Política:        {args.politica}")
+    print(f"Partidas:        {r.jogos}")
+    print(f"Vitórias:        {r.vitorias} ({r.taxa_vitoria:.2%})")
+    print(f"Movimentos:      {r.movimentos}")
+    print(f"Tempo:           {r.segundos:.2f} s")
+    print(f"Movimentos/s:    {r.movimentos_por_segundo:,.0f}")
+    print(f"Partidas/s:      {r.jogos_por_segundo:,.1f}")
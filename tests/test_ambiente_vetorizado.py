@@ -0,0 +1,87 @@
+# tests/test_ambiente_vetorizado.py
+# Testes unitários para o ambiente vetorizado (NumPy)
+# Verifica: mesmas jogadas válidas e mesmas posições que o EstadoCompacto
+
+import unittest
+import random
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from src.game.estado_compacto import EstadoCompacto, MOV_TABLEAU, MOV_PARA_FUNDACAO
+from src.game.solver import chave_canonica
+from src.models.baralho import ordem_do_jogo
+from src.models.carta import NAIPE_ID
+
+
+@unittest.skipIf(np is None, "numpy não instalado")
+class TestAmbienteVetorizado(unittest.TestCase):
+
+    def setUp(self):
+        from src.sim import ambiente_vetorizado
+        self.av = ambiente_vetorizado
+
+    def _acao(self, estado, mov):
+        tipo, origem, inicio, destino = mov
+        if tipo == MOV_TABLEAU:
+            return self.av.codificar_acao(tipo, origem, inicio, destino)
+        if tipo == MOV_PARA_FUNDACAO:
+            return self.av.codificar_acao(tipo, origem)
+        naipe = NAIPE_ID[estado.topo_fundacao(origem)]
+        return self.av.codificar_acao(tipo, naipe, 0, destino)
+
+    def test_distribuicao_igual_ao_estado_compacto(self):
+        ambiente = self.av.AmbienteVetorizado(3, primeiro_jogo=10)
+        for i in range(3):
+            esperado = EstadoCompacto.distribuir(ordem_do_jogo(10 + i))
+            self.assertEqual(ambiente.estado(i).chave(), esperado.chave())
+
+    def test_mesmas_jogadas_que_o_estado_compacto(self):
+        n = 16
+        ambiente = self.av.AmbienteVetorizado(n)
+        estados = [EstadoCompacto.distribuir(ordem_do_jogo(i)) for i in range(n)]
+        rng = random.Random(4)
+
+        for _ in range(60):
+            mascara = ambiente.mascara_legal()
+            acoes = []
+            for i, estado in enumerate(estados):
+                movimentos = estado.movimentos()
+                esperadas = {self._acao(estado, mov) for mov in movimentos}
+                self.assertEqual(set(np.nonzero(mascara[i])[0].tolist()), esperadas)
+                if movimentos:
+                    mov = rng.choice(movimentos)
+                    acoes.append(self._acao(estado, mov))
+                    estado.aplicar(mov)
+                else:
+                    acoes.append(-1)
+
+            ambiente.passo(acoes, verificar=True)
+            for i, estado in enumerate(estados):
+                self.assertEqual(chave_canonica(ambiente.estado(i)), chave_canonica(estado))
+
+    def test_carregar_e_recompensas(self):
+        ambiente = self.av.AmbienteVetorizado(2)
+        estado = EstadoCompacto.distribuir(ordem_do_jogo(0))
+        ambiente.carregar(1, estado)
+        self.assertEqual(ambiente.estado(1).chave(), estado.chave())
+
+        acoes, validas = ambiente.acoes_candidatas()
+        escolhidas = self.av.acoes_aleatorias(acoes, validas, np.random.default_rng(0))
+        self.assertTrue(ambiente.mascara_legal()[np.arange(2), escolhidas].all())
+
+        with self.assertRaises(ValueError):
+            ambiente.passo([0, 0], verificar=True)  # ação 0: coluna 0 sobre ela mesma
+        recompensas, vitorias = ambiente.passo([-1, -1])
+        self.assertEqual(recompensas.tolist(), [0, 0])
+        self.assertFalse(vitorias.any())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,72 @@
+# tests/test_banco_jogos.py
+# Testes unitários para o banco de distribuições (arquivo com mmap)
+# Verifica: ordem igual a ordem_do_jogo, anotações do solver, acesso por número
+
+import unittest
+import tempfile
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.game.banco_jogos import (
+    BancoJogos, gerar_banco, contar_bloqueios, NAO_RESOLVIDO, TAMANHO_REGISTRO,
+)
+from src.game.estado_compacto import EstadoCompacto
+from src.game.jogo_yukon import JogoYukon
+from src.game.solver import VITORIA, DESCONHECIDO
+from src.models.baralho import ordem_do_jogo
+
+
+class TestBancoJogos(unittest.TestCase):
+
+    def setUp(self):
+        pasta = tempfile.TemporaryDirectory()
+        self.addCleanup(pasta.cleanup)
+        self.caminho = os.path.join(pasta.name, "jogos.ykdb")
+
+    def test_gera_e_le_por_numero(self):
+        gerar_banco(self.caminho, 30, primeiro_jogo=100, processos=1, tamanho_lote=7)
+        self.assertEqual(os.path.getsize(self.caminho), 24 + 30 * TAMANHO_REGISTRO)
+        with BancoJogos(self.caminho) as banco:
+            self.assertEqual(len(banco), 30)
+            self.assertIn(129, banco)
+            self.assertNotIn(130, banco)
+            for numero in (100, 117, 129):
+                registro = banco.registro(numero)
+                self.assertEqual(list(registro.ordem), ordem_do_jogo(numero))
+                self.assertEqual(registro.status, NAO_RESOLVIDO)
+                self.assertEqual(registro.bloqueios, contar_bloqueios(ordem_do_jogo(numero)))
+            with self.assertRaises(IndexError):
+                banco.ordem(99)
+
+    def test_jogo_e_estado_iguais_a_distribuicao_numerada(self):
+        gerar_banco(self.caminho, 5, processos=1)
+        with BancoJogos(self.caminho) as banco:
+            jogo = banco.jogo(3)
+            self.assertEqual(jogo.numero_jogo, 3)
+            self.assertEqual(EstadoCompacto.de_jogo(jogo).chave(),
+                             EstadoCompacto.de_jogo(JogoYukon(3)).chave())
+            self.assertIs(banco.jogo(4, jogo), jogo)
+            self.assertEqual(EstadoCompacto.de_jogo(jogo).chave(), banco.estado(4).chave())
+
+    def test_anotacoes_do_solver(self):
+        gerar_banco(self.caminho, 3, resolver=True, max_nos=20_000, processos=1)
+        with BancoJogos(self.caminho) as banco:
+            registro = banco.registro(0)
+            self.assertEqual(registro.status, VITORIA)   # o jogo 0 é resolvido rápido
+            self.assertGreater(registro.nos, 0)
+            vitorias = list(banco.numeros(VITORIA))
+            self.assertIn(0, vitorias)
+            self.assertEqual(len(list(banco.numeros())), 3)
+            self.assertNotIn(0, list(banco.numeros(DESCONHECIDO)))
+
+    def test_arquivo_invalido(self):
+        with open(self.caminho, "wb") as arquivo:
+            arquivo.write(b"nada disso" * 5)
+        with self.assertRaises(ValueError):
+            BancoJogos(self.caminho)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
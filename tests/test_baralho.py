@@ -0,0 +1,61 @@
+# tests/test_baralho.py
+# Testes unitários para o Baralho e as distribuições numeradas
+# Verifica: distribuir com cursor, mesmo número = mesmo jogo, reaproveitamento das cartas
+
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.models.baralho import Baralho, ordem_do_jogo
+from src.game.jogo_yukon import JogoYukon
+from src.game.estado_compacto import EstadoCompacto
+
+
+class TestBaralho(unittest.TestCase):
+
+    def test_distribuir_avanca_o_cursor(self):
+        baralho = Baralho(semente=1)
+        baralho.embaralhar()
+        primeiras = baralho.distribuir(5)
+        self.assertEqual(len(baralho), 47)
+        resto = baralho.distribuir(47)
+        self.assertEqual(len(baralho), 0)
+        self.assertEqual(len({c.id for c in primeiras + resto}), 52)
+        with self.assertRaises(ValueError):
+            baralho.distribuir(1)
+
+    def test_embaralhar_com_semente_e_reproduzivel(self):
+        a, b = Baralho(semente=42), Baralho(semente=42)
+        a.embaralhar()
+        b.embaralhar()
+        self.assertEqual([c.id for c in a.cartas], [c.id for c in b.cartas])
+
+    def test_embaralhar_jogo_segue_ordem_do_jogo(self):
+        baralho = Baralho()
+        baralho.embaralhar_jogo(7)
+        self.assertEqual([c.id for c in baralho.cartas], ordem_do_jogo(7))
+        self.assertEqual(ordem_do_jogo(7), ordem_do_jogo(7))
+        self.assertNotEqual(ordem_do_jogo(7), ordem_do_jogo(8))
+
+    def test_jogo_numerado_igual_ao_estado_compacto(self):
+        for numero in (0, 1, 12345):
+            jogo = JogoYukon(numero)
+            self.assertEqual(EstadoCompacto.de_jogo(jogo).chave(),
+                             EstadoCompacto.distribuir(ordem_do_jogo(numero)).chave())
+
+    def test_novo_jogo_reaproveita_as_cartas(self):
+        jogo = JogoYukon(3)
+        cartas = {id(c) for c in jogo.baralho.cartas}
+        jogo.novo_jogo(3)
+        chave = EstadoCompacto.de_jogo(jogo).chave()
+        jogo.novo_jogo(4)
+        jogo.novo_jogo(3)
+        self.assertEqual(EstadoCompacto.de_jogo(jogo).chave(), chave)
+        self.assertEqual({id(c) for c in jogo.baralho.cartas}, cartas)
+        self.assertTrue(all(f.is_vazia() for f in jogo.fundacoes))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
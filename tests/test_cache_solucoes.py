@@ -0,0 +1,136 @@
+# tests/test_cache_solucoes.py
+# Testes unitários para o cache em disco dos vereditos do solver
+# Verifica: linha vencedora gravada, jogada traduzida para outra ordem das
+# colunas, derrota, persistência ao reabrir, descarte das entradas antigas
+
+import unittest
+import tempfile
+import threading
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+from src.game.cache_solucoes import CacheSolucoes
+from src.game.estado_compacto import EstadoCompacto
+from src.game.jogo_yukon import JogoYukon
+from src.game.solver import Solver, VITORIA, DERROTA, DESCONHECIDO, ResultadoSolver
+
+# Final sem cartas viradas: cada naipe que falta está numa coluna, com o Ás no topo
+FINAL = "7P6P5P4P3P2PAP/KPQPJPTP9P8P/KEQEJETE9E8E7E6E5E4E3E2EAE/-/-/-/- KC/KO/-/-"
+# A mesma posição com as colunas e as fundações em outra ordem
+FINAL_PERMUTADO = "-/-/KEQEJETE9E8E7E6E5E4E3E2EAE/-/7P6P5P4P3P2PAP/-/KPQPJPTP9P8P KO/-/KC/-"
+# Perdida: o Ás de espadas está embaixo do 2 ao 5 de espadas
+PERDIDO = "AP2P3P4P5P6P7P/8P9PTPJPQPKP/AE2E3E4E5E/6E7E8E/9ETE/JE/QEKE KC/KO/-/-"
+
+
+class TestCacheSolucoes(unittest.TestCase):
+
+    def setUp(self):
+        pasta = tempfile.TemporaryDirectory()
+        self.addCleanup(pasta.cleanup)
+        self.caminho = os.path.join(pasta.name, "solucoes.sqlite3")
+
+    def abrir(self, **opcoes):
+        cache = CacheSolucoes(self.caminho, **opcoes)
+        self.addCleanup(cache.fechar)
+        return cache
+
+    def test_vitoria_grava_a_linha_inteira(self):
+        cache = self.abrir()
+        estado = EstadoCompacto.de_notacao(FINAL)
+        self.assertIsNone(cache.consultar(estado))
+        resultado = Solver().resolver(estado)
+        self.assertEqual(resultado.status, VITORIA)
+        cache.guardar(estado, resultado)
+        cache.esperar()
+        self.assertEqual(len(cache), len(resultado.movimentos))
+
+        # Cada posição da linha devolve a jogada feita nela
+        for mov in resultado.movimentos:
+            veredito = cache.consultar(estado)
+            self.assertEqual(veredito.status, VITORIA)
+            self.assertEqual(tuple(veredito.movimento), mov)
+            estado.aplicar(mov)
+        self.assertTrue(estado.verificar_vitoria())
+
+    def test_jogada_traduzida_para_outra_ordem_das_colunas(self):
+        cache = self.abrir()
+        estado = EstadoCompacto.de_notacao(FINAL)
+        cache.guardar(estado, Solver().resolver(estado))
+        cache.esperar()
+
+        permutado = EstadoCompacto.de_notacao(FINAL_PERMUTADO)
+        veredito = cache.consultar(permutado)
+        self.assertEqual(veredito.status, VITORIA)
+        self.assertIn(tuple(veredito.movimento), permutado.movimentos())
+        # Seguir as jogadas do cache vence a posição permutada
+        for _ in range(52):
+            if permutado.verificar_vitoria():
+                break
+            self.assertTrue(permutado.aplicar(cache.consultar(permutado).movimento))
+        self.assertTrue(permutado.verificar_vitoria())
+
+    def test_derrota_e_desconhecido(self):
+        cache = self.abrir()
+        perdido = EstadoCompacto.de_notacao(PERDIDO)
+        resultado = Solver().resolver(perdido)
+        self.assertEqual(resultado.status, DERROTA)
+        cache.guardar(perdido, resultado)
+        final = EstadoCompacto.de_notacao(FINAL)
+        cache.guardar(final, ResultadoSolver(DESCONHECIDO, [], 0, 0.0))
+        cache.esperar()
+        self.assertEqual(cache.consultar(perdido), (DERROTA, None))
+        self.assertIsNone(cache.consultar(final))
+
+    def test_persiste_ao_reabrir(self):
+        estado = EstadoCompacto.de_notacao(FINAL)
+        resultado = Solver().resolver(estado)
+        with CacheSolucoes(self.caminho) as cache:
+            cache.guardar(estado, resultado)  # fechar grava o que está na fila
+        cache = self.abrir()
+        self.assertEqual(tuple(cache.consultar(estado).movimento), resultado.movimentos[0])
+
+    def test_descarta_as_mais_antigas(self):
+        cache = self.abrir(max_entradas=20)
+        estado = EstadoCompacto.de_notacao(FINAL)
+        resultado = Solver().resolver(estado)
+        cache.guardar(estado, resultado)  # 26 posições: passa do limite
+        cache.esperar()
+        self.assertLessEqual(len(cache), 20)
+        # Ficam as do fim da linha (gravadas por último)
+        self.assertIsNone(cache.consultar(estado))
+        fim = estado.clone()
+        for mov in resultado.movimentos[:-1]:
+            fim.aplicar(mov)
+        self.assertIsNotNone(cache.consultar(fim))
+
+    @unittest.skipIf(pygame is None, "pygame não instalado")
+    def test_servico_de_dicas_usa_o_cache(self):
+        from src.gui.servico_dicas import ServicoDicas
+        recebidos = []
+        pronto = threading.Event()
+
+        def publicar(geracao, hash_posicao, dicas):
+            recebidos.append(dicas)
+            pronto.set()
+
+        cache = self.abrir()
+        servico = ServicoDicas(publicar, tempo_limite=2.0, cache_solucoes=cache)
+        self.addCleanup(servico.encerrar)
+        jogo = JogoYukon.de_notacao(FINAL)
+        servico.pedir(jogo)
+        self.assertTrue(pronto.wait(10))
+        (movimento, _), = recebidos[0]
+        self.assertIn(movimento, jogo.movimentos_legais())
+        cache.esperar()
+        self.assertEqual(cache.consultar(EstadoCompacto.de_jogo(jogo)).movimento, movimento)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,64 @@
+# tests/test_carta.py
+# Testes unitários para Carta, Naipe e as tabelas de regra pré-calculadas
+# Verifica: ids inteiros, cores, regra do tableau, regra da fundação, cartas compartilhadas
+
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.models.carta import (
+    Carta, Naipe, id_carta, PODE_SOBRE, SEGUE_NA_FUNDACAO, VAZIA,
+    VALOR_ID, NAIPE_ID, VERMELHO_ID,
+)
+
+
+class TestCarta(unittest.TestCase):
+
+    def test_id_segue_ordem_do_baralho(self):
+        self.assertEqual(Carta(1, Naipe.COPAS).id, 0)
+        self.assertEqual(Carta(13, Naipe.COPAS).id, 12)
+        self.assertEqual(Carta(1, Naipe.OUROS).id, 13)
+        self.assertEqual(Carta(13, Naipe.ESPADAS).id, 51)
+
+    def test_tabelas_batem_com_os_atributos(self):
+        for naipe in Naipe.ORDEM:
+            for valor in range(1, 14):
+                c = Carta(valor, naipe)
+                self.assertEqual(VALOR_ID[c.id], valor)
+                self.assertEqual(Naipe.ORDEM[NAIPE_ID[c.id]], naipe)
+                self.assertEqual(VERMELHO_ID[c.id], Naipe.is_vermelho(naipe))
+                self.assertEqual(c.is_preto(), Naipe.is_preto(naipe))
+
+    def test_pode_sobre_igual_a_regra_original(self):
+        for a in range(52):
+            for b in range(52):
+                ca, cb = Carta.da_id(a), Carta.da_id(b)
+                esperado = (ca.valor == cb.valor - 1 and
+                            Naipe.is_vermelho(ca.naipe) != Naipe.is_vermelho(cb.naipe))
+                self.assertEqual(PODE_SOBRE[a * 53 + b], esperado)
+            # Coluna vazia só aceita Rei
+            self.assertEqual(PODE_SOBRE[a * 53 + VAZIA], VALOR_ID[a] == 13)
+
+    def test_segue_na_fundacao(self):
+        as_paus = id_carta(1, Naipe.PAUS)
+        dois_paus = id_carta(2, Naipe.PAUS)
+        dois_espadas = id_carta(2, Naipe.ESPADAS)
+        self.assertTrue(SEGUE_NA_FUNDACAO[as_paus * 53 + VAZIA])
+        self.assertFalse(SEGUE_NA_FUNDACAO[dois_paus * 53 + VAZIA])
+        self.assertTrue(SEGUE_NA_FUNDACAO[dois_paus * 53 + as_paus])
+        self.assertFalse(SEGUE_NA_FUNDACAO[dois_espadas * 53 + as_paus])
+
+    def test_cartas_compartilhadas(self):
+        ids = {Carta.da_id(i).id for i in range(52)}
+        self.assertEqual(ids, set(range(52)))
+        self.assertIs(Carta.da_id(7), Carta.da_id(7))
+
+    def test_naipe_invalido(self):
+        with self.assertRaises(ValueError):
+            Carta(1, "estrelas")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,105 @@
+# tests/test_estado_compacto.py
+# Testes unitários para EstadoCompacto
+# Verifica: conversão a partir do JogoYukon, clone independente e mesmas regras de movimento
+
+import unittest
+import random
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.game.jogo_yukon import JogoYukon
+from src.game.estado_compacto import EstadoCompacto, MOV_TABLEAU
+from src.models.carta import Carta, Naipe, VAZIA
+
+
+class TestEstadoCompacto(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(2025)
+        self.jogo = JogoYukon()
+        self.estado = EstadoCompacto.de_jogo(self.jogo)
+
+    def test_de_jogo_copia_colunas_e_viradas(self):
+        for col, pilha in enumerate(self.jogo.tableau):
+            self.assertEqual(self.estado.tamanho(col), pilha.tamanho())
+            self.assertEqual(self.estado.ocultas(col), col)
+            self.assertEqual(self.estado.coluna(col), bytes(c.id for c in pilha.cartas))
+        for f in range(4):
+            self.assertEqual(self.estado.topo_fundacao(f), VAZIA)
+
+    def test_clone_e_independente(self):
+        copia = self.estado.clone()
+        self.assertEqual(copia.chave(), self.estado.chave())
+        copia.dados[0] = 0
+        self.assertNotEqual(copia.chave(), self.estado.chave())
+
+    def test_mover_da_fundacao_devolve_topo_anterior(self):
+        self.jogo.tableau[0].cartas.clear()
+        rei = Carta(13, Naipe.PAUS); rei.virar()
+        self.jogo.tableau[0].push(rei)
+        for valor in (1, 2, 3):
+            self.jogo.fundacoes[0].push(Carta(valor, Naipe.COPAS))
+        estado = EstadoCompacto.de_jogo(self.jogo)
+        self.assertFalse(estado.mover_da_fundacao(0, 0))  # 3 não vai sobre Rei
+        self.assertFalse(estado.mover_para_fundacao(0, 1))  # Rei não vai para fundação vazia
+        self.assertEqual(estado.topo_fundacao(0), Carta(3, Naipe.COPAS).id)
+
+    def test_mesmas_regras_que_jogo_yukon(self):
+        # Joga partidas aleatórias nas duas representações e compara a cada lance
+        rng = random.Random(7)
+        for _ in range(200):
+            movimentos = []
+            for o in range(7):
+                for i in range(self.estado.ocultas(o), self.estado.tamanho(o)):
+                    for d in range(7):
+                        movimentos.append(("sub", o, i, d))
+                for f in range(4):
+                    movimentos.append(("para", o, f))
+            for f in range(4):
+                for d in range(7):
+                    movimentos.append(("da", f, d))
+            rng.shuffle(movimentos)
+            for mov in movimentos:
+                if mov[0] == "sub":
+                    ok_jogo = self.jogo.mover_subpilha(*mov[1:])
+                    ok_estado = self.estado.mover_subpilha(*mov[1:])
+                elif mov[0] == "para":
+                    ok_jogo = self.jogo.mover_para_fundacao(*mov[1:])
+                    ok_estado = self.estado.mover_para_fundacao(*mov[1:])
+                else:
+                    ok_jogo = self.jogo.mover_da_fundacao(*mov[1:])
+                    ok_estado = self.estado.mover_da_fundacao(*mov[1:])
+                self.assertEqual(ok_jogo, ok_estado, mov)
+                if ok_jogo:
+                    break
+            self.assertEqual(EstadoCompacto.de_jogo(self.jogo).chave(), self.estado.chave())
+
+    def test_movimentos_sao_exatamente_os_validos(self):
+        rng = random.Random(11)
+        estado = EstadoCompacto.distribuir(rng.sample(range(52), 52))
+        for _ in range(100):
+            movimentos = estado.movimentos()
+            for mov in movimentos:
+                self.assertTrue(estado.clone().aplicar(mov), mov)
+            # Nenhum movimento de tableau válido ficou de fora
+            validos = {
+                (MOV_TABLEAU, o, i, d)
+                for o in range(7) for i in range(estado.ocultas(o), estado.tamanho(o)) for d in range(7)
+                if estado.clone().mover_subpilha(o, i, d)
+            }
+            self.assertEqual(validos, {m for m in movimentos if m[0] == MOV_TABLEAU})
+            if not movimentos:
+                break
+            estado.aplicar(rng.choice(movimentos))
+
+    def test_distribuir_segue_layout_inicial(self):
+        estado = EstadoCompacto.distribuir(list(range(52)))
+        self.assertEqual([estado.tamanho(c) for c in range(7)], [1, 6, 7, 8, 9, 10, 11])
+        self.assertEqual([estado.ocultas(c) for c in range(7)], [0, 1, 2, 3, 4, 5, 6])
+        self.assertEqual(estado.coluna(1), bytes(range(1, 7)))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,60 @@
+# tests/test_estimador.py
+# Testes unitários para o estimador de Monte Carlo
+# Verifica: intervalo de Wilson, sorteio só das cartas ocultas, reprodutibilidade
+
+import unittest
+import random
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.game.estado_compacto import EstadoCompacto
+from src.game.jogo_yukon import JogoYukon
+from src.models.baralho import ordem_do_jogo
+from src.sim.estimador import estimar, intervalo_wilson, sortear_ocultas
+
+
+class TestEstimador(unittest.TestCase):
+
+    def test_intervalo_wilson(self):
+        baixo, alto = intervalo_wilson(50, 100)
+        self.assertAlmostEqual(baixo, 0.4038, places=3)
+        self.assertAlmostEqual(alto, 0.5962, places=3)
+        self.assertEqual(intervalo_wilson(0, 0), (0.0, 1.0))
+        baixo, alto = intervalo_wilson(0, 10)
+        self.assertEqual(baixo, 0.0)
+        self.assertGreater(alto, 0.0)   # nunca vitória ainda deixa margem
+
+    def test_sorteio_so_mexe_nas_ocultas(self):
+        estado = EstadoCompacto.distribuir(ordem_do_jogo(3))
+        amostra = sortear_ocultas(estado, random.Random(1))
+        self.assertNotEqual(amostra.chave(), estado.chave())
+        for col in range(7):
+            ocultas = estado.ocultas(col)
+            self.assertEqual(amostra.ocultas(col), ocultas)
+            self.assertEqual(amostra.coluna(col)[ocultas:], estado.coluna(col)[ocultas:])
+        todas = lambda e: sorted(b for col in range(7) for b in e.coluna(col))
+        self.assertEqual(todas(amostra), todas(estado))
+
+    def test_reproduzivel_e_independente_dos_processos(self):
+        jogo = JogoYukon(5)
+        um = estimar(jogo, max_rodadas=6, tempo_limite=60, processos=1, rodadas_por_lote=4)
+        dois = estimar(jogo, max_rodadas=6, tempo_limite=60, processos=2, rodadas_por_lote=4)
+        self.assertEqual(um.rodadas, 6)
+        self.assertEqual(um.posicao, dois.posicao)
+        self.assertEqual(um.movimentos, dois.movimentos)
+        self.assertEqual(sorted(e.movimento for e in um.movimentos),
+                         sorted(jogo.movimentos_legais()))
+        for e in um.movimentos:
+            self.assertEqual(e.partidas, 6)
+            self.assertLessEqual(e.baixo, e.taxa_vitoria)
+            self.assertLessEqual(e.taxa_vitoria, e.alto)
+
+    def test_politica_desconhecida(self):
+        with self.assertRaises(ValueError):
+            estimar(JogoYukon(1), politica="inexistente", processos=1)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
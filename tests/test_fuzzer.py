@@ -0,0 +1,50 @@
+# tests/test_fuzzer.py
+# Testes unitários para o fuzzer do motor do jogo
+# Verifica: uma rodada curta sem falhas, o encolhimento de uma falha provocada
+# e a sondagem (aplicar + desfazer(mov))
+
+import unittest
+from unittest import mock
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.models.pilha import Pilha
+from src.sim.fuzzer import ACAO_DESFAZER, ACAO_MOVER, ACAO_SONDAR, fuzz, reproduzir
+
+
+class TestFuzzer(unittest.TestCase):
+
+    def test_rodada_curta_sem_falhas(self):
+        r = fuzz(3000, processos=1, passos_por_jogo=300, conferir_a_cada=16)
+        self.assertIsNone(r.falha)
+        self.assertEqual((r.jogos, r.passos), (10, 3000))
+
+    def test_falha_encolhida_ate_o_minimo(self):
+        # Defeito de propósito: desfazer deixa de desvirar a carta
+        with mock.patch.object(Pilha, "esconder_topo", lambda pilha: None):
+            r = fuzz(400, processos=1, passos_por_jogo=200)
+            self.assertIsNotNone(r.falha)
+            # O mínimo é uma jogada que vira carta seguida de desfazer
+            acoes = r.falha.acoes
+            self.assertEqual([acao[0] for acao in acoes], [ACAO_MOVER, ACAO_DESFAZER])
+            self.assertIn("desfazer", r.falha.mensagem)
+            self.assertIn(f"Jogo nº {r.falha.numero}", str(r.falha))
+            self.assertIsNotNone(reproduzir(r.falha.numero, acoes))
+        # Sem o defeito, a mesma sequência passa
+        self.assertIsNone(reproduzir(r.falha.numero, acoes))
+
+    def test_sondagem_volta_a_posicao_exata(self):
+        # Jogo nº 2: a coluna 2 vira uma carta ao levar a sequência para a 1
+        acoes = [(ACAO_SONDAR, 0, 2, 2, 1), (ACAO_MOVER, 0, 2, 2, 1), (ACAO_DESFAZER,)]
+        self.assertIsNone(reproduzir(2, acoes))
+        with mock.patch.object(Pilha, "esconder_topo", lambda pilha: None):
+            indice, mensagem = reproduzir(2, acoes)
+        self.assertEqual(indice, 0)
+        self.assertIn("sondagem", mensagem)
+        self.assertIn("coluna 2", mensagem)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,126 @@
+# tests/test_impasse.py
+# Testes unitários para o detector de impasse
+# Verifica: tabela de repetições, prova de "sem progresso", diagnóstico (inteiro e
+# aos poucos) e uso pelo solver
+
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.game.estado_compacto import (
+    EstadoCompacto, OFF_TAMANHO, OFF_OCULTAS, OFF_FUNDACAO, OFF_COLUNAS, POSICOES_POR_COLUNA,
+)
+from src.game.impasse import (
+    DetectorImpasse, provar_sem_progresso, SEM_MOVIMENTOS, SO_REPETICOES, SEM_PROGRESSO,
+)
+from src.game.jogo_yukon import JogoYukon
+from src.game.solver import Solver, DERROTA
+
+# Ids das cartas usadas (naipe * 13 + valor - 1)
+AS_COPAS, SEIS_COPAS, NOVE_COPAS, DAMA_COPAS = 0, 5, 8, 11
+DOIS_OUROS, SEIS_OUROS = 14, 18
+CINCO_PAUS, REI_PAUS = 30, 38
+OITO_ESPADAS, REI_ESPADAS = 46, 51
+
+
+def montar(colunas, ocultas=None):
+    """EstadoCompacto com as colunas dadas (ids, fundo → topo) e fundações vazias."""
+    estado = EstadoCompacto()
+    dados = estado.dados
+    for col, cartas in enumerate(colunas):
+        base = OFF_COLUNAS + col * POSICOES_POR_COLUNA
+        dados[base:base + len(cartas)] = bytes(cartas)
+        dados[OFF_TAMANHO + col] = len(cartas)
+        dados[OFF_OCULTAS + col] = (ocultas or {}).get(col, 0)
+    return estado
+
+
+class TestImpasse(unittest.TestCase):
+
+    def test_sem_movimentos(self):
+        # 5♣ sobre uma carta virada, sem onde encaixar
+        estado = montar([[AS_COPAS, CINCO_PAUS]], {0: 1})
+        self.assertEqual(estado.movimentos(), [])
+        self.assertTrue(provar_sem_progresso(estado))
+        self.assertEqual(DetectorImpasse().verificar(estado), SEM_MOVIMENTOS)
+
+    def test_rei_passeando_nao_e_progresso(self):
+        # O Rei pode ir de coluna vazia em coluna vazia para sempre
+        estado = montar([[AS_COPAS, CINCO_PAUS], [REI_ESPADAS, DAMA_COPAS]], {0: 1})
+        self.assertTrue(estado.movimentos())
+        self.assertTrue(provar_sem_progresso(estado))
+        self.assertEqual(DetectorImpasse().verificar(estado), SEM_PROGRESSO)
+
+    def test_carta_virada_e_progresso(self):
+        estado = montar([[DOIS_OUROS, CINCO_PAUS], [SEIS_COPAS]], {0: 1})
+        self.assertFalse(provar_sem_progresso(estado))
+        self.assertIsNone(DetectorImpasse().verificar(estado))
+
+    def test_verificacao_aos_poucos(self):
+        # Um passo por chamada (como a interface, um pedaço por frame); a Dama
+        # de copas vai e volta entre os Reis pretos, sem progresso
+        estado = montar([[AS_COPAS, CINCO_PAUS], [REI_ESPADAS, DAMA_COPAS], [REI_PAUS]], {0: 1})
+        verificacao = DetectorImpasse().iniciar(estado)
+        chamadas = 1
+        while not verificacao.avancar(1):
+            self.assertIsNone(verificacao.motivo)
+            chamadas += 1
+        self.assertGreater(chamadas, 1)
+        self.assertEqual(verificacao.motivo, SEM_PROGRESSO)
+        self.assertTrue(verificacao.avancar(1))
+        # Sem movimentos: pronta sem avançar
+        self.assertTrue(DetectorImpasse().iniciar(montar([[AS_COPAS, CINCO_PAUS]], {0: 1})).pronta)
+
+    def test_limite_de_nos_nao_prova(self):
+        self.assertFalse(provar_sem_progresso(EstadoCompacto.de_jogo(JogoYukon(3)), limite_nos=1))
+
+    def test_vitoria_nao_e_impasse(self):
+        estado = EstadoCompacto()
+        estado.dados[OFF_FUNDACAO:OFF_COLUNAS] = bytes((12, 25, 38, 51))
+        self.assertFalse(provar_sem_progresso(estado))
+        self.assertIsNone(DetectorImpasse().verificar(estado))
+
+    def test_tabela_de_repeticoes_ignora_ordem_das_colunas(self):
+        detector = DetectorImpasse()
+        estado = montar([[REI_ESPADAS], [SEIS_COPAS]])
+        trocado = montar([[], [SEIS_COPAS], [REI_ESPADAS]])
+        self.assertEqual(detector.registrar(estado), 1)
+        self.assertTrue(detector.ja_vista(trocado))
+        self.assertFalse(detector.registrar_nova(trocado))
+        self.assertEqual(detector.registrar(trocado), 2)
+        self.assertEqual(detector.vezes(estado), 2)
+        detector.limpar()
+        self.assertFalse(detector.ja_vista(estado))
+
+    def test_so_repeticoes(self):
+        # Há progresso (8♠ 5♣ sobre o 9♥ vira uma carta), mas o jogador já
+        # passou por todas as posições seguintes
+        estado = montar([[DOIS_OUROS, OITO_ESPADAS, CINCO_PAUS], [SEIS_COPAS], [SEIS_OUROS],
+                         [NOVE_COPAS]], {0: 1})
+        detector = DetectorImpasse()
+        detector.registrar(estado)
+        self.assertIsNone(detector.verificar(estado))
+        for mov in estado.movimentos():
+            filho = estado.clone()
+            filho.aplicar(mov)
+            detector.registrar(filho)
+        self.assertEqual(detector.verificar(estado), SO_REPETICOES)
+
+    def test_aceita_jogo_yukon(self):
+        jogo = JogoYukon(3)
+        detector = DetectorImpasse()
+        self.assertEqual(detector.registrar(jogo), 1)
+        self.assertTrue(detector.ja_vista(EstadoCompacto.de_jogo(jogo)))
+        self.assertIsNone(detector.verificar(jogo))
+
+    def test_solver_encerra_posicao_sem_progresso(self):
+        estado = montar([[AS_COPAS, CINCO_PAUS], [REI_ESPADAS, DAMA_COPAS]], {0: 1})
+        resultado = Solver().resolver(estado)
+        self.assertEqual(resultado.status, DERROTA)
+        self.assertEqual(resultado.nos, 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
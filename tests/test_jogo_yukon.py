@@ -3,12 +3,16 @@
 # Força Ás virado e usa Naipe corretamente
 
 import unittest
+import random
 import sys
 import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from src.game.jogo_yukon import JogoYukon
+from src.game.estado_compacto import EstadoCompacto
+from src.game.movimento import MOV_TABLEAU
+from src.game.zobrist import hash_jogo
 from src.models.carta import Carta, Naipe
 from src.models.pilha import Pilha
 
@@ -76,6 +80,145 @@ class TestJogoYukon(unittest.TestCase):
 
         self.assertTrue(self.jogo.verificar_vitoria())
 
+    def test_movimentos_legais_acompanham_as_jogadas(self):
+        # O índice incremental deve dar sempre a mesma lista que uma varredura completa
+        rng = random.Random(3)
+        for _ in range(150):
+            movimentos = self.jogo.movimentos_legais()
+            self.assertEqual(movimentos, EstadoCompacto.de_jogo(self.jogo).movimentos())
+            if not movimentos:
+                break
+            self.assertTrue(self.jogo.aplicar(rng.choice(movimentos)))
+
+    def test_reindexar_depois_de_editar_pilhas(self):
+        for pilha in self.jogo.tableau:
+            pilha.cartas.clear()
+        rei_paus = Carta(13, Naipe.PAUS); rei_paus.virar()
+        dama_copas = Carta(12, Naipe.COPAS); dama_copas.virar()
+        self.jogo.tableau[0].push(rei_paus)
+        self.jogo.tableau[1].push(dama_copas)
+        self.jogo.reindexar()
+        self.assertIn((MOV_TABLEAU, 1, 0, 0), self.jogo.movimentos_legais())
+        self.assertEqual(self.jogo.movimentos_legais(),
+                         EstadoCompacto.de_jogo(self.jogo).movimentos())
+
+    def _jogar_aleatorio(self, rng, jogadas):
+        feitas = 0
+        for _ in range(jogadas):
+            movimentos = self.jogo.movimentos_legais()
+            if not movimentos:
+                break
+            self.jogo.aplicar(rng.choice(movimentos))
+            feitas += 1
+        return feitas
+
+    def test_desfazer_e_refazer(self):
+        inicial = EstadoCompacto.de_jogo(self.jogo).chave()
+        feitas = self._jogar_aleatorio(random.Random(5), 80)
+        final = EstadoCompacto.de_jogo(self.jogo).chave()
+
+        # Desfazer tudo volta à distribuição, inclusive desvirando as cartas
+        for _ in range(feitas):
+            self.assertTrue(self.jogo.desfazer())
+        self.assertFalse(self.jogo.desfazer())
+        self.assertEqual(EstadoCompacto.de_jogo(self.jogo).chave(), inicial)
+        self.assertEqual(self.jogo.movimentos_legais(),
+                         EstadoCompacto.de_jogo(self.jogo).movimentos())
+
+        # Refazer tudo volta à posição final
+        for _ in range(feitas):
+            self.assertTrue(self.jogo.refazer())
+        self.assertFalse(self.jogo.refazer())
+        self.assertEqual(EstadoCompacto.de_jogo(self.jogo).chave(), final)
+
+    def test_movimento_novo_apaga_refazer(self):
+        self._jogar_aleatorio(random.Random(7), 3)
+        self.jogo.desfazer()
+        self.assertTrue(self.jogo.pode_refazer())
+        self._jogar_aleatorio(random.Random(8), 1)
+        self.assertFalse(self.jogo.pode_refazer())
+
+    def test_limite_do_historico(self):
+        jogo = JogoYukon(limite_historico=8)
+        self.jogo = jogo
+        feitas = self._jogar_aleatorio(random.Random(1), 40)
+        desfeitas = 0
+        while jogo.desfazer():
+            desfeitas += 1
+        self.assertLessEqual(desfeitas, 8)
+        self.assertGreater(desfeitas, 0)
+        self.assertLessEqual(desfeitas, feitas)
+
+    def test_snapshot_guarda_a_fronteira_de_ocultas(self):
+        snapshot = self.jogo.salvar_estado()
+        chave = EstadoCompacto.de_jogo(self.jogo).chave()
+        self._jogar_aleatorio(random.Random(9), 60)
+        self.jogo.restaurar_estado(snapshot)
+        self.assertEqual(EstadoCompacto.de_jogo(self.jogo).chave(), chave)
+        self.assertEqual([p.ocultas for p in self.jogo.tableau], list(range(7)))
+        # O espelho face_up acompanha a fronteira
+        for pilha in self.jogo.tableau:
+            self.assertEqual([c.face_up for c in pilha.cartas],
+                             [pilha.visivel(i) for i in range(pilha.tamanho())])
+
+    def test_nao_move_carta_oculta(self):
+        pilha = self.jogo.tableau[6]
+        self.assertFalse(pilha.visivel(0))
+        for destino in range(6):
+            self.assertFalse(self.jogo.mover_subpilha(6, 0, destino))
+
+    def _mesa_para_coleta(self):
+        # Coluna 0: 5♣, 2♥, A♥ (topo) e coluna 1: 3♥; o resto vazio
+        for pilha in self.jogo.tableau + self.jogo.fundacoes:
+            pilha.definir_cartas([])
+        self.jogo.tableau[0].definir_cartas([Carta.da_id(30), Carta.da_id(1), Carta.da_id(0)])
+        self.jogo.tableau[1].definir_cartas([Carta.da_id(2)])
+        self.jogo.reindexar()
+        self.jogo.limpar_historico()
+
+    def test_coletar_seguras_em_um_lote(self):
+        self._mesa_para_coleta()
+        inicial = EstadoCompacto.de_jogo(self.jogo).chave()
+        # A♥ e 2♥ são seguras; o 3♥ ainda pode receber um 2 preto
+        self.assertEqual(self.jogo.coletar_seguras(), 2)
+        self.assertEqual(self.jogo.fundacoes[0].tamanho(), 2)
+        self.assertEqual(self.jogo.tableau[1].tamanho(), 1)
+        final = EstadoCompacto.de_jogo(self.jogo).chave()
+        self.assertEqual(self.jogo.coletar_seguras(), 0)
+
+        # Um desfazer volta o lote inteiro; um refazer refaz o lote inteiro
+        self.assertTrue(self.jogo.desfazer())
+        self.assertFalse(self.jogo.pode_desfazer())
+        self.assertEqual(EstadoCompacto.de_jogo(self.jogo).chave(), inicial)
+        self.assertTrue(self.jogo.refazer())
+        self.assertFalse(self.jogo.pode_refazer())
+        self.assertEqual(EstadoCompacto.de_jogo(self.jogo).chave(), final)
+        self.assertEqual(self.jogo.hash_zobrist, hash_jogo(self.jogo))
+
+    def test_desfazer_mov_volta_so_uma_entrada_do_lote(self):
+        self._mesa_para_coleta()
+        inicial = EstadoCompacto.de_jogo(self.jogo).chave()
+        self.assertEqual(self.jogo.coletar_seguras(), 2)
+        # O 2♥ (última entrada do lote) volta sozinho; o A♥ fica na fundação
+        self.assertTrue(self.jogo.desfazer(self.jogo.ultimo_movimento()))
+        self.assertEqual(self.jogo.fundacoes[0].tamanho(), 1)
+        self.assertEqual(self.jogo.tableau[0].tamanho(), 2)
+        self.assertEqual(self.jogo.hash_zobrist, hash_jogo(self.jogo))
+        # O desfazer do jogador leva o que sobrou do lote
+        self.assertTrue(self.jogo.desfazer())
+        self.assertFalse(self.jogo.pode_desfazer())
+        self.assertEqual(EstadoCompacto.de_jogo(self.jogo).chave(), inicial)
+
+    def test_coleta_agrupada_com_a_jogada(self):
+        self._mesa_para_coleta()
+        inicial = EstadoCompacto.de_jogo(self.jogo).chave()
+        self.assertFalse(self.jogo.mover_para_fundacao(1))  # 3♥ ainda não tem onde entrar
+        self.assertTrue(self.jogo.mover_para_fundacao(0))   # A♥: a fundação é escolhida
+        self.assertEqual(self.jogo.coletar_seguras(agrupar=True), 1)
+        self.assertTrue(self.jogo.desfazer())
+        self.assertFalse(self.jogo.pode_desfazer())
+        self.assertEqual(EstadoCompacto.de_jogo(self.jogo).chave(), inicial)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
@@ -0,0 +1,117 @@
+# tests/test_movimento.py
+# Testes unitários para Movimento e o par aplicar/desfazer do JogoYukon
+# Verifica: compatibilidade com tuplas, busca com aplicar/desfazer sem snapshot,
+# par aplicar/desfazer sem rastro no histórico do jogador
+
+import unittest
+import random
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.game.jogo_yukon import JogoYukon
+from src.game.estado_compacto import EstadoCompacto
+from src.game.movimento import Movimento, MOV_TABLEAU, MOV_DA_FUNDACAO
+
+
+class TestMovimento(unittest.TestCase):
+
+    def setUp(self):
+        self.jogo = JogoYukon(21)
+
+    def test_igual_a_tupla(self):
+        mov = Movimento(MOV_TABLEAU, 3, 5, 1)
+        self.assertEqual(mov, (MOV_TABLEAU, 3, 5, 1))
+        self.assertEqual(hash(mov), hash((MOV_TABLEAU, 3, 5, 1)))
+        self.assertEqual(mov.inicio, 5)
+        self.assertEqual(str(mov), "tableau 3[5] → 1")
+        self.assertEqual(str(Movimento(MOV_DA_FUNDACAO, 2, 0, 4)), "da fundação 2 → 4")
+        with self.assertRaises(AttributeError):
+            mov.destino = 2
+
+    def test_gerar_movimentos(self):
+        movimentos = list(self.jogo.gerar_movimentos())
+        self.assertTrue(all(isinstance(m, Movimento) for m in movimentos))
+        self.assertEqual(movimentos, EstadoCompacto.de_jogo(self.jogo).movimentos())
+
+    def test_aplicar_e_desfazer_voltam_a_mesma_posicao(self):
+        # Busca em profundidade 2 só com aplicar/desfazer
+        chave = EstadoCompacto.de_jogo(self.jogo).chave()
+        hash_inicial = self.jogo.hash_zobrist
+        for mov in self.jogo.gerar_movimentos():
+            self.assertTrue(self.jogo.aplicar(mov))
+            self.assertEqual(self.jogo.ultimo_movimento(), mov)
+            for resposta in self.jogo.gerar_movimentos():
+                self.assertTrue(self.jogo.aplicar(resposta))
+                self.assertTrue(self.jogo.desfazer(resposta))
+            self.assertTrue(self.jogo.desfazer(mov))
+            self.assertEqual(self.jogo.hash_zobrist, hash_inicial)
+            self.assertEqual(EstadoCompacto.de_jogo(self.jogo).chave(), chave)
+
+    def test_desfazer_movimento_errado(self):
+        rng = random.Random(1)
+        mov = rng.choice(self.jogo.movimentos_legais())
+        with self.assertRaises(ValueError):
+            self.jogo.desfazer(mov)   # nada aplicado ainda
+        self.jogo.aplicar(mov)
+        outro = Movimento(mov.tipo, mov.origem, mov.inicio + 1, mov.destino)
+        with self.assertRaises(ValueError):
+            self.jogo.desfazer(outro)
+        self.assertTrue(self.jogo.desfazer(mov))
+
+    def _jogar(self, rng, jogadas):
+        for _ in range(jogadas):
+            self.jogo.aplicar(rng.choice(self.jogo.movimentos_legais()))
+
+    def test_sondagem_nao_mexe_no_refazer(self):
+        rng = random.Random(3)
+        self._jogar(rng, 4)
+        self.assertTrue(self.jogo.desfazer())
+        self.assertTrue(self.jogo.desfazer())
+        apos_refazer = []
+        for _ in range(2):
+            self.assertTrue(self.jogo.refazer())
+            apos_refazer.append(EstadoCompacto.de_jogo(self.jogo).chave())
+        self.jogo.desfazer()
+        self.jogo.desfazer()
+
+        # Uma busca sonda as jogadas da posição (profundidade 2)
+        for mov in self.jogo.gerar_movimentos():
+            self.jogo.aplicar(mov)
+            self.assertFalse(self.jogo.pode_refazer())
+            for resposta in self.jogo.gerar_movimentos():
+                self.jogo.aplicar(resposta)
+                self.jogo.desfazer(resposta)
+            self.jogo.desfazer(mov)
+
+        # O refazer do jogador continua o mesmo
+        self.assertTrue(self.jogo.pode_refazer())
+        for chave in apos_refazer:
+            self.assertTrue(self.jogo.refazer())
+            self.assertEqual(EstadoCompacto.de_jogo(self.jogo).chave(), chave)
+        self.assertFalse(self.jogo.refazer())
+
+    def test_sondagem_no_limite_nao_corta_o_diario(self):
+        self.jogo = JogoYukon(21, limite_historico=8)
+        self._jogar(random.Random(4), 8)
+        diario = self.jogo._diario.tolist()
+        mov = self.jogo.movimentos_legais()[0]
+        self.jogo.aplicar(mov)           # passa do limite: corta o mais antigo
+        self.assertLess(len(self.jogo._diario), len(diario))
+        self.jogo.desfazer(mov)
+        self.assertEqual(self.jogo._diario.tolist(), diario)
+
+    def test_desfazer_abaixo_do_refazer_o_descarta(self):
+        self._jogar(random.Random(5), 3)
+        self.jogo.desfazer()
+        self.assertTrue(self.jogo.pode_refazer())
+        # A busca volta uma jogada do jogador e joga outra no lugar
+        self.jogo.desfazer(self.jogo.ultimo_movimento())
+        self.jogo.aplicar(self.jogo.movimentos_legais()[-1])
+        self.assertFalse(self.jogo.pode_refazer())
+        self.assertFalse(self.jogo.refazer())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
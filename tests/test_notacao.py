@@ -0,0 +1,101 @@
+# tests/test_notacao.py
+# Testes unitários para a notação de posição em uma linha
+# Verifica: ida e volta (JogoYukon e EstadoCompacto), fundações implícitas, erros
+
+import unittest
+import random
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.game.estado_compacto import EstadoCompacto
+from src.game.jogo_yukon import JogoYukon
+from src.game.movimento import Movimento, MOV_PARA_FUNDACAO
+from src.game.notacao import CODIGOS, ler_notacao
+from src.models.baralho import ordem_do_jogo
+from src.models.carta import VAZIA
+
+# Copas e ouros completos nas fundações; paus e espadas espalhados no tableau
+QUASE_GANHO = "AP2P3P4P5P6P7P/8P9PTPJPQPKP/AE|2E3E4E5E/6E7E8E/9ETE/JE/QEKE KC/KO/-/-"
+
+
+def jogar(jogo, lances, semente):
+    rng = random.Random(semente)
+    for _ in range(lances):
+        movimentos = jogo.movimentos_legais()
+        if not movimentos:
+            break
+        jogo.aplicar(rng.choice(movimentos))
+
+
+class TestNotacao(unittest.TestCase):
+
+    def test_distribuicao_inicial(self):
+        jogo = JogoYukon(7)
+        ordem = ordem_do_jogo(7)
+        colunas = jogo.notacao().split()[0].split("/")
+        self.assertEqual(colunas[0], CODIGOS[ordem[0]])
+        self.assertEqual(colunas[1], CODIGOS[ordem[1]] + "|"
+                         + "".join(CODIGOS[i] for i in ordem[2:7]))
+        self.assertTrue(jogo.notacao().endswith(" -/-/-/-"))
+
+    def test_ida_e_volta(self):
+        for numero in range(30):
+            jogo = JogoYukon(numero)
+            jogar(jogo, 40, numero)
+            texto = jogo.notacao()
+            estado = EstadoCompacto.de_jogo(jogo)
+            self.assertEqual(estado.notacao(), texto)
+            self.assertEqual(EstadoCompacto.de_notacao(texto).chave(), estado.chave())
+            lido = JogoYukon.de_notacao(texto)
+            self.assertEqual(lido.notacao(), texto)
+            self.assertEqual(lido.hash_zobrist, jogo.hash_zobrist)
+            self.assertEqual(sorted(lido.movimentos_legais()), sorted(jogo.movimentos_legais()))
+
+    def test_fundacoes_implicitas(self):
+        jogo = JogoYukon.de_notacao(QUASE_GANHO)
+        self.assertIsNone(jogo.numero_jogo)
+        self.assertEqual([f.tamanho() for f in jogo.fundacoes], [13, 13, 0, 0])
+        self.assertEqual([c.id for c in jogo.fundacoes[1].cartas], list(range(13, 26)))
+        self.assertEqual(jogo.tableau[2].ocultas, 1)
+        self.assertFalse(jogo.aplicar(Movimento(MOV_PARA_FUNDACAO, 0, 6, 2)))  # 7♣ sem o Ás
+        estado = EstadoCompacto.de_notacao(QUASE_GANHO)
+        self.assertEqual(estado.topo_fundacao(0), 12)
+        self.assertEqual(estado.topo_fundacao(2), VAZIA)
+        self.assertEqual(estado.cartas_na_fundacao(), 26)
+
+    def test_carregar_reaproveita_o_jogo(self):
+        jogo = JogoYukon(3)
+        jogar(jogo, 10, 3)
+        jogo.carregar_notacao(QUASE_GANHO)
+        self.assertEqual(jogo.notacao(), QUASE_GANHO)
+        self.assertFalse(jogo.pode_desfazer())
+        self.assertEqual(sum(p.tamanho() for p in jogo.tableau + jogo.fundacoes), 52)
+
+    def test_posicoes_invalidas(self):
+        colunas, fundacoes = QUASE_GANHO.split()
+        invalidas = [
+            "",
+            colunas,                                          # sem fundações
+            colunas + "/- " + fundacoes,                      # 8 colunas
+            colunas.replace("AP", "1P") + " " + fundacoes,    # carta desconhecida
+            colunas.replace("AP", "A") + " " + fundacoes,     # carta pela metade
+            colunas.replace("QEKE", "QE|") + " KC/KO/KE/-",   # topo virado
+            colunas + " KC/KO/-/2P",                          # 2♣ repetido
+            colunas + " KC/QO/-/-",                           # falta o K♦
+            colunas + " KC/KO/-/-/-",                         # 5 fundações
+        ]
+        for texto in invalidas:
+            with self.subTest(texto=texto):
+                with self.assertRaises(ValueError):
+                    ler_notacao(texto)
+        jogo = JogoYukon(1)
+        antes = jogo.notacao()
+        with self.assertRaises(ValueError):
+            jogo.carregar_notacao(invalidas[-2])
+        self.assertEqual(jogo.notacao(), antes)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
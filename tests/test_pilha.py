@@ -3,6 +3,7 @@
 # Verifica: push, pop, subpilhas, regras de movimento
 
 import unittest
+import random
 import sys
 import os
 
@@ -70,6 +71,132 @@ class TestPilha(unittest.TestCase):
         p.pop()
         self.assertTrue(fundo.face_up)  # Virou automaticamente
 
+    def test_push_oculta_nao_depende_de_outras_pilhas(self):
+        # A mesma carta (flyweight) em duas pilhas: a visibilidade é de cada pilha
+        outra = Pilha()
+        outra.definir_cartas([Carta.da_id(7)])
+        p = Pilha()
+        p.push(Carta.da_id(7), oculta=True)
+        self.assertEqual((p.ocultas, outra.ocultas), (1, 0))
+        visivel = Pilha()
+        visivel.push(Carta.da_id(7))
+        self.assertEqual(visivel.ocultas, 0)
+        with self.assertRaises(ValueError):
+            visivel.push(Carta.da_id(8), oculta=True)  # Não fica sobre carta visível
+
+    def test_face_up_e_so_leitura(self):
+        carta = Carta(9, Naipe.OUROS)
+        self.assertFalse(carta.face_up)   # Fora de qualquer pilha
+        carta.virar()                     # Compatibilidade: não muda a carta
+        p = Pilha()
+        p.push(carta, oculta=True)
+        self.assertFalse(carta.face_up)
+        p.virar_topo_se_necessario()
+        self.assertTrue(carta.face_up)
+        with self.assertRaises(AttributeError):
+            carta.face_up = False
+
+    def test_vista_subpilha_sem_copia(self):
+        p = Pilha()
+        k = Carta(13, Naipe.PAUS); k.virar()
+        q = Carta(12, Naipe.COPAS); q.virar()
+        j = Carta(11, Naipe.OUROS); j.virar()
+        p.push(k); p.push(q); p.push(j)
+        vista = p.vista(1)
+        self.assertEqual(len(vista), 2)
+        self.assertIs(vista[0], q)
+        self.assertIs(vista[-1], j)
+        self.assertEqual(list(vista), [q, j])
+        with self.assertRaises(IndexError):
+            vista[2]
+
+        # A vista acompanha a pilha
+        p.pop()
+        self.assertEqual(len(vista), 1)
+
+        vazia = Pilha()
+        self.assertFalse(vazia.pode_adicionar_subpilha(p.vista(1)))
+        self.assertTrue(vazia.pode_adicionar_subpilha(p.vista(0)))
+
+    def test_mover_para(self):
+        origem, destino = Pilha(), Pilha()
+        cartas = [Carta(v, Naipe.PAUS) for v in (5, 4, 3)]
+        for c in cartas:
+            origem.push(c)
+        lista_origem = origem.cartas
+        origem.mover_para(1, destino)
+        self.assertEqual(origem.cartas, cartas[:1])
+        self.assertEqual(destino.cartas, cartas[1:])
+        self.assertIs(origem.cartas, lista_origem)  # Mesma lista, alterada no lugar
+
+    def test_indice_de_sequencias(self):
+        p = Pilha()
+        for valor, naipe in ((9, Naipe.COPAS), (13, Naipe.ESPADAS), (12, Naipe.COPAS),
+                             (11, Naipe.PAUS), (5, Naipe.OUROS)):
+            p.push(Carta(valor, naipe))
+        self.assertEqual([p.sequencia(i) for i in range(5)], [1, 3, 2, 1, 1])
+
+        p.pop()   # sem o 5, o K♠ Q♥ J♣ chega ao topo
+        p.push(Carta(10, Naipe.OUROS))
+        self.assertEqual([p.sequencia(i) for i in range(5)], [1, 4, 3, 2, 1])
+
+        p.remover_subpilha(3)
+        self.assertEqual([p.sequencia(i) for i in range(3)], [1, 2, 1])
+
+    def test_indice_de_sequencias_igual_ao_recalculado(self):
+        # Movimentos aleatórios entre 3 pilhas: o índice incremental deve
+        # ser sempre igual ao recalculado do zero
+        rng = random.Random(12)
+        pilhas = [Pilha() for _ in range(3)]
+        baralho = [Carta.da_id(i) for i in range(52)]
+        rng.shuffle(baralho)
+        for carta in baralho:
+            pilhas[rng.randrange(3)].push(carta)
+
+        for _ in range(500):
+            origem, destino = rng.sample(pilhas, 2)
+            if origem.is_vazia():
+                continue
+            inicio = rng.randrange(origem.tamanho())
+            operacao = rng.randrange(3)
+            if operacao == 0:
+                origem.mover_para(inicio, destino)
+            elif operacao == 1:
+                destino.adicionar_subpilha(origem.remover_subpilha(inicio))
+            else:
+                destino.push(origem.pop())
+            for pilha in pilhas:
+                incremental = [pilha.sequencia(i) for i in range(pilha.tamanho())]
+                pilha.recalcular_sequencias()
+                self.assertEqual(incremental, pilha._sequencia)
+
+    def test_fronteira_de_ocultas(self):
+        p = Pilha()
+        cartas = [Carta(v, Naipe.PAUS) for v in (9, 8, 7, 6)]
+        p.definir_cartas(cartas, 2)
+        self.assertEqual(p.ocultas, 2)
+        self.assertEqual([p.visivel(i) for i in range(4)], [False, False, True, True])
+        self.assertEqual([c.face_up for c in cartas], [False, False, True, True])
+        self.assertEqual(str(p), "XX | XX | 7 de paus | 6 de paus")
+
+        destino = Pilha()
+        p.mover_para(2, destino)
+        self.assertTrue(p.virar_topo_se_necessario())
+        self.assertEqual(p.ocultas, 1)
+        self.assertTrue(cartas[1].face_up)
+        self.assertFalse(p.virar_topo_se_necessario())
+
+        p.esconder_topo()   # como ao desfazer
+        self.assertEqual(p.ocultas, 2)
+        self.assertFalse(cartas[1].face_up)
+        self.assertEqual(destino.ocultas, 0)
+
+    def test_indice_de_sequencias_apos_mexer_na_lista(self):
+        p = Pilha()
+        p.push(Carta(13, Naipe.PAUS))
+        p.cartas.append(Carta(12, Naipe.OUROS))  # por fora dos métodos da pilha
+        self.assertEqual(p.sequencia(0), 2)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
@@ -0,0 +1,80 @@
+# tests/test_produtor_jogos.py
+# Testes unitários para o produtor de jogos vencíveis e o censo
+# Verifica: só entram na fila jogos provados vencíveis, fila limitada, contagem do censo,
+# e que um erro no processo verificador não derruba o produtor
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+import time
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.game.produtor_jogos import ProdutorJogos, censo, verificar_jogo
+from src.game.solver import VITORIA
+
+MAX_NOS = 2000  # Orçamento pequeno: o teste só precisa de alguns jogos fáceis
+
+
+class TestProdutorJogos(unittest.TestCase):
+
+    def test_fila_so_tem_jogos_venciveis(self):
+        produtor = ProdutorJogos(capacidade=2, max_nos=MAX_NOS, processos=1, semente=7)
+        try:
+            numeros = [produtor.proximo(espera=60) for _ in range(3)]
+            self.assertNotIn(None, numeros)
+            for numero in numeros:
+                self.assertEqual(verificar_jogo(numero, MAX_NOS)[1], VITORIA)
+            prazo = time.perf_counter() + 60
+            while produtor.prontos() < 2 and time.perf_counter() < prazo:
+                time.sleep(0.05)
+            time.sleep(0.5)
+            self.assertEqual(produtor.prontos(), 2)   # Cheia: não passa da capacidade
+            self.assertGreaterEqual(produtor.verificados, produtor.vencidos)
+            self.assertGreaterEqual(produtor.vencidos, 5)
+        finally:
+            produtor.encerrar()
+
+    def test_proximo_sem_espera_nao_bloqueia(self):
+        produtor = ProdutorJogos(max_nos=MAX_NOS, processos=1, semente=1)
+        try:
+            comeco = time.perf_counter()
+            produtor.proximo()
+            self.assertLess(time.perf_counter() - comeco, 0.1)
+        finally:
+            produtor.encerrar()
+
+    def test_erro_na_verificacao_nao_para_o_produtor(self):
+        # Números ímpares fazem o verificador lançar; os pares são vencíveis
+        def verificar(numero, max_nos, tempo_limite):
+            if numero % 2:
+                raise RuntimeError(f"falha no jogo {numero}")
+            return numero, VITORIA, 1
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        with mock.patch("src.game.produtor_jogos.verificar_jogo", verificar):
+            produtor = ProdutorJogos(capacidade=4, processos=1, semente=3, executor=executor)
+            try:
+                numeros = [produtor.proximo(espera=10) for _ in range(6)]
+            finally:
+                produtor.encerrar()
+                executor.shutdown()
+        self.assertNotIn(None, numeros)
+        self.assertTrue(all(numero % 2 == 0 for numero in numeros))
+        self.assertGreater(produtor.falhas, 0)
+        self.assertIsInstance(produtor.ultimo_erro, RuntimeError)
+
+    def test_censo(self):
+        r = censo(6, primeiro_jogo=0, max_nos=MAX_NOS, processos=1, tamanho_lote=4)
+        self.assertEqual(r.jogos, 6)
+        self.assertEqual(r.vitorias + r.derrotas + r.desconhecidos, 6)
+        esperadas = sum(verificar_jogo(n, MAX_NOS)[1] == VITORIA for n in range(6))
+        self.assertEqual(r.vitorias, esperadas)
+        self.assertLessEqual(r.fracao_minima, r.fracao_maxima)
+        self.assertEqual(censo(6, max_nos=MAX_NOS, processos=2, tamanho_lote=2).vitorias, esperadas)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,63 @@
+# tests/test_regioes_sujas.py
+# Testes unitários para o controle de regiões sujas da interface
+# Verifica: primeiro frame inteiro, frame parado vazio, retângulo antigo e
+# novo ao mover, junção dos que se sobrepõem, recorte à tela
+
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+TELA = (0, 0, 800, 600)
+
+
+@unittest.skipIf(pygame is None, "pygame não instalado")
+class TestRegioesSujas(unittest.TestCase):
+
+    def setUp(self):
+        from src.gui.regioes_sujas import RegioesSujas
+        self.regioes = RegioesSujas()
+        self.tela = pygame.Rect(TELA)
+
+    def quadro(self, **regioes):
+        # Um frame: marca cada região (assinatura, rect) e devolve os retângulos sujos
+        for chave, (assinatura, rect) in regioes.items():
+            self.regioes.marcar(chave, assinatura, rect)
+        return self.regioes.retangulos(self.tela)
+
+    def test_primeiro_quadro_e_quadro_parado(self):
+        regioes = {"coluna": ("AC", (10, 10, 50, 50)), "cronometro": ("00:00", (700, 550, 90, 40))}
+        self.assertEqual(self.quadro(**regioes), [self.tela])
+        self.assertEqual(self.quadro(**regioes), [])
+        self.regioes.invalidar()
+        self.assertEqual(self.quadro(**regioes), [self.tela])
+
+    def test_so_a_regiao_que_mudou(self):
+        self.quadro(coluna=("AC", (10, 10, 50, 50)), cronometro=("00:00", (700, 550, 90, 40)))
+        sujos = self.quadro(coluna=("AC", (10, 10, 50, 50)), cronometro=("00:01", (700, 550, 90, 40)))
+        self.assertEqual(sujos, [pygame.Rect(700, 550, 90, 40)])
+
+    def test_mover_suja_o_lugar_antigo_e_o_novo(self):
+        self.quadro(arrasto=(None, None))
+        self.assertEqual(self.quadro(arrasto=(None, (100, 100, 20, 20))), [pygame.Rect(100, 100, 20, 20)])
+        # Longe: dois retângulos; perto (sobrepostos): um só, a união
+        self.assertEqual(self.quadro(arrasto=(None, (300, 300, 20, 20))),
+                         [pygame.Rect(100, 100, 20, 20), pygame.Rect(300, 300, 20, 20)])
+        self.assertEqual(self.quadro(arrasto=(None, (310, 305, 20, 20))), [pygame.Rect(300, 300, 30, 25)])
+        # Soltou: apaga onde estava
+        self.assertEqual(self.quadro(arrasto=(None, None)), [pygame.Rect(310, 305, 20, 20)])
+
+    def test_recorta_a_tela(self):
+        self.quadro(arrasto=(None, None))
+        self.assertEqual(self.quadro(arrasto=(None, (790, 590, 50, 50))), [pygame.Rect(790, 590, 10, 10)])
+        self.assertEqual(self.quadro(arrasto=(None, (900, 900, 50, 50))), [pygame.Rect(790, 590, 10, 10)])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
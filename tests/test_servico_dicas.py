@@ -0,0 +1,105 @@
+# tests/test_servico_dicas.py
+# Testes unitários para o serviço de dicas em segundo plano
+# Verifica: ordenação das jogadas, cancelamento, entrega do resultado pela thread
+# e que um erro no cálculo não derruba a thread
+
+import unittest
+from unittest import mock
+import threading
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+from src.game.estado_compacto import EstadoCompacto
+from src.game.jogo_yukon import JogoYukon
+from src.game.movimento import MOV_PARA_FUNDACAO
+from src.models.baralho import ordem_do_jogo
+
+
+@unittest.skipIf(pygame is None, "pygame não instalado")
+class TestServicoDicas(unittest.TestCase):
+
+    def setUp(self):
+        from src.gui import servico_dicas
+        self.sd = servico_dicas
+
+    def test_dicas_ordenadas_pela_nota(self):
+        estado = EstadoCompacto.distribuir(ordem_do_jogo(5))
+        dicas = self.sd.calcular_dicas(estado, tempo_limite=5.0, profundidade_maxima=2)
+        self.assertEqual(sorted(m for m, _ in dicas), sorted(estado.movimentos()))
+        notas = [nota for _, nota in dicas]
+        self.assertEqual(notas, sorted(notas, reverse=True))
+
+    def test_fundacao_vem_primeiro_com_um_lance(self):
+        # No jogo 1 há um Ás livre logo na distribuição: com 1 lance ele é a melhor jogada
+        jogo = JogoYukon(1)
+        self.assertTrue(any(m.tipo == MOV_PARA_FUNDACAO for m in jogo.movimentos_legais()))
+        estado = EstadoCompacto.de_jogo(jogo)
+        dicas = self.sd.calcular_dicas(estado, profundidade_maxima=1)
+        self.assertEqual(dicas[0][0].tipo, MOV_PARA_FUNDACAO)
+
+    def test_cancelado_interrompe(self):
+        estado = EstadoCompacto.distribuir(ordem_do_jogo(5))
+        with self.assertRaises(self.sd.DicasCanceladas):
+            self.sd.calcular_dicas(estado, tempo_limite=5.0, cancelado=lambda: True)
+
+    def test_servico_publica_so_o_pedido_atual(self):
+        recebidos = []
+        pronto = threading.Event()
+
+        def publicar(geracao, hash_posicao, dicas):
+            recebidos.append((geracao, hash_posicao, dicas))
+            pronto.set()
+
+        servico = self.sd.ServicoDicas(publicar, tempo_limite=0.2, profundidade_maxima=2)
+        self.addCleanup(servico.encerrar)
+        jogo = JogoYukon(5)
+        servico.pedir(jogo)
+        servico.cancelar()                 # o primeiro pedido nunca é publicado
+        geracao = servico.pedir(jogo)
+        self.assertTrue(pronto.wait(5.0))
+        self.assertEqual(len(recebidos), 1)
+        self.assertEqual(recebidos[0][0], geracao)
+        self.assertEqual(recebidos[0][1], jogo.hash_zobrist)
+        self.assertTrue(servico.atual(geracao))
+
+    def test_erro_no_calculo_publica_vazio_e_segue(self):
+        recebidos = []
+        pronto = threading.Semaphore(0)
+
+        def publicar(geracao, hash_posicao, dicas):
+            recebidos.append((geracao, dicas))
+            pronto.release()
+
+        calcular = self.sd.calcular_dicas
+        chamadas = []
+
+        def falhar_na_primeira(*args, **kwargs):
+            chamadas.append(1)
+            if len(chamadas) == 1:
+                raise RuntimeError("defeito na avaliação")
+            return calcular(*args, **kwargs)
+
+        servico = self.sd.ServicoDicas(publicar, tempo_limite=0.2, profundidade_maxima=1)
+        self.addCleanup(servico.encerrar)
+        jogo = JogoYukon(1)
+        with mock.patch.object(self.sd, "calcular_dicas", falhar_na_primeira):
+            primeira = servico.pedir(jogo)
+            self.assertTrue(pronto.acquire(timeout=5.0))
+            segunda = servico.pedir(jogo)
+            self.assertTrue(pronto.acquire(timeout=5.0))
+        self.assertEqual(recebidos[0], (primeira, []))
+        self.assertEqual(recebidos[1][0], segunda)
+        self.assertTrue(recebidos[1][1])
+        self.assertEqual(servico.falhas, 1)
+        self.assertIsInstance(servico.ultimo_erro, RuntimeError)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,53 @@
+# tests/test_simulador.py
+# Testes unitários para o simulador de partidas
+# Verifica: resultados reproduzíveis e independentes da quantidade de processos
+
+import unittest
+import random
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.game.avaliacao import avaliar
+from src.game.estado_compacto import EstadoCompacto
+from src.game.movimento import MOV_PARA_FUNDACAO
+from src.models.baralho import ordem_do_jogo
+from src.sim.simulador import jogar_partida, simular
+from src.sim.politicas import POLITICAS, politica_dica
+
+
+class TestSimulador(unittest.TestCase):
+
+    def test_partida_reproduzivel(self):
+        for politica in POLITICAS:
+            self.assertEqual(jogar_partida(5, politica, semente=1),
+                             jogar_partida(5, politica, semente=1))
+
+    def test_resultado_nao_depende_dos_processos(self):
+        um = simular(12, "gulosa", processos=1, tamanho_lote=5)
+        dois = simular(12, "gulosa", processos=2, tamanho_lote=5)
+        self.assertEqual(um.jogos, 12)
+        self.assertEqual((um.vitorias, um.movimentos), (dois.vitorias, dois.movimentos))
+
+    def test_politica_dica_ordena_pela_avaliacao(self):
+        # No jogo 1 há um Ás livre logo na distribuição: a dica o manda para a fundação primeiro
+        estado = EstadoCompacto.distribuir(ordem_do_jogo(1))
+        movimentos = estado.movimentos()
+        ordem = politica_dica(estado, movimentos, random.Random(0))
+        self.assertEqual(sorted(ordem), sorted(movimentos))
+        self.assertEqual(ordem[0][0], MOV_PARA_FUNDACAO)
+        notas = []
+        for mov in ordem:
+            filho = estado.clone()
+            filho.aplicar(mov)
+            notas.append(avaliar(filho))
+        self.assertEqual(notas, sorted(notas, reverse=True))
+
+    def test_politica_desconhecida(self):
+        with self.assertRaises(ValueError):
+            simular(1, "inexistente", processos=1)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
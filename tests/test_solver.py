@@ -0,0 +1,91 @@
+# tests/test_solver.py
+# Testes unitários para o Solver
+# Verifica: vitória reproduzível, derrota provada, veredito igual com profundidade
+# inicial pequena, orçamento e chave canônica
+
+import unittest
+import random
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.game.estado_compacto import EstadoCompacto, OFF_TAMANHO, OFF_OCULTAS, OFF_FUNDACAO, OFF_COLUNAS
+from src.game.solver import Solver, chave_canonica, e_segura, VITORIA, DERROTA, DESCONHECIDO
+from src.models.carta import id_carta, Naipe
+
+
+def distribuicao(numero):
+    ordem = list(range(52))
+    random.Random(numero).shuffle(ordem)
+    return EstadoCompacto.distribuir(ordem)
+
+
+class TestSolver(unittest.TestCase):
+
+    def test_vitoria_com_linha_valida(self):
+        estado = distribuicao(0)
+        resultado = Solver().resolver(estado)
+        self.assertEqual(resultado.status, VITORIA)
+        for mov in resultado.movimentos:
+            self.assertTrue(estado.aplicar(mov), mov)
+        self.assertTrue(estado.verificar_vitoria())
+
+    def test_derrota_provada(self):
+        # Ás de copas preso sob o 2 de copas; as outras colunas só têm copas,
+        # nenhuma coluna está vazia e os outros naipes estão completos
+        estado = EstadoCompacto()
+        dados = estado.dados
+        colunas = [[1, 2], [3], [4], [5], [6], [7], [8, 9, 10, 11, 12, 13]]
+        for col, valores in enumerate(colunas):
+            for i, valor in enumerate(valores):
+                dados[OFF_COLUNAS + col * 52 + i] = id_carta(valor, Naipe.COPAS)
+            dados[OFF_TAMANHO + col] = len(valores)
+        dados[OFF_OCULTAS] = 1
+        for f, naipe in enumerate((Naipe.OUROS, Naipe.PAUS, Naipe.ESPADAS)):
+            dados[OFF_FUNDACAO + f] = id_carta(13, naipe)
+        self.assertEqual(Solver().resolver(estado).status, DERROTA)
+
+    def test_profundidade_inicial_pequena_da_o_mesmo_veredito(self):
+        # Com poucos lances por passada, a tabela de transposição se enche de
+        # posições exploradas só até um limite; nenhuma pode virar derrota
+        vitoria = EstadoCompacto.de_notacao("KEQC/KCQEJC/KPQOJE/KO/-/JP/9EQP|JOTE TC/8E/TO/TP")
+        derrota = EstadoCompacto.de_notacao("QO/KO/QP/QC/JE/JO9EKPJCJPQE|TE/KE|KC TC/8E/TO/TP")
+        for estado in (vitoria, derrota):
+            padrao = Solver(max_nos=2_000_000, tempo_limite=60).resolver(estado).status
+            pequena = Solver(max_nos=2_000_000, tempo_limite=60, profundidade_inicial=2).resolver(estado)
+            self.assertNotEqual(padrao, DESCONHECIDO)
+            self.assertEqual(pequena.status, padrao)
+
+    def test_posicao_explorada_ate_um_limite_conta_como_corte(self):
+        estado = distribuicao(0)
+        solver = Solver()
+        solver._tabela[hash(chave_canonica(estado))] = 5  # Explorada até 5 lances
+        self.assertFalse(solver._buscar(estado, 3))
+        self.assertEqual(solver._cortes, 1)  # O pai não pode ser dado como perdido
+
+    def test_orcamento_esgotado(self):
+        resultado = Solver(max_nos=3).resolver(distribuicao(0))
+        self.assertEqual(resultado.status, DESCONHECIDO)
+        self.assertEqual(resultado.movimentos, [])
+
+    def test_chave_canonica_ignora_ordem_das_colunas(self):
+        estado = distribuicao(1)
+        trocado = estado.clone()
+        dados = trocado.dados
+        for off in (OFF_TAMANHO, OFF_OCULTAS):
+            dados[off + 2], dados[off + 5] = dados[off + 5], dados[off + 2]
+        c2, c5 = OFF_COLUNAS + 2 * 52, OFF_COLUNAS + 5 * 52
+        dados[c2:c2 + 52], dados[c5:c5 + 52] = estado.dados[c5:c5 + 52], estado.dados[c2:c2 + 52]
+        self.assertNotEqual(trocado.chave(), estado.chave())
+        self.assertEqual(chave_canonica(trocado), chave_canonica(estado))
+
+    def test_e_segura(self):
+        tres_copas = id_carta(3, Naipe.COPAS)
+        self.assertTrue(e_segura(id_carta(2, Naipe.PAUS), [0, 0, 1, 0]))
+        self.assertFalse(e_segura(tres_copas, [2, 0, 2, 1]))
+        self.assertTrue(e_segura(tres_copas, [2, 1, 2, 2]))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
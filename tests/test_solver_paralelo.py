@@ -0,0 +1,110 @@
+# tests/test_solver_paralelo.py
+# Testes unitários para o solver em paralelo (portfólio)
+# Verifica: tabela compartilhada entre processos, cancelamento, variantes do Solver,
+# opções do Solver repassadas aos processos, no máximo um processo por núcleo
+
+import unittest
+from unittest import mock
+import sys
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.game.estado_compacto import EstadoCompacto
+from src.game.jogo_yukon import JogoYukon
+from src.game.solver import (
+    Solver, chave_canonica, chave_estavel, resolver_jogo, ORDEM_RASAS, VITORIA, DESCONHECIDO,
+)
+from src.game.solver_paralelo import PORTFOLIO, TabelaCompartilhada, configuracao, resolver_paralelo
+from src.models.baralho import ordem_do_jogo
+
+
+def _ver_chaves(nome, posicoes, chaves):
+    # Executada em outro processo: abre a tabela pelo nome e marca o sinal de parada
+    with TabelaCompartilhada(posicoes, nome=nome) as tabela:
+        tabela.parar()
+        return [tabela.contem(chave) for chave in chaves]
+
+
+class TestSolverParalelo(unittest.TestCase):
+
+    def test_tabela_compartilhada_entre_processos(self):
+        with TabelaCompartilhada(1024) as tabela:
+            chaves = [chave_estavel(bytes([i])) for i in range(50)]
+            for chave in chaves[:25]:
+                tabela.adicionar(chave)
+            self.assertFalse(tabela.parado())
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                vistas = executor.submit(_ver_chaves, tabela.nome, 1024, chaves).result()
+            self.assertEqual(vistas, [True] * 25 + [False] * 25)
+            self.assertTrue(tabela.parado())
+        with self.assertRaises(ValueError):
+            TabelaCompartilhada(1000)
+
+    def test_chave_estavel(self):
+        estado = EstadoCompacto.distribuir(ordem_do_jogo(4))
+        chave = chave_estavel(chave_canonica(estado))
+        self.assertEqual(chave, chave_estavel(chave_canonica(estado.clone())))
+        self.assertTrue(0 < chave < 1 << 64)
+
+    def test_variantes_do_solver(self):
+        estado = EstadoCompacto.distribuir(ordem_do_jogo(0))
+        self.assertEqual(Solver(**configuracao(0)).resolver(estado).status, VITORIA)
+        for indice in range(len(PORTFOLIO) + 2):
+            # Cada variante acha outra linha (ou nenhuma, dentro do orçamento)
+            resultado = Solver(max_nos=20_000, **configuracao(indice)).resolver(estado)
+            if resultado.status != VITORIA:
+                continue
+            filho = estado.clone()
+            for mov in resultado.movimentos:
+                self.assertTrue(filho.aplicar(mov))
+            self.assertTrue(filho.verificar_vitoria())
+        um = Solver(ordem=ORDEM_RASAS, semente=5).resolver(estado)
+        dois = Solver(ordem=ORDEM_RASAS, semente=5).resolver(estado)
+        self.assertEqual(um.movimentos, dois.movimentos)
+        with self.assertRaises(ValueError):
+            Solver(ordem="QUALQUER")
+
+    def test_cancelado_para_a_busca(self):
+        resultado = Solver(cancelado=lambda: True).resolver(EstadoCompacto.distribuir(ordem_do_jogo(9)))
+        self.assertEqual(resultado.status, DESCONHECIDO)
+        self.assertLessEqual(resultado.nos, 1024)
+
+    def test_resolver_paralelo(self):
+        jogo = JogoYukon(0)
+        resultado = resolver_paralelo(jogo, processos=2, posicoes_tabela=1 << 12)
+        self.assertEqual(resultado.status, VITORIA)
+        estado = EstadoCompacto.de_jogo(jogo)
+        for mov in resultado.movimentos:
+            self.assertTrue(estado.aplicar(mov))
+        self.assertTrue(estado.verificar_vitoria())
+        self.assertEqual(resolver_jogo(JogoYukon(1), processos=2).status, VITORIA)
+
+    def test_opcoes_do_solver_chegam_aos_processos(self):
+        resultado = resolver_jogo(JogoYukon(0), processos=2, tamanho_tabela=1000, semente=7,
+                                  posicoes_tabela=1 << 12)
+        self.assertEqual(resultado.status, VITORIA)
+        with self.assertRaises(ValueError):  # Levantado pelo Solver dentro do processo
+            resolver_paralelo(JogoYukon(2), processos=2, ordem="QUALQUER", posicoes_tabela=1 << 12)
+
+    def test_resolver_jogo_nao_passa_dos_nucleos(self):
+        # Com um núcleo só, pedir 4 processos roda o solver padrão, sem pool
+        from src.game import solver, solver_paralelo
+        solver._VEREDITOS.limpar()
+        with mock.patch("os.cpu_count", return_value=1), \
+                mock.patch.object(solver_paralelo, "ProcessPoolExecutor",
+                                  side_effect=AssertionError("não devia criar processos")):
+            resultado = resolver_jogo(JogoYukon(16), processos=4, posicoes_tabela=1 << 12)
+        self.assertEqual(resultado.status, VITORIA)
+
+    def test_cancelado_para_os_processos(self):
+        estado = EstadoCompacto.distribuir(ordem_do_jogo(9))
+        resultado = resolver_paralelo(estado, processos=2, tempo_limite=30, posicoes_tabela=1 << 12,
+                                      cancelado=lambda: True)
+        self.assertEqual(resultado.status, DESCONHECIDO)
+        self.assertLess(resultado.segundos, 10)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
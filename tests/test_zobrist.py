@@ -0,0 +1,72 @@
+# tests/test_zobrist.py
+# Testes unitários para o hash Zobrist do JogoYukon e o CacheLRU
+# Verifica: hash incremental igual ao completo, volta ao mesmo hash ao desfazer
+
+import unittest
+import random
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.game.jogo_yukon import JogoYukon
+from src.game.zobrist import hash_jogo
+from src.game.cache_lru import CacheLRU
+
+
+class TestZobrist(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(11)
+        self.jogo = JogoYukon()
+
+    def test_hash_incremental_igual_ao_completo(self):
+        rng = random.Random(2)
+        hashes = [self.jogo.hash_zobrist]
+        for _ in range(120):
+            movimentos = self.jogo.movimentos_legais()
+            if not movimentos:
+                break
+            self.assertTrue(self.jogo.aplicar(rng.choice(movimentos)))
+            self.assertEqual(self.jogo.hash_zobrist, hash_jogo(self.jogo))
+            hashes.append(self.jogo.hash_zobrist)
+
+        # Desfazendo, o hash passa de volta pelos mesmos valores
+        while self.jogo.desfazer():
+            hashes.pop()
+            self.assertEqual(self.jogo.hash_zobrist, hashes[-1])
+            self.assertEqual(self.jogo.hash_zobrist, hash_jogo(self.jogo))
+
+    def test_carta_virada_muda_o_hash(self):
+        pilha = self.jogo.tableau[3]
+        antes = hash_jogo(self.jogo)
+        pilha.ocultas -= 1   # a visibilidade é a fronteira da pilha, não a carta
+        self.assertNotEqual(hash_jogo(self.jogo), antes)
+
+    def test_movimentos_legais_do_cache_sao_copias(self):
+        primeira = self.jogo.movimentos_legais()
+        primeira.clear()
+        self.assertNotEqual(self.jogo.movimentos_legais(), [])
+
+
+class TestCacheLRU(unittest.TestCase):
+
+    def test_descarta_o_menos_usado(self):
+        cache = CacheLRU(2)
+        cache.guardar("a", 1)
+        cache.guardar("b", 2)
+        self.assertEqual(cache.obter("a"), 1)   # "a" passa a ser o mais recente
+        cache.guardar("c", 3)
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.obter("b"))
+        self.assertEqual((cache.acertos, cache.falhas), (1, 1))
+
+    def test_capacidade_invalida(self):
+        with self.assertRaises(ValueError):
+            CacheLRU(0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)